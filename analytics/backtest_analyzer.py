@@ -11,6 +11,12 @@ class BacktestAnalyzer:
         self.logger = logger
 
     def summarize(self, trades_df):
+        if trades_df is None or trades_df.empty:
+            summary = {"total_pnl": 0.0, "sharpe": float("nan"), "sortino": float("nan"), "max_drawdown": 0.0,
+                       "expectancy": 0.0, "win_rate": 0.0, "trade_count": 0}
+            if self.logger:
+                self.logger.info(f"Backtest summary: {summary}")
+            return summary
         total_pnl = trades_df['pnl'].sum()
         returns = trades_df['returns'].values
         dd = PerformanceMetrics.max_drawdown(trades_df['pnl'].cumsum())
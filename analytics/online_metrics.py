@@ -0,0 +1,123 @@
+"""
+online_metrics.py
+Streaming (O(1) per update) versions of the PerformanceMetrics statistics for live dashboards.
+Uses Welford mean/variance, a running downside deviation, a running equity peak/drawdown and
+win/loss tallies, so stats stay current without re-scanning the trade history.
+"""
+
+import math
+
+class _Welford:
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        # Population std, matching np.std in PerformanceMetrics
+        return math.sqrt(self.m2 / self.n) if self.n else float("nan")
+
+class OnlinePerformanceMetrics:
+    def __init__(self, risk_free_rate: float = 0.0, periods_per_year: int = 252):
+        self.risk_free_rate = risk_free_rate
+        self.annualization = math.sqrt(periods_per_year)
+        self._returns = _Welford()
+        self._downside = _Welford()
+        self.equity_peak = None
+        self.last_equity = None
+        self.max_dd = 0.0
+        self.trade_count = 0
+        self.total_pnl = 0.0
+        self.wins = 0
+        self.losses = 0
+        self.win_sum = 0.0
+        self.loss_sum = 0.0
+
+    def update_return(self, r: float) -> None:
+        excess = r - self.risk_free_rate
+        self._returns.add(excess)
+        if excess < 0:
+            self._downside.add(excess)
+
+    def update_equity(self, equity: float) -> None:
+        self.last_equity = equity
+        if self.equity_peak is None or equity > self.equity_peak:
+            self.equity_peak = equity
+        elif self.equity_peak > 0:
+            dd = (self.equity_peak - equity) / self.equity_peak
+            if dd > self.max_dd:
+                self.max_dd = dd
+
+    def update_trade(self, pnl: float, ret: float = None, equity: float = None) -> None:
+        self.trade_count += 1
+        self.total_pnl += pnl
+        if pnl > 0:
+            self.wins += 1
+            self.win_sum += pnl
+        elif pnl < 0:
+            self.losses += 1
+            self.loss_sum += pnl
+        if ret is not None:
+            self.update_return(ret)
+        if equity is not None:
+            self.update_equity(equity)
+
+    @property
+    def sharpe(self) -> float:
+        std = self._returns.std
+        if self._returns.n < 2 or std == 0:
+            return float("nan")
+        return self._returns.mean / std * self.annualization
+
+    @property
+    def sortino(self) -> float:
+        std = self._downside.std
+        if self._downside.n == 0 or std == 0:
+            return float("nan")
+        return self._returns.mean / std * self.annualization
+
+    @property
+    def max_drawdown(self) -> float:
+        return self.max_dd
+
+    @property
+    def current_drawdown(self) -> float:
+        if not self.equity_peak or self.last_equity is None:
+            return 0.0
+        return (self.equity_peak - self.last_equity) / self.equity_peak
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trade_count if self.trade_count else 0.0
+
+    @property
+    def expectancy(self) -> float:
+        if not self.trade_count:
+            return 0.0
+        win_rate = self.win_rate
+        avg_win = self.win_sum / self.wins if self.wins else 0.0
+        avg_loss = abs(self.loss_sum / self.losses) if self.losses else 0.0
+        return (avg_win * win_rate) - (avg_loss * (1 - win_rate))
+
+    def summary(self) -> dict:
+        """
+        Same keys as BacktestAnalyzer.summarize.
+        """
+        return {
+            "total_pnl": round(self.total_pnl, 4),
+            "sharpe": round(self.sharpe, 4),
+            "sortino": round(self.sortino, 4),
+            "max_drawdown": round(self.max_drawdown, 4),
+            "expectancy": round(self.expectancy, 4),
+            "win_rate": round(self.win_rate, 4),
+            "trade_count": self.trade_count
+        }
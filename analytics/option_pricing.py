@@ -0,0 +1,228 @@
+"""
+option_pricing.py
+Vectorized Black-Scholes pricing for synthesizing option premiums in backtests.
+Without historical option data, every open CE/PE leg is repriced from the underlying close, its
+strike, the time left to its weekly expiry and a realized-volatility proxy, in one NumPy pass per bar.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from edgeX.utils.instruments import parse_instrument
+
+MINUTES_PER_SESSION = 375       # NSE 09:15-15:30
+TRADING_DAYS = 252
+YEAR_NS = 365.0 * 24 * 3600 * 1e9
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Standard normal CDF via the Abramowitz-Stegun 7.1.26 erf approximation (|error| < 1.5e-7).
+    """
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+def black_scholes(spot, strike, t_years, vol, rate: float = 0.0, is_call=True) -> np.ndarray:
+    """
+    European option premiums; every argument broadcasts. Expired legs (t <= 0) return intrinsic value.
+    """
+    spot = np.asarray(spot, dtype=np.float64)
+    strike = np.asarray(strike, dtype=np.float64)
+    t = np.maximum(np.asarray(t_years, dtype=np.float64), 0.0)
+    vol = np.asarray(vol, dtype=np.float64)
+    is_call = np.asarray(is_call, dtype=bool)
+    sig_t = vol * np.sqrt(t)
+    live = sig_t > 0
+    safe = np.where(live, sig_t, 1.0)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * vol * vol) * t) / safe
+    d2 = d1 - sig_t
+    disc = strike * np.exp(-rate * t)
+    call = spot * norm_cdf(d1) - disc * norm_cdf(d2)
+    put = disc * norm_cdf(-d2) - spot * norm_cdf(-d1)
+    priced = np.where(is_call, call, put)
+    intrinsic = np.where(is_call, np.maximum(spot - strike, 0.0), np.maximum(strike - spot, 0.0))
+    return np.maximum(np.where(live, priced, intrinsic), 0.0)
+
+class OptionPremiumModel:
+    """
+    Per-backtest pricing context: prepare(data) precomputes the spot, volatility proxy and
+    timestamps once; price(bar, ...) then reprices any set of legs at that bar. Replays that build
+    bars as they go use start() and append() instead of prepare().
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.065,
+        vol_window: int = 20,
+        default_vol: float = 0.15,
+        vol_floor: float = 0.05,
+        expiry_weekday: int = 3,
+        expiry_time: str = "15:30",
+        hold_bars: int = 1,
+        logger=None
+    ):
+        self.rate = rate
+        self.vol_window = vol_window
+        self.default_vol = default_vol
+        self.vol_floor = vol_floor
+        self.expiry_weekday = expiry_weekday
+        self.expiry_time = expiry_time
+        self.hold_bars = hold_bars
+        self.logger = logger
+        self.spot = None
+        self.vol = None
+        self.ts_ns = None
+        self._tz = None
+        self.n_bars = 0
+        self._annualize = None
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "rate": self.rate, "vol_window": self.vol_window, "default_vol": self.default_vol,
+            "vol_floor": self.vol_floor, "expiry_weekday": self.expiry_weekday,
+            "expiry_time": self.expiry_time, "hold_bars": self.hold_bars,
+        }
+
+    @staticmethod
+    def bars_per_year(index: pd.DatetimeIndex) -> float:
+        if len(index) < 2:
+            return float(TRADING_DAYS)
+        return OptionPremiumModel.bars_per_year_for(float(np.median(np.diff(index.as_unit("ns").asi8))) / 60e9)
+
+    @staticmethod
+    def bars_per_year_for(step_min: float) -> float:
+        if step_min >= MINUTES_PER_SESSION:
+            return float(TRADING_DAYS)
+        return TRADING_DAYS * MINUTES_PER_SESSION / step_min
+
+    def prepare(self, data: pd.DataFrame) -> None:
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("option repricing needs a DatetimeIndex to derive time to expiry")
+        close = data["close"].to_numpy(dtype=np.float64)
+        log_ret = np.diff(np.log(close), prepend=np.nan)
+        realized = pd.Series(log_ret).rolling(self.vol_window).std(ddof=0).to_numpy()
+        vol = realized * np.sqrt(self.bars_per_year(data.index))
+        # No look-ahead: bar i uses returns up to and including bar i
+        self.vol = np.maximum(np.where(np.isfinite(vol), vol, self.default_vol), self.vol_floor)
+        self.spot = close
+        index = data.index
+        self._tz = index.tz
+        self.ts_ns = index.as_unit("ns").asi8
+        self.n_bars = len(close)
+
+    def start(self, bar_minutes: float, tz=None, capacity: int = 1024) -> None:
+        """
+        Begin an empty series of `bar_minutes` bars that append() extends one closed bar at a time.
+        """
+        self._annualize = np.sqrt(self.bars_per_year_for(bar_minutes))
+        self._tz = tz
+        self.spot = np.empty(capacity)
+        self.vol = np.empty(capacity)
+        self.ts_ns = np.empty(capacity, dtype=np.int64)
+        self.n_bars = 0
+
+    def append(self, ts_ns: int, close: float) -> int:
+        """
+        Add a closed bar and return its index. Its volatility uses the same trailing window of log
+        returns as prepare(), so both paths price a bar identically.
+        """
+        n = self.n_bars
+        if n == self.spot.size:
+            # Amortized O(1): double the buffers when full
+            self.spot, self.vol, self.ts_ns = (np.resize(a, 2 * a.size) for a in (self.spot, self.vol, self.ts_ns))
+        self.spot[n] = close
+        self.ts_ns[n] = ts_ns
+        vol = self.default_vol
+        if n >= self.vol_window:
+            vol = float(np.std(np.diff(np.log(self.spot[n - self.vol_window:n + 1])))) * self._annualize
+            vol = vol if np.isfinite(vol) else self.default_vol
+        self.vol[n] = max(vol, self.vol_floor)
+        self.n_bars = n + 1
+        return n
+
+    def expiry_for(self, bar: int) -> int:
+        """
+        Next weekly expiry (ns since epoch) at or after the bar's timestamp.
+        """
+        ts = pd.Timestamp(self.ts_ns[bar], tz="UTC")
+        if self._tz is not None:
+            ts = ts.tz_convert(self._tz)
+        hour, minute = map(int, self.expiry_time.split(":"))
+        expiry = ts.normalize() + pd.Timedelta(days=(self.expiry_weekday - ts.weekday()) % 7, hours=hour, minutes=minute)
+        if expiry <= ts:
+            expiry += pd.Timedelta(days=7)
+        return expiry.value
+
+    def price(self, bar: int, strikes: np.ndarray, is_call: np.ndarray, expiries_ns: np.ndarray) -> np.ndarray:
+        t_years = (np.asarray(expiries_ns, dtype=np.float64) - self.ts_ns[bar]) / YEAR_NS
+        return black_scholes(self.spot[bar], strikes, t_years, self.vol[bar], self.rate, is_call)
+
+class OptionBook:
+    """
+    Open option legs of one backtest as parallel arrays, repriced together every bar.
+    """
+
+    def __init__(self, model: OptionPremiumModel):
+        self.model = model
+        self.strike = np.empty(0)
+        self.is_call = np.empty(0, dtype=bool)
+        self.expiry = np.empty(0, dtype=np.int64)
+        self.qty = np.empty(0)
+        self.entry = np.empty(0)
+        self.exit_bar = np.empty(0, dtype=np.int64)
+        self.dates: List[Any] = []
+        self.marks = np.empty(0)
+
+    @property
+    def n(self) -> int:
+        return self.strike.size
+
+    def open(self, symbol: str, action: str, size: float, bar: int, date: Any) -> bool:
+        """
+        Open a leg at the bar's synthetic premium; False when the symbol is not a CE/PE option.
+        """
+        _, _, strike, option_type = parse_instrument(symbol)
+        if option_type not in ("CE", "PE") or strike is None:
+            return False
+        is_call = option_type == "CE"
+        expiry = self.model.expiry_for(bar)
+        premium = float(self.model.price(bar, np.array([strike]), np.array([is_call]), np.array([expiry]))[0])
+        qty = -size if "SELL" in action else size
+        self.strike = np.append(self.strike, strike)
+        self.is_call = np.append(self.is_call, is_call)
+        self.expiry = np.append(self.expiry, expiry)
+        self.qty = np.append(self.qty, qty)
+        self.entry = np.append(self.entry, premium)
+        self.exit_bar = np.append(self.exit_bar, bar + self.model.hold_bars)
+        self.dates.append(date)
+        return True
+
+    def reprice(self, bar: int) -> np.ndarray:
+        self.marks = self.model.price(bar, self.strike, self.is_call, self.expiry)
+        return self.marks
+
+    def unrealized(self) -> float:
+        return float(np.dot(self.qty, self.marks - self.entry)) if self.n else 0.0
+
+    def settle(self, bar: int, force: bool = False) -> List[Tuple[Any, float]]:
+        """
+        Reprice all legs at `bar` and close those whose holding period or expiry has been reached
+        (all of them when force=True). Returns [(entry date, pnl)].
+        """
+        if not self.n:
+            return []
+        marks = self.reprice(bar)
+        due = np.ones(self.n, dtype=bool) if force else (self.exit_bar <= bar) | (self.expiry <= self.model.ts_ns[bar])
+        if not due.any():
+            return []
+        pnl = self.qty[due] * (marks[due] - self.entry[due])
+        closed = [(d, float(p)) for d, p in zip((d for d, k in zip(self.dates, due) if k), pnl)]
+        keep = ~due
+        for name in ("strike", "is_call", "expiry", "qty", "entry", "exit_bar", "marks"):
+            setattr(self, name, getattr(self, name)[keep])
+        self.dates = [d for d, k in zip(self.dates, keep) if k]
+        return closed
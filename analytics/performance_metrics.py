@@ -30,11 +30,80 @@ class PerformanceMetrics:
 
     @staticmethod
     def expectancy(trades: List[float]) -> float:
-        if not trades:
+        trades = np.asarray(trades, dtype=float)
+        if trades.size == 0:
             return 0.0
-        wins = [t for t in trades if t > 0]
-        losses = [t for t in trades if t < 0]
-        win_rate = len(wins) / len(trades)
-        avg_win = np.mean(wins) if wins else 0
-        avg_loss = abs(np.mean(losses)) if losses else 0
+        wins = trades[trades > 0]
+        losses = trades[trades < 0]
+        win_rate = wins.size / trades.size
+        avg_win = wins.mean() if wins.size else 0
+        avg_loss = abs(losses.mean()) if losses.size else 0
         return (avg_win * win_rate) - (avg_loss * (1 - win_rate))
+
+    # ---- Batched (runs x time) variants -------------------------------------------------
+    # Each row is one run. NaN marks missing points, so ragged runs can be stacked with
+    # pad_ragged(); every statistic ignores NaN and matches its 1-D counterpart per row.
+
+    @staticmethod
+    def pad_ragged(series: List[List[float]]) -> np.ndarray:
+        """Stack series of different lengths into a NaN-padded (runs x max_len) matrix."""
+        length = max((len(s) for s in series), default=0)
+        out = np.full((len(series), length), np.nan)
+        for i, s in enumerate(series):
+            out[i, :len(s)] = s
+        return out
+
+    @staticmethod
+    def _row_mean_std(x: np.ndarray):
+        valid = np.isfinite(x)
+        count = valid.sum(axis=1)
+        safe = np.maximum(count, 1)
+        mean = np.where(valid, x, 0.0).sum(axis=1) / safe
+        var = np.where(valid, (x - mean[:, None]) ** 2, 0.0).sum(axis=1) / safe
+        return mean, np.sqrt(var), count
+
+    @staticmethod
+    def sharpe_ratio_2d(returns: np.ndarray, risk_free_rate: float = 0.0) -> np.ndarray:
+        excess = np.atleast_2d(np.asarray(returns, dtype=float)) - risk_free_rate
+        mean, std, count = PerformanceMetrics._row_mean_std(excess)
+        ok = (count >= 2) & (std > 0)
+        return np.where(ok, mean / np.where(ok, std, 1.0), np.nan) * np.sqrt(252)
+
+    @staticmethod
+    def sortino_ratio_2d(returns: np.ndarray, risk_free_rate: float = 0.0) -> np.ndarray:
+        excess = np.atleast_2d(np.asarray(returns, dtype=float)) - risk_free_rate
+        mean, _, _ = PerformanceMetrics._row_mean_std(excess)
+        downside = np.where(excess < 0, excess, np.nan)
+        _, down_std, down_count = PerformanceMetrics._row_mean_std(downside)
+        ok = (down_count > 0) & (down_std > 0)
+        return np.where(ok, mean / np.where(ok, down_std, 1.0), np.nan) * np.sqrt(252)
+
+    @staticmethod
+    def max_drawdown_2d(equity_curves: np.ndarray) -> np.ndarray:
+        equity = np.atleast_2d(np.asarray(equity_curves, dtype=float))
+        # fmax skips NaN, so gaps and ragged tails do not reset the running peak
+        high = np.fmax.accumulate(equity, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            drawdowns = (high - equity) / high
+        valid = np.isfinite(drawdowns)
+        return np.where(valid.any(axis=1), np.where(valid, drawdowns, -np.inf).max(axis=1), np.nan)
+
+    @staticmethod
+    def win_rate_2d(trades: np.ndarray) -> np.ndarray:
+        trades = np.atleast_2d(np.asarray(trades, dtype=float))
+        count = np.isfinite(trades).sum(axis=1)
+        wins = (trades > 0).sum(axis=1)
+        return np.where(count > 0, wins / np.maximum(count, 1), 0.0)
+
+    @staticmethod
+    def expectancy_2d(trades: np.ndarray) -> np.ndarray:
+        trades = np.atleast_2d(np.asarray(trades, dtype=float))
+        count = np.isfinite(trades).sum(axis=1)
+        win_mask = trades > 0
+        loss_mask = trades < 0
+        n_wins = win_mask.sum(axis=1)
+        n_losses = loss_mask.sum(axis=1)
+        avg_win = np.where(win_mask, trades, 0.0).sum(axis=1) / np.maximum(n_wins, 1)
+        avg_loss = np.abs(np.where(loss_mask, trades, 0.0).sum(axis=1)) / np.maximum(n_losses, 1)
+        win_rate = n_wins / np.maximum(count, 1)
+        return np.where(count > 0, avg_win * win_rate - avg_loss * (1 - win_rate), 0.0)
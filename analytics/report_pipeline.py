@@ -4,14 +4,21 @@ Advanced trade visualization and report generation pipeline for EdgeX.
 """
 
 import os
-from typing import List, Dict, Optional
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objs as go
+from typing import TYPE_CHECKING, List, Dict, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 REPORTS_DIR = "reports"
 
+def _pyplot():
+    # matplotlib is only needed when a chart is rendered; importing it lazily keeps
+    # the UI server and bot start-up free of its import cost.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
 def ensure_dir(path: str):
     if not os.path.exists(path):
         os.makedirs(path)
@@ -23,13 +30,15 @@ class ReportPipeline:
         ensure_dir(base_dir)
 
     def save_trade_log(self, trade_log: List[Dict], name="trade_log.csv") -> None:
+        import pandas as pd
         df = pd.DataFrame(trade_log)
         path = os.path.join(self.base_dir, name)
         df.to_csv(path, index=False)
         if self.logger:
             self.logger.info(f"[ReportPipeline] Saved trade log to {path}")
 
-    def plot_equity_curve(self, trades_df: pd.DataFrame, fname: str = "equity_curve.png") -> str:
+    def plot_equity_curve(self, trades_df: "pd.DataFrame", fname: str = "equity_curve.png") -> str:
+        plt = _pyplot()
         plt.figure(figsize=(12, 5))
         plt.plot(trades_df['timestamp'], trades_df['equity'], label='Equity Curve', color='blue')
         plt.fill_between(trades_df['timestamp'], trades_df['equity'], color='lightblue', alpha=0.25)
@@ -46,7 +55,9 @@ class ReportPipeline:
             self.logger.info(f"[ReportPipeline] Saved equity curve to {outpath}")
         return outpath
 
-    def plot_drawdown(self, trades_df: pd.DataFrame, fname: str = "drawdown.png") -> str:
+    def plot_drawdown(self, trades_df: "pd.DataFrame", fname: str = "drawdown.png") -> str:
+        import numpy as np
+        plt = _pyplot()
         equity = trades_df['equity']
         high = np.maximum.accumulate(equity)
         drawdown = (high - equity) / high
@@ -65,7 +76,8 @@ class ReportPipeline:
             self.logger.info(f"[ReportPipeline] Saved drawdown chart to {outpath}")
         return outpath
 
-    def plot_trade_annotations(self, price_df: pd.DataFrame, trades_df: pd.DataFrame, fname: str = "trade_annotations.png") -> str:
+    def plot_trade_annotations(self, price_df: "pd.DataFrame", trades_df: "pd.DataFrame", fname: str = "trade_annotations.png") -> str:
+        plt = _pyplot()
         plt.figure(figsize=(12, 6))
         plt.plot(price_df.index, price_df['close'], label='Close Price', alpha=0.7)
         for _, trade in trades_df.iterrows():
@@ -85,7 +97,10 @@ class ReportPipeline:
             self.logger.info(f"[ReportPipeline] Saved trade annotation chart to {outpath}")
         return outpath
 
-    def plot_sharpe_by_month(self, trades_df: pd.DataFrame, fname: str = "sharpe_by_month.png") -> str:
+    def plot_sharpe_by_month(self, trades_df: "pd.DataFrame", fname: str = "sharpe_by_month.png") -> str:
+        import numpy as np
+        import pandas as pd
+        plt = _pyplot()
         trades_df['timestamp'] = pd.to_datetime(trades_df['timestamp'])
         trades_df['month'] = trades_df['timestamp'].dt.to_period('M')
         monthly_returns = trades_df.groupby('month')['pnl'].sum()
@@ -103,7 +118,8 @@ class ReportPipeline:
             self.logger.info(f"[ReportPipeline] Saved Sharpe by month chart to {outpath}")
         return outpath
 
-    def plot_win_loss_ratio_by_symbol(self, trades_df: pd.DataFrame, fname: str = "win_loss_ratio.png") -> str:
+    def plot_win_loss_ratio_by_symbol(self, trades_df: "pd.DataFrame", fname: str = "win_loss_ratio.png") -> str:
+        plt = _pyplot()
         trades_df['win'] = trades_df['pnl'] > 0
         grouped = trades_df.groupby('symbol')['win'].mean()
         plt.figure(figsize=(12, 6))
@@ -119,14 +135,14 @@ class ReportPipeline:
             self.logger.info(f"[ReportPipeline] Saved Win/Loss ratio by symbol chart to {outpath}")
         return outpath
 
-    def export_trade_log_excel(self, trades_df: pd.DataFrame, fname: str = "trade_log.xlsx") -> str:
+    def export_trade_log_excel(self, trades_df: "pd.DataFrame", fname: str = "trade_log.xlsx") -> str:
         path = os.path.join(self.base_dir, fname)
         trades_df.to_excel(path, index=False)
         if self.logger:
             self.logger.info(f"[ReportPipeline] Exported trade log to Excel at {path}")
         return path
 
-    def export_trade_log_json(self, trades_df: pd.DataFrame, fname: str = "trade_log.json") -> str:
+    def export_trade_log_json(self, trades_df: "pd.DataFrame", fname: str = "trade_log.json") -> str:
         path = os.path.join(self.base_dir, fname)
         trades_df.to_json(path, orient='records', date_format='iso')
         if self.logger:
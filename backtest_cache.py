@@ -0,0 +1,171 @@
+"""
+backtest_cache.py
+Content-addressed on-disk cache for BacktestRunner results.
+A result is keyed by a SHA-256 over the strategy code, the params, a fingerprint of the historical
+data and the runner settings, so a rerun with identical inputs is a file read and any edit to the
+strategy (or runner) source invalidates its entries automatically. Trades and the equity curve are
+stored column-wise in one .npz file per key; the directory is kept under a size budget by
+evicting the least recently used entries.
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = "data/backtest_cache"
+# Bump when the on-disk layout changes
+FORMAT_VERSION = 1
+
+def _module_source(module_name: str) -> str:
+    try:
+        return inspect.getsource(sys.modules[module_name])
+    except (KeyError, OSError, TypeError):
+        return module_name
+
+def code_fingerprint(strategy_class) -> str:
+    """
+    Hash of the source of every module the strategy class (and its bases) is defined in,
+    plus the backtest runner itself.
+    """
+    modules = [cls.__module__ for cls in strategy_class.__mro__ if cls.__module__ not in ("builtins", "abc")]
+    modules.append("edgeX.backtest_runner")
+    h = hashlib.sha256()
+    for name in dict.fromkeys(modules):
+        h.update(name.encode())
+        h.update(_module_source(name).encode())
+    h.update(strategy_class.__qualname__.encode())
+    return h.hexdigest()
+
+def data_fingerprint(df: pd.DataFrame) -> str:
+    h = hashlib.sha256()
+    h.update(",".join(map(str, df.columns)).encode())
+    h.update(str(df.index.dtype).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+def _canonical(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, default=repr)
+
+class BacktestCache:
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = 512 * 1024 * 1024, logger=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(
+        self,
+        strategy_class,
+        params: Dict[str, Any],
+        data_fp: str,
+        settings: Dict[str, Any]
+    ) -> str:
+        h = hashlib.sha256()
+        for part in (str(FORMAT_VERSION), code_fingerprint(strategy_class), _canonical(params), data_fp, _canonical(settings)):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], List[float]]]:
+        """
+        (summary, trades, equity_curve) for a cached key, else None.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                meta = json.loads(npz["meta"].tobytes().decode())
+                dates = npz["date"]
+                pnl = npz["pnl"]
+                returns = npz["returns"]
+                equity = npz["equity"].tolist()
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            self.misses += 1
+            return None
+        if meta["date_kind"] == "datetime":
+            dates = pd.DatetimeIndex(dates.view("datetime64[ns]"))
+            if meta["tz"]:
+                dates = dates.tz_localize("UTC").tz_convert(meta["tz"])
+        trades = [
+            {"date": d, "pnl": float(p), "returns": float(r)}
+            for d, p, r in zip(dates, pnl, returns)
+        ]
+        # Mark as recently used for LRU eviction
+        os.utime(path, None)
+        self.hits += 1
+        return meta["summary"], trades, equity
+
+    def store(self, key: str, summary: Dict[str, Any], trades: List[Dict[str, Any]], equity_curve: List[float]) -> None:
+        dates = pd.Index([t["date"] for t in trades])
+        if isinstance(dates, pd.DatetimeIndex):
+            date_kind = "datetime"
+            tz = str(dates.tz) if dates.tz is not None else None
+            raw_dates = (dates.tz_convert("UTC").tz_localize(None) if tz else dates).as_unit("ns").asi8
+        else:
+            date_kind = "int"
+            tz = None
+            raw_dates = np.asarray(dates, dtype=np.int64)
+        meta = {
+            "summary": {k: v for k, v in summary.items() if k != "equity_curve"},
+            "date_kind": date_kind,
+            "tz": tz,
+        }
+        buf = io.BytesIO()
+        np.savez(
+            buf,
+            meta=np.frombuffer(json.dumps(meta, default=float).encode(), dtype=np.uint8),
+            date=raw_dates,
+            pnl=np.array([t["pnl"] for t in trades], dtype=np.float64),
+            returns=np.array([t["returns"] for t in trades], dtype=np.float64),
+            equity=np.asarray(equity_curve, dtype=np.float64),
+        )
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf.getbuffer())
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+        if self.logger:
+            self.logger.info(f"[BacktestCache] Evicted entries down to {total / 1e6:.1f} MB")
+
+    def clear(self) -> None:
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self) -> Dict[str, Any]:
+        files = [f for f in os.listdir(self.cache_dir) if f.endswith(".npz")]
+        size = sum(os.path.getsize(os.path.join(self.cache_dir, f)) for f in files)
+        return {"entries": len(files), "bytes": size, "hits": self.hits, "misses": self.misses}
@@ -6,6 +6,11 @@ Flexible strategy backtesting engine with daily or intraday data support.
 import pandas as pd
 from typing import Any, Dict
 from edgeX.analytics.backtest_analyzer import BacktestAnalyzer
+from edgeX.analytics.option_pricing import OptionBook
+from edgeX.backtest_cache import data_fingerprint
+
+# Bars fed to the strategy before the first signal is evaluated
+WARMUP_BARS = 50
 
 class BacktestRunner:
     def __init__(
@@ -14,17 +19,67 @@ class BacktestRunner:
         historical_data: pd.DataFrame,
         initial_capital: float = 1_000_000.0,
         risk_manager=None,
+        indicator_cache=None,
+        cache=None,
+        sink=None,
+        option_model=None,
         logger=None
     ):
         self.strategy_class = strategy_class
         self.data = historical_data
         self.capital = initial_capital
         self.risk_manager = risk_manager
+        # Optional IndicatorCache built over a frame that historical_data is a slice of
+        self.indicator_cache = indicator_cache
+        # Optional BacktestCache; identical reruns are served from disk
+        self.cache = cache
+        self._data_fp = None
+        # Optional SegmentedResultSink; trades stream to disk instead of self.trades
+        self.sink = sink
+        # Optional OptionPremiumModel; CE/PE signals are then booked on synthetic premiums
+        self.option_model = option_model
         self.logger = logger
         self.trades = []
         self.equity_curve = [initial_capital]
 
+    def cache_key(self, params: Dict[str, Any]) -> str:
+        if self._data_fp is None:
+            self._data_fp = data_fingerprint(self.data)
+        settings = {
+            "initial_capital": self.equity_curve[0],
+            "warmup_bars": WARMUP_BARS,
+            "risk_manager": type(self.risk_manager).__qualname__ if self.risk_manager else None,
+            "risk_config": getattr(self.risk_manager, "risk_config", None),
+            "option_model": self.option_model.settings() if self.option_model is not None else None,
+        }
+        return self.cache.make_key(self.strategy_class, params, self._data_fp, settings)
+
+    def _book(self, date, pnl: float) -> None:
+        self.capital += pnl
+        if self.sink is not None:
+            self.sink.add_trade(date, pnl, pnl/self.capital, self.capital)
+            return
+        self.trades.append({"date": date, "pnl": pnl, "returns": pnl/self.capital})
+        self.equity_curve.append(self.capital)
+
     def run(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        key = None
+        if self.cache is not None and self.sink is None:
+            key = self.cache_key(params)
+            cached = self.cache.load(key)
+            if cached is not None:
+                summary, trades, equity_curve = cached
+                self.trades.extend(trades)
+                self.equity_curve.extend(equity_curve[1:])
+                if trades:
+                    self.capital = equity_curve[-1]
+                summary["equity_curve"] = self.equity_curve
+                return summary
+
+        if self.sink is not None and self.sink.initial_capital is None:
+            self.sink.initial_capital = self.capital
+        start_trades = len(self.trades)
+        start_equity = len(self.equity_curve) - 1
         strategy = self.strategy_class(
             "BacktestStrategy",
             params,
@@ -33,23 +88,47 @@ class BacktestRunner:
             risk_manager=self.risk_manager,
             logger=self.logger
         )
+        strategy.indicator_cache = self.indicator_cache
         strategy.initialize()
 
-        for idx in range(50, len(self.data)):
+        book = None
+        if self.option_model is not None:
+            self.option_model.prepare(self.data)
+            book = OptionBook(self.option_model)
+
+        for idx in range(WARMUP_BARS, len(self.data)):
             df_slice = self.data.iloc[:idx]
             signals = strategy.generate_signals(df_slice)
             if self.risk_manager:
                 signals = self.risk_manager.check_signals(signals)
 
             for sig in signals:
+                if book is not None and book.open(sig["symbol"], sig["action"], sig["size"], idx - 1, df_slice.index[-1]):
+                    continue
                 entry_price = sig["price"]
-                exit_price = df_slice.iloc[-1]['close']  # naive next-bar exit
+                exit_price = self.data['close'].iloc[idx]  # naive next-bar exit
                 pnl = (exit_price - entry_price) * sig["size"] if "BUY" in sig["action"] else (entry_price - exit_price) * sig["size"]
-                self.capital += pnl
-                self.trades.append({"date": df_slice.index[-1], "pnl": pnl, "returns": pnl/self.capital})
-                self.equity_curve.append(self.capital)
+                self._book(df_slice.index[-1], pnl)
+
+            if book is not None:
+                for date, pnl in book.settle(idx):
+                    self._book(date, pnl)
+
+        if book is not None:
+            for date, pnl in book.settle(len(self.data) - 1, force=True):
+                self._book(date, pnl)
+
+        if self.sink is not None:
+            self.sink.close()
+            summary = self.sink.summarize()
+            summary["result_dir"] = self.sink.out_dir
+            if self.logger:
+                self.logger.info(f"Backtest summary: {summary}")
+            return summary
 
         analyzer = BacktestAnalyzer(self.logger)
         summary = analyzer.summarize(pd.DataFrame(self.trades))
+        if key is not None:
+            self.cache.store(key, summary, self.trades[start_trades:], self.equity_curve[start_equity:])
         summary["equity_curve"] = self.equity_curve
         return summary
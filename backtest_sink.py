@@ -0,0 +1,177 @@
+"""
+backtest_sink.py
+Streaming, memory-bounded output for long backtests.
+Trades (with the equity after each trade) are buffered in fixed-size NumPy columns and spilled to
+numbered .npz segments on disk whenever a chunk fills, so memory stays constant however long the
+run is. summarize() walks the segments one at a time and merges per-chunk statistics, returning the
+same keys as BacktestAnalyzer.summarize.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+COLUMNS = ("date", "pnl", "returns", "equity")
+
+class _Moments:
+    """
+    Count/mean/M2 merged chunk by chunk (Chan et al.), equal to np.mean/np.std over all rows.
+    """
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add_chunk(self, x: np.ndarray) -> None:
+        if not x.size:
+            return
+        n_b = x.size
+        mean_b = float(x.mean())
+        m2_b = float(((x - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.n)) if self.n else float("nan")
+
+class SegmentedResultSink:
+    def __init__(self, out_dir: str, chunk_rows: int = 65536, initial_capital: Optional[float] = None, logger=None):
+        self.out_dir = out_dir
+        self.chunk_rows = chunk_rows
+        self.initial_capital = initial_capital
+        self.logger = logger
+        self.segments = []
+        self.rows = 0
+        self.tz = None
+        self._buf = {
+            "date": np.empty(chunk_rows, dtype=np.int64),
+            "pnl": np.empty(chunk_rows, dtype=np.float64),
+            "returns": np.empty(chunk_rows, dtype=np.float64),
+            "equity": np.empty(chunk_rows, dtype=np.float64),
+        }
+        self._n = 0
+        os.makedirs(out_dir, exist_ok=True)
+
+    @classmethod
+    def load(cls, out_dir: str, logger=None) -> "SegmentedResultSink":
+        """
+        Re-open a finished run for reading.
+        """
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+        sink = cls(out_dir, chunk_rows=1, initial_capital=manifest["initial_capital"], logger=logger)
+        sink.segments = manifest["segments"]
+        sink.rows = manifest["rows"]
+        sink.tz = manifest["tz"]
+        return sink
+
+    def add_trade(self, date: Any, pnl: float, returns: float, equity: float) -> None:
+        if isinstance(date, pd.Timestamp):
+            if self.tz is None and date.tz is not None:
+                self.tz = str(date.tz)
+            date = date.value
+        i = self._n
+        self._buf["date"][i] = date
+        self._buf["pnl"][i] = pnl
+        self._buf["returns"][i] = returns
+        self._buf["equity"][i] = equity
+        self._n = i + 1
+        if self._n == self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._n:
+            return
+        name = f"segment_{len(self.segments):05d}.npz"
+        np.savez(os.path.join(self.out_dir, name), **{c: self._buf[c][:self._n] for c in COLUMNS})
+        self.segments.append(name)
+        self.rows += self._n
+        self._n = 0
+        self._write_manifest()
+
+    def close(self) -> None:
+        self.flush()
+        self._write_manifest()
+        if self.logger:
+            self.logger.info(f"[ResultSink] {self.rows} trades in {len(self.segments)} segments under {self.out_dir}")
+
+    def _write_manifest(self) -> None:
+        manifest = {"segments": self.segments, "rows": self.rows, "tz": self.tz, "initial_capital": self.initial_capital}
+        tmp = os.path.join(self.out_dir, MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(self.out_dir, MANIFEST))
+
+    def iter_segments(self) -> Iterator[Dict[str, np.ndarray]]:
+        for name in self.segments:
+            with np.load(os.path.join(self.out_dir, name)) as npz:
+                yield {c: npz[c] for c in COLUMNS}
+
+    def iter_frames(self) -> Iterator[pd.DataFrame]:
+        """
+        Segments as DataFrames (date, pnl, returns, equity), one at a time.
+        """
+        for seg in self.iter_segments():
+            dates = pd.to_datetime(seg["date"], unit="ns", utc=self.tz is not None)
+            if self.tz:
+                dates = dates.tz_convert(self.tz)
+            yield pd.DataFrame({"date": dates, "pnl": seg["pnl"], "returns": seg["returns"], "equity": seg["equity"]})
+
+    def summarize(self, risk_free_rate: float = 0.0) -> Dict[str, Any]:
+        """
+        BacktestAnalyzer.summarize over all segments, reading one segment at a time.
+        """
+        returns, downside = _Moments(), _Moments()
+        total_pnl = 0.0
+        n = wins = losses = 0
+        win_sum = loss_sum = 0.0
+        cum, high, max_dd = 0.0, -np.inf, -np.inf
+        for seg in self.iter_segments():
+            pnl = seg["pnl"]
+            excess = seg["returns"] - risk_free_rate
+            returns.add_chunk(excess)
+            downside.add_chunk(excess[excess < 0])
+            total_pnl += float(pnl.sum())
+            n += pnl.size
+            win_mask, loss_mask = pnl > 0, pnl < 0
+            wins += int(win_mask.sum())
+            losses += int(loss_mask.sum())
+            win_sum += float(pnl[win_mask].sum())
+            loss_sum += float(pnl[loss_mask].sum())
+            # Drawdown of the cumulative PnL, as BacktestAnalyzer computes it
+            cum_pnl = cum + np.cumsum(pnl)
+            peaks = np.maximum(np.maximum.accumulate(cum_pnl), high)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                chunk_dd = float(np.max((peaks - cum_pnl) / peaks))
+            max_dd = chunk_dd if np.isnan(chunk_dd) or np.isnan(max_dd) else max(max_dd, chunk_dd)
+            cum, high = float(cum_pnl[-1]), float(peaks[-1])
+
+        if not n:
+            return {"total_pnl": 0.0, "sharpe": float("nan"), "sortino": float("nan"), "max_drawdown": 0.0,
+                    "expectancy": 0.0, "win_rate": 0.0, "trade_count": 0}
+        std = returns.std
+        sharpe = float("nan") if n < 2 or std == 0 else returns.mean / std * np.sqrt(252)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sortino = float("nan") if not downside.n else float(np.float64(returns.mean) / downside.std * np.sqrt(252))
+        win_rate = wins / n
+        avg_win = win_sum / wins if wins else 0.0
+        avg_loss = abs(loss_sum / losses) if losses else 0.0
+        return {
+            "total_pnl": round(total_pnl, 4),
+            "sharpe": round(sharpe, 4),
+            "sortino": round(sortino, 4),
+            "max_drawdown": round(max_dd, 4),
+            "expectancy": round(avg_win * win_rate - avg_loss * (1 - win_rate), 4),
+            "win_rate": round(win_rate, 4),
+            "trade_count": n
+        }
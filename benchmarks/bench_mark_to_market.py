@@ -0,0 +1,77 @@
+"""
+bench_mark_to_market.py
+Throughput benchmark for MarkToMarketEngine with DrawdownManager attached, on a NIFTY + SENSEX
+option book. Exits non-zero when the engine cannot sustain the required tick rate.
+
+Usage:
+    python benchmarks/bench_mark_to_market.py [--legs 400] [--ticks 300000] [--min-rate 20000]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from package_path import add_package_to_path
+
+add_package_to_path()
+
+from edgeX.risk_management.drawdown_manager import DrawdownManager
+from edgeX.risk_management.mark_to_market import MarkToMarketEngine
+
+UNDERLYINGS = [("NSE:NIFTY 50", "NIFTY", 24500.0, 50), ("BSE:SENSEX", "SENSEX", 80500.0, 100)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Mark-to-market tick throughput benchmark")
+    parser.add_argument("--legs", type=int, default=400, help="option legs per underlying")
+    parser.add_argument("--ticks", type=int, default=300_000)
+    parser.add_argument("--underlying-share", type=float, default=0.2, help="fraction of ticks on the underlying")
+    parser.add_argument("--min-rate", type=float, default=20_000, help="required ticks/s")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    engine = MarkToMarketEngine(10_000_000, drawdown_manager=DrawdownManager(10_000_000))
+    legs = []
+    for tick_symbol, name, spot, step in UNDERLYINGS:
+        engine.on_tick(tick_symbol, spot)
+        for i in range(args.legs):
+            strike = int(spot + step * (i // 2 - args.legs // 4))
+            option_type = "CE" if i % 2 else "PE"
+            symbol = f"{name}25814{strike}{option_type}"
+            delta = 0.5 if option_type == "CE" else -0.5
+            engine.on_fill(symbol, int(rng.choice([-1, 1])) * 75, float(rng.uniform(20, 400)), delta=delta, gamma=0.001)
+            legs.append((symbol, tick_symbol))
+
+    # Pre-generate the tick stream so only the engine is timed.
+    is_underlying = rng.random(args.ticks) < args.underlying_share
+    leg_idx = rng.integers(0, len(legs), args.ticks)
+    und_idx = rng.integers(0, len(UNDERLYINGS), args.ticks)
+    moves = rng.normal(0, 1, args.ticks)
+    spots = {u[0]: u[2] for u in UNDERLYINGS}
+    stream = []
+    for k in range(args.ticks):
+        if is_underlying[k]:
+            symbol = UNDERLYINGS[und_idx[k]][0]
+            spots[symbol] += moves[k] * 2
+            stream.append((symbol, spots[symbol]))
+        else:
+            stream.append((legs[leg_idx[k]][0], float(rng.uniform(20, 400))))
+
+    on_tick = engine.on_tick
+    start = time.perf_counter()
+    for symbol, price in stream:
+        on_tick(symbol, price)
+    elapsed = time.perf_counter() - start
+
+    rate = args.ticks / elapsed
+    print(f"legs: {len(legs)}  ticks: {args.ticks}  underlying share: {args.underlying_share:.0%}")
+    print(f"throughput: {rate:,.0f} ticks/s  ({elapsed / args.ticks * 1e6:.2f}us per tick)")
+    print(f"final equity: {engine.equity:,.2f}  drawdown status: {engine.status}")
+    if rate < args.min_rate:
+        print(f"REGRESSION: {rate:,.0f} ticks/s below required {args.min_rate:,.0f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+bench_pre_trade_risk.py
+Latency benchmark for PreTradeRiskEngine.check / on_fill against a populated option book.
+Exits non-zero when the p99 check latency exceeds the budget.
+
+Usage:
+    python benchmarks/bench_pre_trade_risk.py [--orders 200000] [--positions 500] [--budget-us 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from package_path import add_package_to_path
+
+add_package_to_path()
+
+from edgeX.risk_management.pre_trade_risk import PreTradeRiskEngine
+
+LIMITS = {
+    "max_order_notional": 5_000_000,
+    "max_order_lots": 20,
+    "max_orders_per_sec": 1_000_000,
+    "max_symbol_notional": 10_000_000,
+    "max_underlying_notional": 200_000_000,
+    "max_strategy_notional": 100_000_000,
+    "max_expiry_notional": 150_000_000,
+    "max_gross_notional": 500_000_000,
+    "max_symbol_concentration": 0.25,
+    "max_underlying_concentration": 0.8,
+    "concentration_min_gross": 1_000_000,
+    "lot_sizes": {"NIFTY": 75, "SENSEX": 20},
+}
+
+def make_orders(n, rng):
+    orders = []
+    for _ in range(n):
+        underlying, step, spot, lot = rng.choice([("NIFTY", 50, 24500, 75), ("SENSEX", 100, 80500, 20)])
+        strike = spot + step * rng.randint(-20, 20)
+        symbol = f"{underlying}25814{strike}{rng.choice(['CE', 'PE'])}"
+        orders.append((symbol, rng.choice(["BUY_CALL", "BUY_PUT", "SELL_CALL"]), lot * rng.randint(1, 5),
+                       rng.uniform(20, 400), f"strat{rng.randint(0, 9)}"))
+    return orders
+
+def percentile(sorted_vals, pct):
+    return sorted_vals[min(len(sorted_vals) - 1, int(len(sorted_vals) * pct / 100))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-trade risk check latency benchmark")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--positions", type=int, default=500)
+    parser.add_argument("--budget-us", type=float, default=20.0, help="p99 latency budget per check")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = PreTradeRiskEngine(LIMITS)
+    for order in make_orders(args.positions, rng):
+        engine.on_fill(*order)
+    orders = make_orders(args.orders, rng)
+
+    check = engine.check
+    clock = time.perf_counter_ns
+    samples = []
+    accepted = 0
+    start = clock()
+    for symbol, action, size, price, strategy in orders:
+        t0 = clock()
+        ok, _ = check(symbol, action, size, price, strategy)
+        samples.append(clock() - t0)
+        if ok:
+            accepted += 1
+            engine.on_fill(symbol, action, size, price, strategy)
+    total_s = (clock() - start) / 1e9
+
+    samples.sort()
+    p50, p99, p999 = (percentile(samples, p) / 1000 for p in (50, 99, 99.9))
+    print(f"orders: {args.orders}  accepted: {accepted}  open positions: {len(engine.positions)}")
+    print(f"check latency  p50 {p50:.2f}us  p99 {p99:.2f}us  p99.9 {p999:.2f}us  max {samples[-1] / 1000:.2f}us")
+    print(f"throughput (check + fill): {args.orders / total_s:,.0f} orders/s")
+    print(f"rejects by reason: {dict(engine.rejects)}")
+    if p99 > args.budget_us:
+        print(f"REGRESSION: p99 {p99:.2f}us exceeds budget {args.budget_us:.2f}us")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+bench_quote_hub.py
+Fan-out benchmark for QuoteHub: hundreds of websocket-like clients with per-client symbol
+subscriptions at tick rate, a share of them slow. Fast clients serialize every batch to JSON;
+slow ones take --slow-ms per send. Exits non-zero when fast clients' p99 quote latency exceeds
+the budget, the publisher falls behind the target rate, or a slow client's backlog grows past its
+subscriptions.
+
+Usage:
+    python benchmarks/bench_quote_hub.py [--clients 500] [--symbols 50] [--rate 20000] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+
+from package_path import add_package_to_path
+
+add_package_to_path()
+
+from edgeX.ui.quote_hub import QuoteHub
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q / 100 * len(values)))] if values else 0.0
+
+async def run(args):
+    rng = random.Random(args.seed)
+    hub = QuoteHub(send_timeout=10.0, flush_interval=args.flush_ms / 1000)
+    symbols = [f"NFO:NIFTY25814{24000 + 50 * i}CE" for i in range(args.symbols)]
+    latencies = []
+    max_pending = {"slow": 0}
+
+    def make_send(slow):
+        async def send(payload):
+            now = time.perf_counter()
+            if slow:
+                await asyncio.sleep(args.slow_ms / 1000)
+            else:
+                json.dumps(payload)
+                latencies.extend(now - q["timestamp"] for q in payload["quotes"])
+        return send
+
+    tasks = []
+    slow_clients = []
+    for i in range(args.clients):
+        slow = i < args.clients * args.slow_share
+        client = hub.connect(rng.sample(symbols, args.subscriptions))
+        if slow:
+            slow_clients.append(client)
+        tasks.append(asyncio.create_task(hub.serve(client, make_send(slow))))
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    published = 0
+    while time.perf_counter() - started < args.seconds:
+        # Publish whatever the target rate owes by now, so a late wakeup catches up
+        due = int((time.perf_counter() - started) * args.rate)
+        for _ in range(due - published):
+            hub.publish(rng.choice(symbols), round(rng.uniform(50, 500), 2), time.perf_counter())
+        published = due
+        max_pending["slow"] = max(max_pending["slow"], max(len(c.pending) for c in slow_clients) if slow_clients else 0)
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    stats = hub.stats()
+    for client in list(hub.clients.values()):
+        hub.disconnect(client)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return stats, elapsed, latencies, max_pending["slow"], rss_after - rss_before
+
+def main():
+    parser = argparse.ArgumentParser(description="QuoteHub fan-out benchmark")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--subscriptions", type=int, default=10, help="symbols per client")
+    parser.add_argument("--rate", type=float, default=20_000, help="published quotes per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--slow-share", type=float, default=0.1)
+    parser.add_argument("--slow-ms", type=float, default=250.0)
+    parser.add_argument("--flush-ms", type=float, default=50.0, help="hub flush interval per client")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="p99 latency budget for fast clients")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    stats, elapsed, latencies, slow_pending, rss_growth = asyncio.run(run(args))
+    rate = stats["published"] / elapsed
+    p50, p99 = percentile(latencies, 50) * 1000, percentile(latencies, 99) * 1000
+    print(f"{args.clients} clients x {args.subscriptions} of {args.symbols} symbols, {args.slow_share:.0%} slow, "
+          f"flush every {args.flush_ms:g} ms")
+    print(f"published {stats['published']:,} quotes in {elapsed:.2f}s ({rate:,.0f}/s)")
+    print(f"delivered {stats['sent']:,} (conflated {stats['conflated']:,})")
+    print(f"fast-client latency p50 {p50:.2f} ms  p99 {p99:.2f} ms")
+    print(f"max slow-client backlog {slow_pending} quotes (subscriptions {args.subscriptions})")
+    print(f"peak RSS growth {rss_growth / 1024:.1f} MB")
+    failed = []
+    if p99 > args.budget_ms:
+        failed.append(f"p99 {p99:.1f} ms over budget {args.budget_ms} ms")
+    if rate < 0.9 * args.rate:
+        failed.append(f"publisher reached {rate:,.0f}/s of {args.rate:,.0f}/s")
+    if slow_pending > args.subscriptions:
+        failed.append(f"slow-client backlog {slow_pending} exceeds its {args.subscriptions} subscriptions")
+    if failed:
+        print("REGRESSION: " + "; ".join(failed))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+bench_startup.py
+Start-up benchmark: measures per-module import cost of the bot entry points and the UI server
+using `python -X importtime`, and fails when an entry point exceeds its regression threshold.
+
+Usage:
+    python benchmarks/bench_startup.py [--threshold-ms 250] [--repeat 5] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from package_path import PACKAGE, REPO_ROOT, package_parent, remove_package_parent
+
+ENTRY_POINTS = ["edgeX.main", "edgeX.orchestrator", "edgeX.ui.server"]
+
+# Heavy packages that must stay out of the import path of each entry point.
+FORBIDDEN_AT_IMPORT = {
+    "edgeX.main": ["pandas", "matplotlib", "plotly", "kiteconnect"],
+    "edgeX.orchestrator": ["pandas", "matplotlib", "plotly", "kiteconnect"],
+    "edgeX.ui.server": ["pandas", "matplotlib", "plotly", "kiteconnect"],
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+def measure_import(module: str, pythonpath: str) -> Tuple[List[Tuple[str, int, int, int]], str]:
+    """
+    Imports `module` in a fresh interpreter and returns ([(name, self_us, cumulative_us, depth)], error).
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = pythonpath + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    error = ""
+    if proc.returncode != 0:
+        error = [l for l in proc.stderr.splitlines() if not l.startswith("import time:")][-1:]
+        error = error[0] if error else f"exit code {proc.returncode}"
+    return rows, error
+
+def summarize(rows: List[Tuple[str, int, int, int]], module: str) -> Dict:
+    total_us = next((cum for name, _, cum, _ in rows if name == module), sum(r[1] for r in rows))
+    by_package = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        by_package[name.split(".")[0] if not name.startswith(PACKAGE + ".") else name] += self_us
+    return {"total_us": total_us, "by_package": dict(by_package), "modules": {r[0] for r in rows}}
+
+def run(threshold_ms: float, repeat: int, top: int) -> int:
+    parent, cleanup = package_parent()
+    failures = 0
+    try:
+        for module in ENTRY_POINTS:
+            best = None
+            error = ""
+            for _ in range(repeat):
+                rows, error = measure_import(module, parent)
+                if error:
+                    break
+                summary = summarize(rows, module)
+                if best is None or summary["total_us"] < best["total_us"]:
+                    best = summary
+            print(f"\n=== {module} ===")
+            if error:
+                print(f"  IMPORT FAILED: {error}")
+                failures += 1
+                continue
+            total_ms = best["total_us"] / 1000
+            print(f"  total import time: {total_ms:.1f} ms (best of {repeat}, threshold {threshold_ms:.0f} ms)")
+            for name, us in sorted(best["by_package"].items(), key=lambda kv: -kv[1])[:top]:
+                print(f"    {us / 1000:8.2f} ms  {name}")
+            leaked = [pkg for pkg in FORBIDDEN_AT_IMPORT.get(module, []) if pkg in best["modules"]]
+            if leaked:
+                print(f"  REGRESSION: heavy packages imported eagerly: {leaked}")
+                failures += 1
+            if total_ms > threshold_ms:
+                print(f"  REGRESSION: {total_ms:.1f} ms exceeds {threshold_ms:.0f} ms")
+                failures += 1
+    finally:
+        remove_package_parent(cleanup)
+    return 1 if failures else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="EdgeX start-up import-time benchmark")
+    parser.add_argument("--threshold-ms", type=float, default=250.0, help="max allowed import time per entry point")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per entry point; the fastest is reported")
+    parser.add_argument("--top", type=int, default=15, help="number of most expensive packages to list")
+    args = parser.parse_args()
+    sys.exit(run(args.threshold_ms, args.repeat, args.top))
+
+if __name__ == "__main__":
+    main()
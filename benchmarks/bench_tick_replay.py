@@ -0,0 +1,76 @@
+"""
+bench_tick_replay.py
+Throughput/memory benchmark for tick-replay backtests: writes synthetic ticks for several
+instruments to a temporary TickStore, then replays them through TickBacktestRunner with
+MomentumBreakoutStrategy's crossovers on the underlying, trailing stops and partial fills. Exits non-zero below the required rate.
+
+Usage:
+    python benchmarks/bench_tick_replay.py [--ticks 4000000] [--instruments 3] [--min-rate 1000000]
+"""
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+
+from package_path import add_package_to_path
+
+add_package_to_path()
+
+from edgeX.data_ingestion.tick_store import TickStore, write_synthetic_ticks
+from edgeX.risk_management.stop_loss import StopLossEngine
+from edgeX.strategies.momentum_breakout import MomentumBreakoutStrategy
+from edgeX.tick_backtest_runner import FillSimulator, TickBacktestRunner
+
+class UnderlyingBreakout(MomentumBreakoutStrategy):
+    """
+    The same crossovers traded on the underlying itself, so orders fill and stop out on its ticks
+    (the option legs MomentumBreakout emits have no ticks in this store).
+    """
+
+    def generate_signals(self, market_data):
+        signals = super().generate_signals(market_data)
+        for sig in signals:
+            sig.symbol = self.underlying_symbol
+            sig.action = "BUY" if sig.action == "BUY_CALL" else "SELL"
+        return signals
+
+INSTRUMENTS = [("NSE:NIFTY 50", 24500.0), ("BSE:SENSEX", 80500.0), ("NSE:NIFTY BANK", 51000.0),
+               ("NSE:NIFTY FIN SERVICE", 23500.0), ("NSE:NIFTY MID SELECT", 12500.0)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick replay backtest benchmark")
+    parser.add_argument("--ticks", type=int, default=4_000_000, help="ticks per instrument")
+    parser.add_argument("--instruments", type=int, default=3, choices=range(1, len(INSTRUMENTS) + 1))
+    parser.add_argument("--min-rate", type=float, default=1_000_000, help="required replayed ticks/s")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = TickStore(directory)
+        start = time.perf_counter()
+        write_synthetic_ticks(store, dict(INSTRUMENTS[:args.instruments]), args.ticks, mean_gap_ms=100, seed=args.seed)
+        print(f"generated {args.ticks * args.instruments:,} ticks in {time.perf_counter() - start:.1f}s")
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        runner = TickBacktestRunner(
+            UnderlyingBreakout, TickStore(directory), INSTRUMENTS[0][0],
+            stop_loss=StopLossEngine(mode="trailing", trail_pct=0.1),
+            fill_simulator=FillSimulator(max_participation=0.2),
+            max_hold_seconds=1800
+        )
+        summary = runner.run({"lot_size": 75, "underlying_symbol": INSTRUMENTS[0][0]})
+        stats = runner.stats
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(f"replayed {stats['ticks']:,} ticks, {stats['bars']} bars, {stats['orders']} orders in {stats['elapsed_s']:.2f}s")
+    print(f"throughput: {stats['ticks_per_sec']:,} ticks/s")
+    print(f"peak RSS growth during replay: {(rss_after - rss_before) / 1024:.1f} MB")
+    print(f"trades: {summary['trade_count']}  total pnl: {summary['total_pnl']:.2f}")
+    if stats["ticks_per_sec"] < args.min_rate:
+        print(f"REGRESSION: {stats['ticks_per_sec']:,} ticks/s below required {args.min_rate:,.0f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
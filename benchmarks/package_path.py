@@ -0,0 +1,39 @@
+"""
+package_path.py
+Lets the benchmark scripts `import edgeX` whatever the checkout directory is called.
+"""
+
+import atexit
+import os
+import sys
+import tempfile
+from typing import Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "edgeX"
+
+def package_parent() -> Tuple[str, str]:
+    """
+    Returns a directory whose `edgeX` entry is this checkout, creating a temporary
+    symlink when the repository is not checked out under that name.
+    """
+    if os.path.basename(REPO_ROOT) == PACKAGE:
+        return os.path.dirname(REPO_ROOT), ""
+    tmp = tempfile.mkdtemp(prefix="edgex_bench_")
+    os.symlink(REPO_ROOT, os.path.join(tmp, PACKAGE))
+    return tmp, tmp
+
+def remove_package_parent(cleanup: str) -> None:
+    if cleanup:
+        os.unlink(os.path.join(cleanup, PACKAGE))
+        os.rmdir(cleanup)
+
+def add_package_to_path() -> str:
+    """
+    Put the package parent first on sys.path (the temporary symlink is removed at exit).
+    """
+    parent, cleanup = package_parent()
+    sys.path.insert(0, parent)
+    if cleanup:
+        atexit.register(remove_package_parent, cleanup)
+    return parent
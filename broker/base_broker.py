@@ -0,0 +1,30 @@
+"""
+base_broker.py
+Broker factory used by the engine; resolves the `broker:` config section to a connector.
+Connector modules are imported only when selected.
+"""
+
+import importlib
+from typing import Any, Dict
+
+BROKERS = {
+    "zerodha": "edgeX.broker.zerodha_connector:ZerodhaConnector",
+}
+
+def get_broker(broker_config: Dict[str, Any], logger=None, kite=None):
+    """
+    broker_config example:
+        broker:
+          name: zerodha
+          config_path: config/zerodha.yaml
+    """
+    name = broker_config.get("name", "zerodha")
+    if name not in BROKERS:
+        raise ValueError(f"Unknown broker '{name}'. Supported: {sorted(BROKERS)}")
+    module_path, _, class_name = BROKERS[name].partition(":")
+    connector_class = getattr(importlib.import_module(module_path), class_name)
+    if logger:
+        logger.info(f"Using broker connector {class_name}")
+    if kite is not None:
+        return connector_class(broker_config.get("config_path", "config/zerodha.yaml"), kite=kite)
+    return connector_class(broker_config.get("config_path", "config/zerodha.yaml"))
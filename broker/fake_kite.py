@@ -0,0 +1,173 @@
+"""
+fake_kite.py
+Local stand-in for kiteconnect.KiteConnect used by session replays.
+Serves recorded candles through historical_data()/ltp() up to the current time of an injected
+clock (never beyond it), and accepts orders as immediately complete at the last known price.
+Only the calls EdgeX makes are implemented; each call's own time is tracked so replays can
+report engine latency net of the fake broker.
+"""
+
+import itertools
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+INTERVAL_MINUTES = {
+    "minute": 1, "3minute": 3, "5minute": 5, "10minute": 10,
+    "15minute": 15, "30minute": 30, "60minute": 60, "day": 1440,
+}
+
+class FakeKite:
+    def __init__(
+        self,
+        bars: Dict[int, pd.DataFrame],
+        clock,
+        symbols: Optional[Dict[str, int]] = None,
+        tz: str = "Asia/Kolkata",
+        logger=None
+    ):
+        """
+        bars: instrument_token -> OHLCV candles indexed by candle start time.
+        symbols: quote symbol (e.g. "NSE:NIFTY 50") -> instrument_token, for ltp().
+        """
+        self.clock = clock
+        self.symbols = dict(symbols or {})
+        self.tz = tz
+        self.logger = logger
+        self._frames: Dict[tuple, Dict[str, np.ndarray]] = {}
+        self._source: Dict[int, pd.DataFrame] = {}
+        for token, df in bars.items():
+            index = df.index if df.index.tz is not None else df.index.tz_localize(tz)
+            df = df.set_axis(index.tz_convert(tz)).sort_index()
+            self._source[token] = df
+            step = int(np.median(np.diff(df.index.as_unit("ns").asi8))) if len(df) > 1 else 60 * 10**9
+            self._frames[(token, None)] = self._columns(df, step)
+        self.order_book: List[Dict[str, Any]] = []
+        self._order_ids = itertools.count(250_000_000_000_000)
+        self.calls = defaultdict(int)
+        self.call_seconds = 0.0
+
+    @staticmethod
+    def _columns(df: pd.DataFrame, step_ns: int) -> Dict[str, np.ndarray]:
+        cols = {c: df[c].to_numpy(dtype=np.float64) for c in ("open", "high", "low", "close")}
+        cols["volume"] = df["volume"].to_numpy(dtype=np.float64) if "volume" in df else np.zeros(len(df))
+        cols["start"] = df.index.as_unit("ns").asi8
+        cols["step"] = step_ns
+        cols["dates"] = df.index
+        return cols
+
+    def _frame(self, token: int, interval: str) -> Dict[str, np.ndarray]:
+        base = self._frames[(token, None)]
+        minutes = INTERVAL_MINUTES.get(interval)
+        if minutes is None or minutes * 60 * 10**9 == base["step"]:
+            return base
+        key = (token, interval)
+        if key not in self._frames:
+            rule = "1D" if interval == "day" else f"{minutes}min"
+            # Candles are anchored at the NSE open (09:15), as Kite does
+            df = self._source[token].resample(rule, origin="start_day", offset="9h15min" if interval != "day" else None).agg(
+                {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+            ).dropna(subset=["close"])
+            self._frames[key] = self._columns(df, minutes * 60 * 10**9)
+        return self._frames[key]
+
+    def _now_ns(self) -> int:
+        return int(self.clock.time() * 1e9)
+
+    def _track(self, name: str, started: float) -> None:
+        self.calls[name] += 1
+        self.call_seconds += time.perf_counter() - started
+
+    # ---- KiteConnect API surface used by EdgeX --------------------------------------
+
+    def set_access_token(self, access_token: str) -> None:
+        pass
+
+    def generate_session(self, request_token: str, api_secret: str) -> Dict[str, Any]:
+        return {"access_token": "replay"}
+
+    def historical_data(self, instrument_token, from_date, to_date, interval, continuous=False, oi=False) -> List[Dict[str, Any]]:
+        started = time.perf_counter()
+        frame = self._frame(instrument_token, interval)
+        lo_ts = pd.Timestamp(from_date)
+        hi_ts = pd.Timestamp(to_date)
+        lo_ts = lo_ts.tz_localize(self.tz) if lo_ts.tz is None else lo_ts
+        hi_ts = hi_ts.tz_localize(self.tz) if hi_ts.tz is None else hi_ts
+        if len(str(to_date)) <= 10:
+            hi_ts += pd.Timedelta(days=1)
+        start = frame["start"]
+        lo = int(np.searchsorted(start, lo_ts.value, side="left"))
+        hi = int(np.searchsorted(start, hi_ts.value, side="right"))
+        # Only candles that have closed by the clock's "now"
+        hi = min(hi, int(np.searchsorted(start + frame["step"], self._now_ns(), side="right")))
+        rows = [
+            {"date": d, "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for d, o, h, l, c, v in zip(
+                frame["dates"][lo:hi], frame["open"][lo:hi].tolist(), frame["high"][lo:hi].tolist(),
+                frame["low"][lo:hi].tolist(), frame["close"][lo:hi].tolist(), frame["volume"][lo:hi].tolist()
+            )
+        ] if hi > lo else []
+        self._track("historical_data", started)
+        return rows
+
+    def _last_price(self, token: int) -> Optional[float]:
+        frame = self._frames[(token, None)]
+        i = int(np.searchsorted(frame["start"], self._now_ns(), side="right")) - 1
+        return float(frame["close"][i]) if i >= 0 else None
+
+    def ltp(self, *instruments) -> Dict[str, Dict[str, Any]]:
+        started = time.perf_counter()
+        if len(instruments) == 1 and isinstance(instruments[0], (list, tuple)):
+            instruments = instruments[0]
+        out = {}
+        for inst in instruments:
+            token = self.symbols.get(inst)
+            price = self._last_price(token) if token is not None else None
+            if price is not None:
+                out[inst] = {"instrument_token": token, "last_price": price}
+        self._track("ltp", started)
+        return out
+
+    def place_order(self, variety, exchange, tradingsymbol, transaction_type, quantity, product, order_type, price=None, **kwargs) -> str:
+        started = time.perf_counter()
+        order_id = str(next(self._order_ids))
+        self.order_book.append({
+            "order_id": order_id,
+            "order_timestamp": self.clock.now(),
+            "variety": variety,
+            "exchange": exchange,
+            "tradingsymbol": tradingsymbol,
+            "transaction_type": transaction_type,
+            "quantity": quantity,
+            "product": product,
+            "order_type": order_type,
+            "price": price or 0,
+            "status": "COMPLETE",
+            "filled_quantity": quantity,
+        })
+        self._track("place_order", started)
+        return order_id
+
+    def orders(self) -> List[Dict[str, Any]]:
+        self.calls["orders"] += 1
+        return list(self.order_book)
+
+    def positions(self) -> Dict[str, List[Dict[str, Any]]]:
+        self.calls["positions"] += 1
+        net = defaultdict(int)
+        for order in self.order_book:
+            if order["status"] == "COMPLETE":
+                sign = 1 if order["transaction_type"] == "BUY" else -1
+                net[(order["exchange"], order["tradingsymbol"], order["product"])] += sign * order["quantity"]
+        rows = [{"exchange": e, "tradingsymbol": s, "product": p, "quantity": q} for (e, s, p), q in net.items()]
+        return {"net": rows, "day": rows}
+
+    def cancel_order(self, variety, order_id, **kwargs) -> str:
+        self.calls["cancel_order"] += 1
+        for order in self.order_book:
+            if order["order_id"] == order_id and order["status"] != "COMPLETE":
+                order["status"] = "CANCELLED"
+        return order_id
@@ -6,19 +6,22 @@ Extensible broker interface for Zerodha KiteConnect.
 import os
 import logging
 from typing import Optional, Dict, Any
-from kiteconnect import KiteConnect
 from edgeX.utils.config_loader import load_config
 from edgeX.utils.logger import get_logger
 
 class ZerodhaConnector:
-    def __init__(self, broker_config_path: str = 'config/zerodha.yaml'):
+    def __init__(self, broker_config_path: str = 'config/zerodha.yaml', kite=None):
         self.logger = get_logger("ZerodhaConnector")
-        self.config = load_config(broker_config_path)
+        # An injected client (e.g. FakeKite for replays) needs no credentials file
+        self.config = load_config(broker_config_path) if kite is None else {}
         self.api_key = self.config.get('api_key')
         self.api_secret = self.config.get('api_secret', '')
         self.access_token = self.config.get('access_token', '')
         self.request_token = self.config.get('request_token', '')
-        self.kite = KiteConnect(api_key=self.api_key)
+        if kite is None:
+            from kiteconnect import KiteConnect
+            kite = KiteConnect(api_key=self.api_key)
+        self.kite = kite
         if self.access_token:
             self.kite.set_access_token(self.access_token)
             self.logger.info("Access token loaded.")
@@ -69,7 +72,7 @@ class ZerodhaConnector:
             if stoploss:
                 params["stoploss"] = stoploss
             order_resp = self.kite.place_order(**params)
-            self.logger.info(f"Order placed: {order_resp}")
+            self.logger.info("Order placed: %s", order_resp)
             return order_resp
         except Exception as e:
             self.logger.error(f"Order placement failed: {e}", exc_info=True)
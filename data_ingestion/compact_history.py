@@ -0,0 +1,259 @@
+"""
+compact_history.py
+Compact in-memory / on-disk format for long multi-instrument candle histories.
+Rows of all instruments live in one long table grouped by instrument: prices as scaled int32
+ticks (or float32), volume/OI in the smallest integer type that fits, instruments as integer ids,
+and timestamps as int32 indices into one shared minute axis instead of a DatetimeIndex per frame.
+Per-instrument data are contiguous slices, so float64 columns for indicators are produced in a
+single vectorized pass (optionally into a caller's buffer), and saved histories memory-map back.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+PRICE_FIELDS = ("open", "high", "low", "close")
+COUNT_FIELDS = ("volume", "oi")
+META_FILE = "history.json"
+MINUTE_NS = 60 * 10**9
+
+def int_dtype(max_value: int, min_value: int = 0) -> np.dtype:
+    """
+    Smallest integer dtype holding [min_value, max_value].
+    """
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64) if min_value >= 0 else (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= min_value and max_value <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+class CompactHistory:
+    def __init__(
+        self,
+        symbols,
+        axis: np.ndarray,
+        offsets: np.ndarray,
+        ts_idx: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        price_mode: str = "ticks",
+        tick_size: float = 0.05,
+        tz: str = "Asia/Kolkata",
+        logger=None
+    ):
+        """
+        axis: shared minute axis (int64 minutes since epoch); rows offsets[i]:offsets[i+1] belong to
+        symbols[i], with ts_idx pointing into axis. Use from_frames()/from_cache()/load() to build one.
+        """
+        self.symbols = list(symbols)
+        self.ids = {s: i for i, s in enumerate(self.symbols)}
+        self.axis = axis
+        self.offsets = offsets
+        self.ts_idx = ts_idx
+        self.columns = columns
+        self.price_mode = price_mode
+        self.tick_size = tick_size
+        self.tz = tz
+        self.logger = logger
+        self.source_bytes = None
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Dict[str, pd.DataFrame],
+        price_mode: str = "ticks",
+        tick_size: float = 0.05,
+        tz: str = "Asia/Kolkata",
+        logger=None
+    ) -> "CompactHistory":
+        """
+        Build from {symbol: OHLCV(+oi) DataFrame indexed by candle time}. Candles must fall on
+        whole minutes. price_mode "ticks" stores int32 multiples of tick_size and raises if a
+        price is off the grid; "float32" stores prices as they are.
+        """
+        if price_mode not in ("ticks", "float32"):
+            raise ValueError(f"Unknown price_mode '{price_mode}'")
+        symbols = list(frames)
+        minutes, lengths = [], []
+        for df in frames.values():
+            index = df.index if df.index.tz is not None else df.index.tz_localize(tz)
+            ns = index.as_unit("ns").asi8
+            if np.any(ns % MINUTE_NS):
+                raise ValueError("candle timestamps must fall on whole minutes")
+            minutes.append(ns // MINUTE_NS)
+            lengths.append(len(df))
+        all_minutes = np.concatenate(minutes) if minutes else np.empty(0, dtype=np.int64)
+        axis = np.unique(all_minutes)
+        if len(axis) >= 2**31:
+            raise ValueError("shared time axis too long for int32 indices")
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        ts_idx = np.searchsorted(axis, all_minutes).astype(np.int32)
+
+        columns = {}
+        for field in PRICE_FIELDS:
+            values = np.concatenate([df[field].to_numpy(dtype=np.float64) for df in frames.values()]) if frames else np.empty(0)
+            if price_mode == "ticks":
+                if np.isnan(values).any():
+                    raise ValueError(f"{field} has missing prices; use price_mode='float32'")
+                ticks = np.round(values / tick_size)
+                if np.max(np.abs(ticks * tick_size - values), initial=0.0) > tick_size * 1e-6:
+                    raise ValueError(f"{field} prices are not multiples of tick_size {tick_size}; use price_mode='float32'")
+                if np.max(np.abs(ticks), initial=0.0) > np.iinfo(np.int32).max:
+                    raise ValueError(f"{field} prices overflow int32 ticks")
+                columns[field] = ticks.astype(np.int32)
+            else:
+                columns[field] = values.astype(np.float32)
+        for field in COUNT_FIELDS:
+            if not all(field in df for df in frames.values()) or not frames:
+                continue
+            values = np.concatenate([df[field].to_numpy(dtype=np.int64) for df in frames.values()])
+            columns[field] = values.astype(int_dtype(int(values.max(initial=0)), int(values.min(initial=0))))
+
+        history = cls(symbols, axis, offsets, ts_idx, columns, price_mode, tick_size, tz, logger)
+        history.source_bytes = int(sum(df.memory_usage(index=True, deep=True).sum() for df in frames.values()))
+        if logger:
+            logger.info(f"[CompactHistory] Packed {len(ts_idx)} candles of {len(symbols)} instruments on {len(axis)} timestamps")
+        return history
+
+    @classmethod
+    def from_cache(
+        cls,
+        cache_dir: str = "data/intraday",
+        symbols: Optional[Iterable[str]] = None,
+        price_mode: str = "ticks",
+        tick_size: float = 0.05,
+        tz: str = "Asia/Kolkata",
+        logger=None
+    ) -> "CompactHistory":
+        """
+        Load {symbol}_intraday.csv files (MarketDataFetcher cache layout) one at a time, so peak
+        memory is the compact history plus a single float64 frame.
+        """
+        if symbols is None:
+            symbols = sorted(f[:-len("_intraday.csv")] for f in os.listdir(cache_dir) if f.endswith("_intraday.csv"))
+        symbols = list(symbols)
+        if not symbols:
+            raise ValueError(f"No *_intraday.csv files to load from '{cache_dir}'")
+        parts = {}
+        source_bytes = 0
+        for symbol in symbols:
+            df = pd.read_csv(os.path.join(cache_dir, f"{symbol}_intraday.csv"), parse_dates=["date"], index_col="date")
+            source_bytes += int(df.memory_usage(index=True, deep=True).sum())
+            # Pack each file on its own, then merge the compact parts
+            parts[symbol] = cls.from_frames({symbol: df}, price_mode, tick_size, tz)
+        history = cls.concat(list(parts.values()), logger=logger)
+        history.source_bytes = source_bytes
+        return history
+
+    @classmethod
+    def concat(cls, parts, logger=None) -> "CompactHistory":
+        """
+        Merge histories of disjoint instruments onto one shared axis.
+        """
+        if not parts:
+            raise ValueError("concat needs at least one history")
+        first = parts[0]
+        axis = np.unique(np.concatenate([p.axis for p in parts]))
+        ts_idx = np.concatenate([np.searchsorted(axis, p.axis[p.ts_idx]).astype(np.int32) for p in parts])
+        lengths = np.concatenate([np.diff(p.offsets) for p in parts])
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        columns = {}
+        for field in first.columns:
+            if all(field in p.columns for p in parts):
+                columns[field] = np.concatenate([p.columns[field] for p in parts])
+                if field in COUNT_FIELDS:
+                    values = columns[field]
+                    columns[field] = values.astype(int_dtype(int(values.max(initial=0)), int(values.min(initial=0))))
+        symbols = [s for p in parts for s in p.symbols]
+        return cls(symbols, axis, offsets, ts_idx, columns, first.price_mode, first.tick_size, first.tz, logger)
+
+    def save(self, directory: str) -> None:
+        """
+        One .npy file per array plus a JSON manifest; load() memory-maps them back.
+        """
+        os.makedirs(directory, exist_ok=True)
+        arrays = {"axis": self.axis, "offsets": self.offsets, "ts_idx": self.ts_idx, **self.columns}
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+        meta = {"symbols": self.symbols, "columns": list(self.columns), "price_mode": self.price_mode,
+                "tick_size": self.tick_size, "tz": self.tz}
+        tmp = os.path.join(directory, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(directory, META_FILE))
+        if self.logger:
+            self.logger.info(f"[CompactHistory] Saved {len(self.symbols)} instruments to {directory}")
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True, logger=None) -> "CompactHistory":
+        with open(os.path.join(directory, META_FILE)) as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        read = lambda name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode)
+        columns = {name: read(name) for name in meta["columns"]}
+        return cls(meta["symbols"], read("axis"), read("offsets"), read("ts_idx"), columns,
+                   meta["price_mode"], meta["tick_size"], meta["tz"], logger)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ts_idx)
+
+    def _rows(self, symbol: str) -> slice:
+        i = self.ids[symbol]
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def index(self, symbol: str) -> pd.DatetimeIndex:
+        minutes = self.axis[self.ts_idx[self._rows(symbol)]]
+        return pd.DatetimeIndex((minutes * MINUTE_NS).astype("datetime64[ns]")).tz_localize("UTC").tz_convert(self.tz).rename("date")
+
+    def column(self, symbol: str, field: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        float64 values of one field for one instrument, decoded in a single pass. Pass `out` to
+        decode into an existing buffer (e.g. reused across instruments) instead of allocating.
+        """
+        raw = self.columns[field][self._rows(symbol)]
+        if out is None:
+            out = np.empty(len(raw), dtype=np.float64)
+        if field in PRICE_FIELDS and self.price_mode == "ticks":
+            np.multiply(raw, self.tick_size, out=out, casting="unsafe")
+        else:
+            out[:] = raw
+        return out
+
+    def frame(self, symbol: str, fields: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        float64 OHLCV frame for strategies and BacktestRunner, built without intermediate copies.
+        """
+        fields = [f for f in (fields or (*PRICE_FIELDS, *COUNT_FIELDS)) if f in self.columns]
+        return pd.DataFrame({f: self.column(symbol, f) for f in fields}, index=self.index(symbol), copy=False)
+
+    def nbytes(self) -> int:
+        return int(sum(a.nbytes for a in (self.axis, self.offsets, self.ts_idx, *self.columns.values())))
+
+    def memory_report(self) -> Dict[str, object]:
+        """
+        Compact size per array against the same data as default pandas frames (float64 columns
+        and an int64 DatetimeIndex per instrument). source_bytes is the measured size of the
+        frames this history was built from, when known.
+        """
+        rows = len(self.ts_idx)
+        pandas_bytes = rows * 8 * (len(self.columns) + 1)
+        compact = self.nbytes()
+        report = {
+            "instruments": len(self.symbols),
+            "rows": rows,
+            "timestamps": len(self.axis),
+            "arrays": {name: f"{a.dtype} {a.nbytes}" for name, a in
+                       {"axis": self.axis, "offsets": self.offsets, "ts_idx": self.ts_idx, **self.columns}.items()},
+            "compact_bytes": compact,
+            "pandas_bytes": pandas_bytes,
+            "source_bytes": self.source_bytes,
+            "ratio": round(pandas_bytes / compact, 2) if compact else None,
+        }
+        if self.logger:
+            self.logger.info(f"[CompactHistory] {compact / 2**20:.1f} MB compact vs {pandas_bytes / 2**20:.1f} MB as pandas frames")
+        return report
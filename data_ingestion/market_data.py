@@ -7,38 +7,43 @@ Supports:
 """
 
 import datetime as dt
-import pandas as pd
 import os
 import logging
-from kiteconnect import KiteConnect
+from typing import TYPE_CHECKING
 
 from edgeX.utils.config_loader import load_config
 from edgeX.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class MarketDataFetcher:
     """
     Fetches historical and live market data from Zerodha (or other sources).
     Implements local caching and basic preprocessing.
     """
 
-    def __init__(self, broker_config_path: str = "config/zerodha.yaml", cache_dir: str = "data/intraday"):
+    def __init__(self, broker_config_path: str = "config/zerodha.yaml", cache_dir: str = "data/intraday", kite=None):
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
 
-        # Load configs
-        config = load_config(broker_config_path)
+        # Load configs (not needed when a client such as FakeKite is injected)
+        config = load_config(broker_config_path) if kite is None else {}
         self.api_key = config.get("api_key")
         self.access_token = config.get("access_token")
 
-        # Setup KiteConnect
-        self.kite = KiteConnect(api_key=self.api_key)
+        # Setup KiteConnect (imported here so start-up only pays for it when a fetcher is built)
+        if kite is None:
+            from kiteconnect import KiteConnect
+            kite = KiteConnect(api_key=self.api_key)
+        self.kite = kite
         if self.access_token:
             self.kite.set_access_token(self.access_token)
 
         self.logger = get_logger(__name__)
         self.logger.info(f"MarketDataFetcher initialized with cache dir: {self.cache_dir}")
 
-    def fetch_historical(self, instrument_token: int, from_date: str, to_date: str, interval: str = "5minute") -> pd.DataFrame:
+    def fetch_historical(self, instrument_token: int, from_date: str, to_date: str, interval: str = "5minute") -> "pd.DataFrame":
         """
         Fetch historical OHLC data from Zerodha API
         Args:
@@ -49,7 +54,8 @@ class MarketDataFetcher:
         Returns:
             pd.DataFrame: OHLCV data
         """
-        self.logger.info(f"Requesting historical data: token={instrument_token} from={from_date} to={to_date} interval={interval}")
+        import pandas as pd
+        self.logger.info("Requesting historical data: token=%s from=%s to=%s interval=%s", instrument_token, from_date, to_date, interval)
 
         try:
             data = self.kite.historical_data(
@@ -63,7 +69,7 @@ class MarketDataFetcher:
             if not df.empty:
                 df['date'] = pd.to_datetime(df['date'])
                 df.set_index('date', inplace=True)
-                self.logger.info(f"Fetched {len(df)} rows of historical data.")
+                self.logger.info("Fetched %d rows of historical data.", len(df))
             return df
         except Exception as e:
             self.logger.error(f"Error fetching historical data: {e}", exc_info=True)
@@ -77,16 +83,16 @@ class MarketDataFetcher:
         Returns:
             dict: {symbol: {'last_price': float, 'timestamp': datetime}}
         """
-        self.logger.debug(f"Fetching LTP for instruments: {instruments}")
+        self.logger.debug("Fetching LTP for instruments: %s", instruments)
         try:
             ltp_data = self.kite.ltp(instruments)
-            self.logger.debug(f"LTP data: {ltp_data}")
+            self.logger.debug("LTP data: %s", ltp_data)
             return ltp_data
         except Exception as e:
             self.logger.error(f"Error fetching LTP: {e}", exc_info=True)
             return {}
 
-    def cache_intraday_data(self, symbol: str, df: pd.DataFrame):
+    def cache_intraday_data(self, symbol: str, df: "pd.DataFrame"):
         """
         Save intraday data locally for redundancy/recovery or later replay.
         """
@@ -94,10 +100,11 @@ class MarketDataFetcher:
         df.to_csv(file_path)
         self.logger.info(f"Intraday data for {symbol} cached at {file_path}")
 
-    def load_cached_intraday(self, symbol: str) -> pd.DataFrame:
+    def load_cached_intraday(self, symbol: str) -> "pd.DataFrame":
         """
         Load locally cached intraday data.
         """
+        import pandas as pd
         file_path = os.path.join(self.cache_dir, f"{symbol}_intraday.csv")
         if os.path.exists(file_path):
             return pd.read_csv(file_path, parse_dates=['date'])
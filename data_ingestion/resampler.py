@@ -0,0 +1,260 @@
+"""
+resampler.py
+Incremental multi-timeframe candles from a single base interval.
+BarResampler keeps a bounded history of base candles (e.g. 1-minute) per instrument and folds
+them into every subscribed higher timeframe, bucketed from the NSE open (09:15) and cut at the
+close (15:30), the way Kite builds its own candles. New base candles only touch the buckets they
+fall in, so strategies on 1-, 5- and 15-minute bars share one broker fetch.
+pandas is only imported where frames and timestamps are built, keeping it off the bot's import path.
+"""
+
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from edgeX.data_ingestion.sessions import SESSION_MINUTES, SESSION_OPEN, interval_minutes
+
+MINUTE_NS = 60 * 10**9
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+class _BarSeries:
+    """
+    Append-only candle arrays holding the last `capacity` rows. Storage is twice the capacity and
+    compacted when full, so appends are amortized O(1) and the live rows stay one contiguous view.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = np.empty(2 * capacity, dtype=np.int64)
+        self.values = np.empty((2 * capacity, len(COLUMNS)), dtype=np.float64)
+        self.lo = 0
+        self.hi = 0
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def last_ts(self) -> Optional[int]:
+        return int(self.ts[self.hi - 1]) if self.hi > self.lo else None
+
+    def extend(self, ts: np.ndarray, values: np.ndarray) -> None:
+        if len(ts) >= self.capacity:
+            ts, values = ts[-self.capacity:], values[-self.capacity:]
+            self.lo = self.hi = 0
+        elif self.hi + len(ts) > len(self.ts):
+            keep = min(len(self), self.capacity - len(ts))
+            self.ts[:keep] = self.ts[self.hi - keep:self.hi]
+            self.values[:keep] = self.values[self.hi - keep:self.hi]
+            self.lo, self.hi = 0, keep
+        n = len(ts)
+        self.ts[self.hi:self.hi + n] = ts
+        self.values[self.hi:self.hi + n] = values
+        self.hi += n
+        if len(self) > self.capacity:
+            self.lo = self.hi - self.capacity
+
+    def replace_last(self, values: np.ndarray) -> None:
+        self.values[self.hi - 1] = values
+
+    def view(self):
+        return self.ts[self.lo:self.hi], self.values[self.lo:self.hi]
+
+class BarResampler:
+    def __init__(
+        self,
+        base_interval: str = "minute",
+        capacity: int = 5000,
+        tz: str = "Asia/Kolkata",
+        logger=None
+    ):
+        """
+        capacity bounds the candles kept per instrument and timeframe (base included); it must
+        cover the longest subscribed bucket in base candles (375 one-minute candles for "day").
+        """
+        self.base_interval = base_interval
+        self.base_ns = interval_minutes(base_interval) * MINUTE_NS
+        self.capacity = capacity
+        self.tz = tz
+        self.logger = logger
+        self._base: Dict[int, _BarSeries] = {}
+        self._series: Dict[int, Dict[str, _BarSeries]] = {}
+        # token -> interval -> start (ns) of the first bucket not yet completed
+        self._pending: Dict[int, Dict[str, Optional[int]]] = {}
+        self._callbacks: List[Callable] = []
+
+    def subscribe(self, token: int, intervals, callback: Optional[Callable] = None) -> None:
+        """
+        Track `intervals` for an instrument. A timeframe added later is backfilled from the base
+        candles still held. callback(token, interval, ts_ns, values) fires per completed candle.
+        """
+        if callback is not None and callback not in self._callbacks:
+            self._callbacks.append(callback)
+        series = self._series.setdefault(token, {})
+        pending = self._pending.setdefault(token, {})
+        self._base.setdefault(token, _BarSeries(self.capacity))
+        for interval in intervals:
+            if interval == self.base_interval or interval in series:
+                continue
+            minutes = interval_minutes(interval)
+            if (minutes * MINUTE_NS) % self.base_ns:
+                raise ValueError(f"{interval} is not a multiple of the base interval {self.base_interval}")
+            series[interval] = _BarSeries(self.capacity)
+            pending[interval] = None
+            self._advance(token, interval)
+
+    def intervals(self, token: int) -> List[str]:
+        return [self.base_interval] + list(self._series.get(token, {}))
+
+    def last_timestamp(self, token: int):
+        """
+        Start of the newest base candle held (pd.Timestamp), i.e. where the next incremental fetch
+        should begin.
+        """
+        import pandas as pd
+        base = self._base.get(token)
+        last = base.last_ts() if base is not None else None
+        return pd.Timestamp(last, tz="UTC").tz_convert(self.tz) if last is not None else None
+
+    def update(self, token: int, bars, now=None) -> int:
+        """
+        Feed base-interval candles (indexed by start time). Rows older than the newest candle held
+        are ignored and a row at the same start revises it, so overlapping fetches are safe.
+        Candles still forming at `now` (default: none are) only show up as partial bars.
+        Returns the number of higher-timeframe candles completed.
+        """
+        import pandas as pd
+        base = self._base.setdefault(token, _BarSeries(self.capacity))
+        self._series.setdefault(token, {})
+        self._pending.setdefault(token, {})
+        if bars is None or bars.empty:
+            return 0
+        index = bars.index if bars.index.tz is not None else bars.index.tz_localize(self.tz)
+        ts = index.as_unit("ns").asi8
+        values = np.column_stack([
+            bars[c].to_numpy(dtype=np.float64) if c in bars else np.zeros(len(bars)) for c in COLUMNS
+        ])
+        last = base.last_ts()
+        if last is not None:
+            keep = ts >= last
+            ts, values = ts[keep], values[keep]
+            if len(ts) and ts[0] == last:
+                base.replace_last(values[0])
+                ts, values = ts[1:], values[1:]
+        if len(ts):
+            base.extend(ts, values)
+        now_ns = pd.Timestamp(now).value if now is not None else None
+        return sum(self._advance(token, interval, now_ns) for interval in self._series[token])
+
+    def _buckets(self, ts: np.ndarray, interval: str):
+        """
+        (bucket_start, bucket_end) per base timestamp, aligned to the session open.
+        """
+        import pandas as pd
+        midnight = pd.DatetimeIndex(ts.astype("datetime64[ns]")).tz_localize("UTC").tz_convert(self.tz).normalize()
+        open_ns = (midnight + pd.Timedelta(f"{SESSION_OPEN}:00")).as_unit("ns").asi8
+        close_ns = open_ns + SESSION_MINUTES * MINUTE_NS
+        if interval == "day":
+            # Kite labels daily candles with the date at 00:00
+            return midnight.as_unit("ns").asi8, close_ns
+        span = interval_minutes(interval) * MINUTE_NS
+        start = open_ns + (ts - open_ns) // span * span
+        return start, np.minimum(start + span, np.maximum(close_ns, start + self.base_ns))
+
+    def _advance(self, token: int, interval: str, now_ns: Optional[int] = None) -> int:
+        base_ts, base_values = self._base[token].view()
+        if not len(base_ts):
+            return 0
+        pending = self._pending[token][interval]
+        lo = int(np.searchsorted(base_ts, pending)) if pending is not None else 0
+        ts, values = base_ts[lo:], base_values[lo:]
+        if not len(ts):
+            return 0
+        # Everything up to the end of the newest closed base candle is final
+        closed_end = ts[-1] + self.base_ns
+        if now_ns is not None and closed_end > now_ns:
+            closed_end = ts[-1]
+        starts, ends = self._buckets(ts, interval)
+        bounds = np.concatenate([[0], np.flatnonzero(np.diff(starts)) + 1, [len(ts)]])
+        n_done = int(np.count_nonzero(ends[bounds[:-1]] <= closed_end))
+        if not n_done:
+            return 0
+        first, stop = bounds[:n_done], int(bounds[n_done])
+        done = np.column_stack([
+            values[first, 0],
+            np.maximum.reduceat(values[:stop, 1], first),
+            np.minimum.reduceat(values[:stop, 2], first),
+            values[np.append(first[1:], stop) - 1, 3],
+            np.add.reduceat(values[:stop, 4], first),
+        ])
+        done_ts = starts[first]
+        self._series[token][interval].extend(done_ts, done)
+        self._pending[token][interval] = int(ts[stop]) if stop < len(ts) else int(ts[-1]) + 1
+        for callback in self._callbacks:
+            for bucket_ts, row in zip(done_ts.tolist(), done):
+                callback(token, interval, bucket_ts, row)
+        return n_done
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Flat {name: array} snapshot of every held candle and pending bucket, for checkpoints.
+        """
+        state = {}
+        for token, base in self._base.items():
+            state[f"{token}/base/ts"], state[f"{token}/base/values"] = base.view()
+            for interval, series in self._series.get(token, {}).items():
+                state[f"{token}/{interval}/ts"], state[f"{token}/{interval}/values"] = series.view()
+                pending = self._pending[token][interval]
+                state[f"{token}/{interval}/pending"] = np.array([-1 if pending is None else pending], dtype=np.int64)
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Restore a get_state() snapshot taken with the same base interval.
+        """
+        for name in state:
+            token, interval, field = name.rsplit("/", 2)
+            if field != "ts":
+                continue
+            token = int(token)
+            series = _BarSeries(self.capacity)
+            series.extend(state[name], state[f"{token}/{interval}/values"])
+            if interval == "base":
+                self._base[token] = series
+                self._series.setdefault(token, {})
+                self._pending.setdefault(token, {})
+            else:
+                self._series.setdefault(token, {})[interval] = series
+                pending = int(state[f"{token}/{interval}/pending"][0])
+                self._pending.setdefault(token, {})[interval] = None if pending < 0 else pending
+
+    def _partial(self, token: int, interval: str):
+        base_ts, base_values = self._base[token].view()
+        pending = self._pending[token].get(interval)
+        lo = int(np.searchsorted(base_ts, pending)) if pending is not None else 0
+        if lo >= len(base_ts):
+            return None
+        values = base_values[lo:]
+        start = self._buckets(base_ts[lo:lo + 1], interval)[0][0]
+        row = [values[0, 0], values[:, 1].max(), values[:, 2].min(), values[-1, 3], values[:, 4].sum()]
+        return start, np.array(row)
+
+    def frame(self, token: int, interval: Optional[str] = None, include_partial: bool = False):
+        """
+        Candles of one timeframe as an OHLCV DataFrame indexed by candle start ("date").
+        include_partial appends the bucket still forming, as a live Kite candle request would.
+        """
+        import pandas as pd
+        interval = interval or self.base_interval
+        if interval == self.base_interval:
+            series = self._base.get(token)
+            partial = None
+        else:
+            series = self._series.get(token, {}).get(interval)
+            if series is None:
+                raise KeyError(f"{interval} candles are not subscribed for token {token}")
+            partial = self._partial(token, interval) if include_partial else None
+        ts, values = series.view() if series is not None else (np.empty(0, dtype=np.int64), np.empty((0, len(COLUMNS))))
+        if partial is not None:
+            ts = np.append(ts, partial[0])
+            values = np.vstack([values, partial[1]])
+        index = pd.DatetimeIndex(ts.astype("datetime64[ns]")).tz_localize("UTC").tz_convert(self.tz).rename("date")
+        return pd.DataFrame(values, index=index, columns=list(COLUMNS))
@@ -0,0 +1,17 @@
+"""
+sessions.py
+NSE session constants and Kite interval names, kept free of heavy imports so live code
+(resampler, strategy manager) and the test-data generators can share them.
+"""
+
+SESSION_OPEN = "09:15"
+SESSION_MINUTES = 375
+
+def interval_minutes(interval: str) -> int:
+    """
+    Kite interval name ("minute", "5minute", "day", ...) to minutes; a day is one session.
+    """
+    if interval == "day":
+        return SESSION_MINUTES
+    prefix = interval[:-len("minute")]
+    return int(prefix) if prefix else 1
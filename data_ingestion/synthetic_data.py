@@ -0,0 +1,263 @@
+"""
+synthetic_data.py
+Seedable synthetic market data for load tests and benchmarks.
+SyntheticMarket simulates correlated underlyings as GBM with Poisson jumps, a U-shaped intraday
+volatility/volume profile and overnight gaps between NSE sessions. Bars of any interval and the
+tick streams are cut from the same path, so they agree exactly. option_chain() prices NIFTY/SENSEX
+style weekly chains with an IV smile on top of that path.
+Output goes where the rest of EdgeX reads it: {symbol}_intraday.csv files for
+MarketDataFetcher.load_cached_intraday, DataFrames for BacktestRunner and a TickStore for replays.
+"""
+
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from edgeX.analytics.option_pricing import TRADING_DAYS, YEAR_NS, black_scholes, norm_cdf
+from edgeX.data_ingestion.sessions import SESSION_MINUTES, SESSION_OPEN, interval_minutes
+from edgeX.data_ingestion.tick_store import TickStore
+
+UNDERLYINGS = {
+    "NIFTY": {"quote": "NSE:NIFTY 50", "spot": 24500.0, "strike_step": 50, "lot_size": 75, "expiry_weekday": 3},
+    "SENSEX": {"quote": "BSE:SENSEX", "spot": 80500.0, "strike_step": 100, "lot_size": 20, "expiry_weekday": 1},
+}
+TICK_SIZE = 0.05
+# Weekly option symbols encode the month as 1-9, O, N, D (e.g. NIFTY2581424500CE)
+WEEKLY_MONTHS = "123456789OND"
+
+def intraday_profile(steps: int, open_boost: float = 1.5, close_boost: float = 0.8, decay: float = 0.08) -> np.ndarray:
+    """
+    U-shaped multiplier over one session (mean 1): high after the open, a midday lull and a
+    smaller pickup into the close. decay is the fraction of the session over which the boosts fade.
+    """
+    x = (np.arange(steps) + 0.5) / steps
+    shape = 1.0 + open_boost * np.exp(-x / decay) + close_boost * np.exp(-(1.0 - x) / decay)
+    return shape / shape.mean()
+
+class SyntheticMarket:
+    def __init__(
+        self,
+        symbols: Optional[Dict[str, float]] = None,
+        start_day: str = "2025-08-01",
+        days: int = 20,
+        annual_vol: float = 0.15,
+        correlation: float = 0.8,
+        jumps_per_day: float = 0.5,
+        jump_std: float = 0.004,
+        gap_vol: float = 0.004,
+        steps_per_minute: int = 6,
+        base_volume: float = 50_000,
+        tz: str = "Asia/Kolkata",
+        seed: int = 0,
+        logger=None
+    ):
+        """
+        symbols: name -> starting price (default: NIFTY and SENSEX at UNDERLYINGS levels).
+        steps_per_minute is the path resolution, and therefore the tick rate (6 = one tick per 10s).
+        """
+        if symbols is None:
+            symbols = {name: spec["spot"] for name, spec in UNDERLYINGS.items()}
+        self.symbols = list(symbols)
+        self.start_prices = np.array([symbols[s] for s in self.symbols], dtype=np.float64)
+        self.start_day = start_day
+        self.days = days
+        self.annual_vol = annual_vol
+        self.correlation = correlation
+        self.jumps_per_day = jumps_per_day
+        self.jump_std = jump_std
+        self.gap_vol = gap_vol
+        self.steps_per_minute = steps_per_minute
+        self.base_volume = base_volume
+        self.tz = tz
+        self.seed = seed
+        self.logger = logger
+        self._bars: Dict[str, Dict[str, pd.DataFrame]] = {}
+
+    def sessions(self) -> pd.DatetimeIndex:
+        first = np.datetime64(pd.Timestamp(self.start_day).date(), "D")
+        days = np.busday_offset(first, np.arange(self.days), roll="forward")
+        return pd.DatetimeIndex(days.astype("datetime64[ns]")).tz_localize(self.tz)
+
+    def _chol(self) -> np.ndarray:
+        n = len(self.symbols)
+        corr = np.full((n, n), self.correlation)
+        np.fill_diagonal(corr, 1.0)
+        return np.linalg.cholesky(corr)
+
+    def iter_days(self) -> Iterator[Tuple[pd.Timestamp, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Yield (session_day, ts_ns, prices, volume) per session: one tick per path step with
+        prices/volume shaped (n_symbols, steps). Each day draws from its own (seed, day) stream, so
+        extending `days` leaves the earlier sessions unchanged.
+        """
+        n = len(self.symbols)
+        steps = SESSION_MINUTES * self.steps_per_minute
+        step_ns = 60 * 10**9 // self.steps_per_minute
+        chol = self._chol()
+        profile = intraday_profile(steps)
+        sigma = self.annual_vol * np.sqrt(profile / (TRADING_DAYS * steps))
+        volume_scale = self.base_volume / self.steps_per_minute * profile
+        log_px = np.log(self.start_prices)
+        open_offset = pd.Timedelta(f"{SESSION_OPEN}:00")
+        for d, day in enumerate(self.sessions()):
+            rng = np.random.default_rng([self.seed, d])
+            incr = (chol @ rng.standard_normal((n, steps))) * sigma - 0.5 * sigma * sigma
+            # Market-wide jumps hit every symbol at the same step
+            k = rng.poisson(self.jumps_per_day)
+            if k:
+                np.add.at(incr, (slice(None), rng.integers(0, steps, k)), rng.normal(0.0, self.jump_std, k))
+            if d:
+                incr[:, 0] += (chol @ rng.standard_normal(n)) * self.gap_vol
+            path = log_px[:, None] + np.cumsum(incr, axis=1)
+            log_px = path[:, -1]
+            prices = np.round(np.exp(path) / TICK_SIZE) * TICK_SIZE
+            volume = np.maximum(1, volume_scale * rng.lognormal(-0.125, 0.5, (n, steps))).astype(np.int32)
+            # One tick somewhere inside each step's slot keeps timestamps strictly increasing
+            ts = (day + open_offset).value + np.arange(steps, dtype=np.int64) * step_ns
+            ts += (rng.random(steps) * step_ns).astype(np.int64)
+            yield day, ts, prices, volume
+
+    def bars(self, symbol: Optional[str] = None, interval: str = "minute"):
+        """
+        OHLCV candles indexed by candle start ("date", tz-aware), aligned to the 09:15 open.
+        Returns {symbol: DataFrame}, or one DataFrame when symbol is given. Cached per interval.
+        """
+        if interval not in self._bars:
+            minutes = interval_minutes(interval)
+            per_bar = minutes * self.steps_per_minute
+            steps = SESSION_MINUTES * self.steps_per_minute
+            starts = np.arange(0, steps, per_bar)
+            open_offset = pd.Timedelta(f"{SESSION_OPEN}:00")
+            parts = {s: [] for s in self.symbols}
+            index = []
+            for day, _, prices, volume in self.iter_days():
+                if interval == "day":
+                    index.append(pd.DatetimeIndex([day.normalize()]))
+                else:
+                    index.append(day + open_offset + pd.to_timedelta(starts // self.steps_per_minute, unit="min"))
+                ohlcv = np.stack([
+                    prices[:, starts],
+                    np.maximum.reduceat(prices, starts, axis=1),
+                    np.minimum.reduceat(prices, starts, axis=1),
+                    prices[:, np.append(starts[1:], steps) - 1],
+                    np.add.reduceat(volume, starts, axis=1, dtype=np.int64),
+                ], axis=-1)
+                for i, s in enumerate(self.symbols):
+                    parts[s].append(ohlcv[i])
+            dates = index[0].append(index[1:]).as_unit("ns").rename("date")
+            frames = {}
+            for s in self.symbols:
+                data = np.concatenate(parts[s])
+                df = pd.DataFrame(data[:, :4], index=dates, columns=["open", "high", "low", "close"])
+                df["volume"] = data[:, 4].astype(np.int64)
+                frames[s] = df
+            self._bars[interval] = frames
+            if self.logger:
+                self.logger.info(f"[SyntheticMarket] Built {len(dates)} {interval} bars for {len(self.symbols)} symbols")
+        frames = self._bars[interval]
+        return frames[symbol] if symbol is not None else frames
+
+    def quote(self, symbol: str) -> str:
+        return UNDERLYINGS.get(symbol, {}).get("quote", symbol)
+
+    def write_intraday_cache(self, cache_dir: str = "data/intraday", interval: str = "minute") -> List[str]:
+        """
+        Write {symbol}_intraday.csv files in MarketDataFetcher.cache_intraday_data's layout.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        paths = []
+        for symbol, df in self.bars(interval=interval).items():
+            path = os.path.join(cache_dir, f"{symbol}_intraday.csv")
+            df.to_csv(path)
+            paths.append(path)
+        if self.logger:
+            self.logger.info(f"[SyntheticMarket] Wrote {interval} bars to {paths}")
+        return paths
+
+    def write_ticks(self, store: TickStore) -> int:
+        """
+        Append every path step as a tick under the instrument's quote symbol ("NSE:NIFTY 50").
+        Written session by session, so memory stays flat. Returns the number of ticks written.
+        """
+        total = 0
+        for _, ts, prices, volume in self.iter_days():
+            for i, symbol in enumerate(self.symbols):
+                store.append(self.quote(symbol), ts, prices[i], volume[i])
+            total += ts.size * len(self.symbols)
+        if self.logger:
+            self.logger.info(f"[SyntheticMarket] Wrote {total} ticks to {store.directory}")
+        return total
+
+    def spot_at(self, symbol: str, at) -> Tuple[pd.Timestamp, float]:
+        """
+        (time, price) of the last minute close at or before `at`.
+        """
+        df = self.bars(symbol, "minute")
+        at = pd.Timestamp(at)
+        at = at.tz_localize(self.tz) if at.tz is None else at
+        # A candle's close is known at its end, one minute after its start label
+        i = int(df.index.searchsorted(at - pd.Timedelta(minutes=1), side="right")) - 1
+        if i < 0:
+            raise ValueError(f"{at} is before the first synthetic session")
+        return df.index[i] + pd.Timedelta(minutes=1), float(df["close"].iat[i])
+
+    def option_chain(
+        self,
+        symbol: str,
+        at,
+        n_strikes: int = 10,
+        n_expiries: int = 1,
+        atm_iv: Optional[float] = None,
+        skew: float = -0.1,
+        smile: float = 0.04,
+        rate: float = 0.065
+    ) -> pd.DataFrame:
+        """
+        CE/PE chain around the spot at `at`: n_strikes strikes either side of ATM for each of the
+        next n_expiries weekly expiries. IV per strike follows
+            iv = atm_iv * (1 + skew*m + smile*m^2),  m = ln(K/F) / (atm_iv*sqrt(T))
+        and is shared by the CE and PE of a strike, so the chain satisfies put-call parity.
+        """
+        spec = UNDERLYINGS.get(symbol, {})
+        step = spec.get("strike_step", 50)
+        when, spot = self.spot_at(symbol, at)
+        atm_iv = atm_iv if atm_iv is not None else self.annual_vol * 1.1
+
+        hour, minute = 15, 30
+        weekday = spec.get("expiry_weekday", 3)
+        first = when.normalize() + pd.Timedelta(days=(weekday - when.weekday()) % 7, hours=hour, minutes=minute)
+        if first <= when:
+            first += pd.Timedelta(days=7)
+        expiries = [first + pd.Timedelta(days=7 * k) for k in range(n_expiries)]
+
+        atm = round(spot / step) * step
+        strikes = atm + step * np.arange(-n_strikes, n_strikes + 1, dtype=np.float64)
+        t = np.array([(e.value - when.value) / YEAR_NS for e in expiries])[:, None]
+        forward = spot * np.exp(rate * t)
+        m = np.log(strikes[None, :] / forward) / (atm_iv * np.sqrt(t))
+        iv = np.maximum(atm_iv * (1.0 + skew * m + smile * m * m), 0.5 * atm_iv)
+
+        rows = []
+        for is_call, option_type in ((True, "CE"), (False, "PE")):
+            premium = black_scholes(spot, strikes[None, :], t, iv, rate, is_call)
+            d1 = (np.log(spot / strikes[None, :]) + (rate + 0.5 * iv * iv) * t) / (iv * np.sqrt(t))
+            delta = norm_cdf(d1) if is_call else norm_cdf(d1) - 1.0
+            for j, expiry in enumerate(expiries):
+                code = f"{expiry.year % 100:02d}{WEEKLY_MONTHS[expiry.month - 1]}{expiry.day:02d}"
+                rows.append(pd.DataFrame({
+                    "tradingsymbol": [f"{symbol}{code}{int(k)}{option_type}" for k in strikes],
+                    "expiry": expiry,
+                    "strike": strikes,
+                    "option_type": option_type,
+                    "iv": iv[j],
+                    "ltp": np.maximum(np.round(premium[j] / TICK_SIZE) * TICK_SIZE, TICK_SIZE),
+                    "delta": delta[j],
+                }))
+        chain = pd.concat(rows, ignore_index=True).sort_values(["expiry", "strike", "option_type"], ignore_index=True)
+        chain["underlying"] = symbol
+        chain["spot"] = spot
+        chain["lot_size"] = spec.get("lot_size", 1)
+        chain["timestamp"] = when
+        return chain
@@ -0,0 +1,191 @@
+"""
+tick_store.py
+Binary tick storage for replay backtests.
+Each instrument's ticks are appended to a flat file of fixed-size records (ts ns UTC, price,
+volume) and read back through np.memmap, so a replay touches only the pages it streams.
+iter_blocks() yields the ticks of many instruments in global timestamp order, block by block: each
+block takes every instrument's ticks up to the earliest look-ahead horizon and orders them with one
+stable sort.
+write_synthetic_ticks() fills a store with test data.
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from edgeX.data_ingestion.sessions import SESSION_MINUTES, SESSION_OPEN
+
+TICK_DTYPE = np.dtype([("ts", "<i8"), ("price", "<f8"), ("volume", "<i4")])
+MANIFEST = "ticks.json"
+
+def _file_name(symbol: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", symbol) + ".ticks"
+
+def _to_ns(value) -> Optional[int]:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tz is None:
+        ts = ts.tz_localize("UTC")
+    return ts.value
+
+class TickStore:
+    def __init__(self, directory: str, logger=None):
+        self.directory = directory
+        self.logger = logger
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, MANIFEST)
+        self.manifest: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.manifest = json.load(f)
+        self._maps: Dict[str, np.ndarray] = {}
+
+    def _save_manifest(self) -> None:
+        tmp = os.path.join(self.directory, MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(tmp, os.path.join(self.directory, MANIFEST))
+
+    def symbols(self) -> List[str]:
+        return list(self.manifest)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.manifest
+
+    def append(self, symbol: str, ts: np.ndarray, price: np.ndarray, volume: Optional[np.ndarray] = None) -> None:
+        """
+        Append ticks (ts in ns since epoch, UTC) for one instrument; they must not go back in time.
+        """
+        ts = np.asarray(ts, dtype=np.int64)
+        if not ts.size:
+            return
+        entry = self.manifest.setdefault(symbol, {"file": _file_name(symbol), "count": 0, "first_ts": None, "last_ts": None})
+        if np.any(np.diff(ts) < 0) or (entry["last_ts"] is not None and ts[0] < entry["last_ts"]):
+            raise ValueError(f"ticks for {symbol} must be appended in timestamp order")
+        records = np.empty(ts.size, dtype=TICK_DTYPE)
+        records["ts"] = ts
+        records["price"] = price
+        records["volume"] = 0 if volume is None else volume
+        with open(os.path.join(self.directory, entry["file"]), "ab") as f:
+            records.tofile(f)
+        entry["count"] += int(ts.size)
+        entry["first_ts"] = entry["first_ts"] if entry["first_ts"] is not None else int(ts[0])
+        entry["last_ts"] = int(ts[-1])
+        self._maps.pop(symbol, None)
+        self._save_manifest()
+
+    def ticks(self, symbol: str) -> np.ndarray:
+        """
+        Read-only memory map of an instrument's ticks (structured TICK_DTYPE array).
+        """
+        mm = self._maps.get(symbol)
+        if mm is None:
+            entry = self.manifest[symbol]
+            if not entry["count"]:
+                return np.empty(0, dtype=TICK_DTYPE)
+            mm = np.memmap(os.path.join(self.directory, entry["file"]), dtype=TICK_DTYPE, mode="r", shape=(entry["count"],))
+            self._maps[symbol] = mm
+        return mm
+
+    def iter_blocks(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        start=None,
+        end=None,
+        chunk: int = 65536
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (symbol_ids, ticks) blocks in global timestamp order; symbol_ids index into the
+        `symbols` list (default: self.symbols()). Each round reads up to `chunk` ticks ahead per
+        instrument, and merges everything up to the earliest of those look-ahead horizons with one
+        stable sort, so equal timestamps keep `symbols` order.
+        """
+        symbols = list(symbols) if symbols is not None else self.symbols()
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        streams = []
+        for sid, symbol in enumerate(symbols):
+            # Plain ndarray view: slicing np.memmap objects is comparatively slow
+            ticks = self.ticks(symbol).view(np.ndarray)
+            ts = ticks["ts"]
+            lo = int(np.searchsorted(ts, start_ns, side="left")) if start_ns is not None else 0
+            hi = int(np.searchsorted(ts, end_ns, side="left")) if end_ns is not None else len(ticks)
+            if lo < hi:
+                streams.append([sid, ticks, ts, lo, hi])
+        while streams:
+            horizon = min(ts[min(pos + chunk, hi) - 1] for _, _, ts, pos, hi in streams)
+            parts, ids = [], []
+            for stream in streams:
+                sid, ticks, ts, pos, hi = stream
+                stop = pos + int(np.searchsorted(ts[pos:min(pos + chunk, hi)], horizon, side="right"))
+                if stop > pos:
+                    parts.append(ticks[pos:stop])
+                    ids.append(np.full(stop - pos, sid, dtype=np.int32))
+                    stream[3] = stop
+            streams = [s for s in streams if s[3] < s[4]]
+            block = np.concatenate(parts)
+            sids = np.concatenate(ids)
+            if len(parts) > 1:
+                order = np.argsort(block["ts"], kind="stable")
+                block, sids = block[order], sids[order]
+            yield sids, block
+
+    def iter_ticks(self, symbols: Optional[Iterable[str]] = None, start=None, end=None) -> Iterator[Tuple[int, str, float, int]]:
+        """
+        (ts, symbol, price, volume) one tick at a time, in timestamp order.
+        """
+        symbols = list(symbols) if symbols is not None else self.symbols()
+        for sids, block in self.iter_blocks(symbols, start, end):
+            for sid, ts, price, volume in zip(sids.tolist(), block["ts"].tolist(), block["price"].tolist(), block["volume"].tolist()):
+                yield ts, symbols[sid], price, volume
+
+def session_timestamps(elapsed_ns: np.ndarray, start_day: str, tz: str = "Asia/Kolkata") -> np.ndarray:
+    """
+    Map elapsed trading time (ns since the first session's open) onto wall-clock ns (UTC),
+    laying sessions of SESSION_MINUTES back to back on business days.
+    """
+    session_ns = SESSION_MINUTES * 60 * 10**9
+    day = elapsed_ns // session_ns
+    within = elapsed_ns % session_ns
+    first = np.datetime64(pd.Timestamp(start_day).date(), "D")
+    days = np.busday_offset(first, day.astype(np.int64), roll="forward")
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    opens = pd.DatetimeIndex(unique_days.astype("datetime64[ns]")) + pd.Timedelta(f"{SESSION_OPEN}:00")
+    return opens.tz_localize(tz).as_unit("ns").asi8[inverse] + within
+
+def write_synthetic_ticks(
+    store: TickStore,
+    symbols: Dict[str, float],
+    n_ticks: int,
+    start_day: str = "2025-08-01",
+    mean_gap_ms: float = 250.0,
+    annual_vol: float = 0.15,
+    tz: str = "Asia/Kolkata",
+    seed: int = 0,
+    chunk: int = 1_000_000
+) -> None:
+    """
+    Append n_ticks random-walk ticks per instrument (symbol -> start price) with exponential
+    inter-arrival times inside NSE sessions. Generated chunk by chunk so memory stays flat.
+    """
+    rng = np.random.default_rng(seed)
+    year_ns = 252 * SESSION_MINUTES * 60 * 1e9
+    for symbol, start_price in symbols.items():
+        elapsed = 0.0
+        log_price = np.log(start_price)
+        for lo in range(0, n_ticks, chunk):
+            n = min(chunk, n_ticks - lo)
+            gaps = rng.exponential(mean_gap_ms * 1e6, n)
+            t = elapsed + np.cumsum(gaps)
+            shocks = rng.standard_normal(n) * annual_vol * np.sqrt(gaps / year_ns)
+            path = log_price + np.cumsum(shocks)
+            prices = np.round(np.exp(path) / 0.05) * 0.05
+            volume = rng.integers(1, 500, n).astype(np.int32)
+            store.append(symbol, session_timestamps(t.astype(np.int64), start_day, tz), prices, volume)
+            elapsed, log_price = float(t[-1]), float(path[-1])
+        if store.logger:
+            store.logger.info(f"[TickStore] Wrote {n_ticks} synthetic ticks for {symbol}")
@@ -0,0 +1,266 @@
+"""
+param_sweep.py
+Parallel parameter sweep engine on top of BacktestRunner.
+Historical data is published once into shared memory; pool workers attach to it at start-up
+instead of receiving a pickled copy per task. Results stream back as they complete into an
+incremental results table with progress and ETA.
+"""
+
+import itertools
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from edgeX.backtest_runner import BacktestRunner
+
+def expand_grid(param_grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]], base_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    {"adx_threshold": [20, 25], "lot_size": [50]} -> [{"adx_threshold": 20, "lot_size": 50}, ...]
+    A list of dicts is taken as-is. base_params fill in every combination.
+    """
+    if isinstance(param_grid, dict):
+        keys = list(param_grid)
+        combos = [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+    else:
+        combos = [dict(c) for c in param_grid]
+    return [dict(base_params or {}, **combo) for combo in combos]
+
+class SharedFrame:
+    """
+    Numeric DataFrame published into shared memory: one block for the values (float64, 2-D)
+    and one for the index (int64 ns). attach() rebuilds the frame on top of those buffers.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        values = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+        if isinstance(df.index, pd.DatetimeIndex):
+            index = df.index.asi8
+            tz = str(df.index.tz) if df.index.tz is not None else None
+            index_kind = "datetime"
+            # asi8 counts in the index's own resolution (pandas >= 2 may use s/ms/us)
+            unit = getattr(df.index, "unit", "ns")
+        else:
+            index = np.asarray(df.index, dtype=np.int64)
+            tz = None
+            index_kind = "int"
+            unit = None
+        self._values_shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._index_shm = shared_memory.SharedMemory(create=True, size=max(index.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=self._values_shm.buf)[:] = values
+        np.ndarray(index.shape, dtype=np.int64, buffer=self._index_shm.buf)[:] = index
+        self.spec = {
+            "values": self._values_shm.name,
+            "index": self._index_shm.name,
+            "shape": values.shape,
+            "columns": list(df.columns),
+            "index_kind": index_kind,
+            "index_name": df.index.name,
+            "tz": tz,
+            "unit": unit,
+        }
+
+    @staticmethod
+    def attach(spec: Dict[str, Any]):
+        """
+        Returns (DataFrame, handles); keep the handles alive as long as the frame is used.
+        """
+        values_shm = shared_memory.SharedMemory(name=spec["values"])
+        index_shm = shared_memory.SharedMemory(name=spec["index"])
+        values = np.ndarray(spec["shape"], dtype=np.float64, buffer=values_shm.buf)
+        values.flags.writeable = False
+        raw_index = np.ndarray((spec["shape"][0],), dtype=np.int64, buffer=index_shm.buf)
+        if spec["index_kind"] == "datetime":
+            index = pd.DatetimeIndex(raw_index.view(f"datetime64[{spec['unit']}]"), name=spec["index_name"])
+            if spec["tz"]:
+                index = index.tz_localize("UTC").tz_convert(spec["tz"])
+        else:
+            index = pd.Index(raw_index, name=spec["index_name"])
+        df = pd.DataFrame(values, index=index, columns=spec["columns"], copy=False)
+        return df, (values_shm, index_shm)
+
+    def close(self) -> None:
+        for shm in (self._values_shm, self._index_shm):
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+# Per-process worker state, set once by init_worker (or set_worker_state when running in-process)
+_WORKER: Dict[str, Any] = {}
+
+def worker_state() -> Dict[str, Any]:
+    """
+    This process's backtest worker state: data, strategy_class, runner_kwargs and any extras.
+    """
+    return _WORKER
+
+def set_worker_state(data, strategy_class, runner_kwargs, handles=(), extra=None) -> None:
+    """
+    Replace the worker state. extra(state) may add entries of its own, e.g. a per-worker cache.
+    """
+    _WORKER.clear()
+    _WORKER.update(data=data, handles=handles, strategy_class=strategy_class, runner_kwargs=runner_kwargs)
+    if extra is not None:
+        extra(_WORKER)
+
+def reset_worker_state() -> None:
+    _WORKER.clear()
+
+def init_worker(spec, strategy_class, runner_kwargs, extra=None) -> None:
+    """
+    Pool initializer: attach the shared-memory frame. extra must be a module-level function so
+    it can be pickled to the workers.
+    """
+    df, handles = SharedFrame.attach(spec)
+    set_worker_state(df, strategy_class, runner_kwargs, handles, extra)
+
+def _run_task(task):
+    task_id, params, n_rows = task
+    data = _WORKER["data"]
+    if n_rows is not None:
+        data = data.iloc[:n_rows]
+    start = time.perf_counter()
+    try:
+        runner = BacktestRunner(_WORKER["strategy_class"], data, **_WORKER["runner_kwargs"])
+        summary = runner.run(dict(params))
+        summary.pop("equity_curve", None)
+        error = ""
+    except Exception as e:
+        summary = {}
+        error = f"{type(e).__name__}: {e}"
+    return task_id, params, summary, time.perf_counter() - start, error
+
+class ParameterSweep:
+    def __init__(
+        self,
+        strategy_class,
+        historical_data: pd.DataFrame,
+        param_grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+        base_params: Optional[Dict[str, Any]] = None,
+        initial_capital: float = 1_000_000.0,
+        risk_manager=None,
+        n_workers: Optional[int] = None,
+        logger=None
+    ):
+        self.strategy_class = strategy_class
+        self.data = historical_data
+        self.combinations = expand_grid(param_grid, base_params)
+        self.runner_kwargs = {"initial_capital": initial_capital, "risk_manager": risk_manager}
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.logger = logger
+        self.rows: List[Dict[str, Any]] = []
+        self._pool = None
+        self._shared = None
+
+    def __enter__(self):
+        """
+        Keep one worker pool (and one shared-memory copy of the data) alive across several
+        iter_results/run calls, e.g. for multi-stage optimizers.
+        """
+        if self.n_workers > 1:
+            self._shared = SharedFrame(self.data)
+            self._pool = mp.get_context().Pool(
+                self.n_workers, initializer=init_worker,
+                initargs=(self._shared.spec, self.strategy_class, self.runner_kwargs)
+            )
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+        return False
+
+    def iter_results(
+        self,
+        combinations: Optional[List[Dict[str, Any]]] = None,
+        n_rows: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run backtests and yield one result row per combination as soon as it finishes
+        (completion order). Rows carry the params, the scalar summary, elapsed seconds and any error.
+        """
+        combinations = self.combinations if combinations is None else combinations
+        tasks = [(i, params, n_rows) for i, params in enumerate(combinations)]
+        if not tasks:
+            return
+        if self._pool is not None:
+            for result in self._pool.imap_unordered(_run_task, tasks, chunksize=1):
+                yield self._to_row(*result)
+            return
+        workers = min(self.n_workers, len(tasks))
+        if workers <= 1:
+            set_worker_state(self.data, self.strategy_class, self.runner_kwargs)
+            for task in tasks:
+                yield self._to_row(*_run_task(task))
+            return
+
+        shared = SharedFrame(self.data)
+        try:
+            with mp.get_context().Pool(
+                workers, initializer=init_worker,
+                initargs=(shared.spec, self.strategy_class, self.runner_kwargs)
+            ) as pool:
+                for result in pool.imap_unordered(_run_task, tasks, chunksize=1):
+                    yield self._to_row(*result)
+        finally:
+            shared.close()
+
+    def run(
+        self,
+        on_result: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        n_rows: Optional[int] = None,
+        progress_every: float = 5.0,
+        sort_by: str = "sharpe"
+    ) -> pd.DataFrame:
+        """
+        Run the whole grid. on_result(row, progress) is called per finished backtest;
+        progress is logged at most every `progress_every` seconds. Returns the results table.
+        """
+        total = len(self.combinations)
+        self.rows = []
+        start = last_log = time.perf_counter()
+        for row in self.iter_results(n_rows=n_rows):
+            self.rows.append(row)
+            done = len(self.rows)
+            elapsed = time.perf_counter() - start
+            progress = {
+                "done": done,
+                "total": total,
+                "elapsed_s": elapsed,
+                "eta_s": elapsed / done * (total - done),
+            }
+            if on_result:
+                on_result(row, progress)
+            now = time.perf_counter()
+            if self.logger and (now - last_log >= progress_every or done == total):
+                last_log = now
+                self.logger.info(
+                    f"[ParameterSweep] {done}/{total} done, elapsed {elapsed:.1f}s, ETA {progress['eta_s']:.1f}s"
+                )
+        return self.results(sort_by)
+
+    def results(self, sort_by: str = "sharpe") -> pd.DataFrame:
+        df = pd.DataFrame(self.rows)
+        if not df.empty and sort_by in df:
+            df = df.sort_values(sort_by, ascending=False, na_position="last").reset_index(drop=True)
+        return df
+
+    @staticmethod
+    def _to_row(task_id, params, summary, elapsed, error) -> Dict[str, Any]:
+        row = {"run_id": task_id}
+        row.update(params)
+        row.update(summary)
+        row["elapsed_s"] = round(elapsed, 4)
+        row["error"] = error
+        return row
@@ -0,0 +1,217 @@
+"""
+walk_forward.py
+Parallel walk-forward optimization with out-of-sample validation.
+History is split into rolling (or anchored) in-sample/out-of-sample windows. Every parameter set is
+backtested on each in-sample window, the best one is scored on the following out-of-sample window,
+and the out-of-sample trades of all folds are stitched into one equity curve.
+All (fold, params) backtests run on a worker pool attached to one shared-memory copy of the data;
+each worker keeps an IndicatorCache over the full history, so bars shared by overlapping windows
+are not recomputed.
+"""
+
+import multiprocessing as mp
+import os
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from edgeX.analytics.backtest_analyzer import BacktestAnalyzer
+from edgeX.backtest_runner import WARMUP_BARS, BacktestRunner
+from edgeX.optimization.param_sweep import (
+    SharedFrame, expand_grid, init_worker, reset_worker_state, set_worker_state, worker_state
+)
+from edgeX.strategies.indicator_cache import IndicatorCache
+
+def walk_forward_windows(
+    n_rows: int,
+    train_size: int,
+    test_size: int,
+    step: Optional[int] = None,
+    anchored: bool = False
+) -> List[Dict[str, int]]:
+    """
+    Row positions of each fold: train_start/train_end and test_start/test_end (end exclusive).
+    Test windows never overlap, so the stitched out-of-sample curve counts every bar once.
+    """
+    step = step or test_size
+    if train_size <= WARMUP_BARS:
+        raise ValueError(f"train_size must exceed the {WARMUP_BARS}-bar backtest warm-up")
+    if test_size < 1 or step < test_size:
+        raise ValueError("test_size must be >= 1 and step >= test_size")
+    folds = []
+    test_start = train_size
+    while test_start < n_rows:
+        folds.append({
+            "fold": len(folds),
+            "train_start": 0 if anchored else test_start - train_size,
+            "train_end": test_start,
+            "test_start": test_start,
+            "test_end": min(test_start + test_size, n_rows),
+        })
+        test_start += step
+    return folds
+
+def _add_indicator_cache(state):
+    state["cache"] = IndicatorCache(state["data"])
+
+def _run_window(task):
+    task_id, params, start, stop, keep_trades = task
+    state = worker_state()
+    begin = time.perf_counter()
+    trades = []
+    try:
+        runner = BacktestRunner(
+            state["strategy_class"], state["data"].iloc[start:stop],
+            indicator_cache=state.get("cache"), **state["runner_kwargs"]
+        )
+        summary = runner.run(dict(params))
+        summary.pop("equity_curve", None)
+        if keep_trades:
+            trades = runner.trades
+        error = ""
+    except Exception as e:
+        summary = {}
+        error = f"{type(e).__name__}: {e}"
+    return task_id, summary, trades, time.perf_counter() - begin, error
+
+class WalkForwardOptimizer:
+    def __init__(
+        self,
+        strategy_class,
+        historical_data: pd.DataFrame,
+        param_grid: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+        train_size: int,
+        test_size: int,
+        step: Optional[int] = None,
+        anchored: bool = False,
+        base_params: Optional[Dict[str, Any]] = None,
+        metric: str = "sharpe",
+        initial_capital: float = 1_000_000.0,
+        risk_manager=None,
+        n_workers: Optional[int] = None,
+        use_indicator_cache: bool = True,
+        logger=None
+    ):
+        self.strategy_class = strategy_class
+        self.data = historical_data
+        self.combinations = expand_grid(param_grid, base_params)
+        self.folds = walk_forward_windows(len(historical_data), train_size, test_size, step, anchored)
+        self.metric = metric
+        self.initial_capital = initial_capital
+        self.runner_kwargs = {"initial_capital": initial_capital, "risk_manager": risk_manager}
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.use_indicator_cache = use_indicator_cache
+        self.logger = logger
+
+    def _score(self, summary: Dict[str, Any]) -> float:
+        value = summary.get(self.metric, np.nan)
+        return -np.inf if value is None or np.isnan(value) else float(value)
+
+    def _map(self, pool, tasks):
+        if pool is None:
+            return map(_run_window, tasks)
+        return pool.imap_unordered(_run_window, tasks, chunksize=1)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Returns {"folds", "in_sample", "oos_trades", "equity_curve", "summary"}; summary is the
+        BacktestAnalyzer summary of the stitched out-of-sample trades.
+        """
+        n_params = len(self.combinations)
+        if not self.folds or not n_params:
+            raise ValueError("walk-forward needs at least one fold and one parameter set")
+        workers = min(self.n_workers, len(self.folds) * n_params)
+        start = time.perf_counter()
+        pool = shared = None
+        extra = _add_indicator_cache if self.use_indicator_cache else None
+        if workers > 1:
+            shared = SharedFrame(self.data)
+            pool = mp.get_context().Pool(
+                workers, initializer=init_worker,
+                initargs=(shared.spec, self.strategy_class, self.runner_kwargs, extra)
+            )
+        else:
+            set_worker_state(self.data, self.strategy_class, self.runner_kwargs, extra=extra)
+        try:
+            is_tasks = [
+                ((fold["fold"], j), params, fold["train_start"], fold["train_end"], False)
+                for fold in self.folds for j, params in enumerate(self.combinations)
+            ]
+            scores = np.full((len(self.folds), n_params), -np.inf)
+            in_sample = []
+            for (f, j), summary, _, elapsed, error in self._map(pool, is_tasks):
+                scores[f, j] = self._score(summary)
+                row = {"fold": f, "run_id": j}
+                row.update(self.combinations[j])
+                row.update(summary)
+                row["elapsed_s"] = round(elapsed, 4)
+                row["error"] = error
+                in_sample.append(row)
+            if self.logger:
+                self.logger.info(
+                    f"[WalkForward] {len(is_tasks)} in-sample backtests over {len(self.folds)} folds "
+                    f"in {time.perf_counter() - start:.1f}s"
+                )
+
+            # argmax keeps the first grid entry on ties
+            best = scores.argmax(axis=1)
+            oos_tasks = [
+                (fold["fold"], self.combinations[best[fold["fold"]]],
+                 fold["test_start"] - WARMUP_BARS, fold["test_end"], True)
+                for fold in self.folds
+            ]
+            oos = {f: (summary, trades, error) for f, summary, trades, _, error in self._map(pool, oos_tasks)}
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            if shared is not None:
+                shared.close()
+            else:
+                reset_worker_state()
+
+        index = self.data.index
+        fold_rows, oos_trades = [], []
+        for fold in self.folds:
+            f = fold["fold"]
+            summary, trades, error = oos[f]
+            oos_trades.extend(trades)
+            row = dict(fold)
+            row.update({
+                "train_from": index[fold["train_start"]],
+                "test_from": index[fold["test_start"]],
+                "test_to": index[fold["test_end"] - 1],
+                "params": self.combinations[best[f]],
+                "is_score": scores[f, best[f]],
+                "oos_score": self._score(summary),
+            })
+            row.update({f"oos_{k}": v for k, v in summary.items()})
+            row["error"] = error
+            fold_rows.append(row)
+
+        # Re-base the per-fold trades on one running capital, as BacktestRunner books them.
+        capital = self.initial_capital
+        stitched = []
+        for trade in oos_trades:
+            capital += trade["pnl"]
+            stitched.append({"date": trade["date"], "pnl": trade["pnl"], "returns": trade["pnl"] / capital})
+        trades_df = pd.DataFrame(stitched, columns=["date", "pnl", "returns"])
+        equity_curve = pd.Series(
+            self.initial_capital + trades_df["pnl"].cumsum().to_numpy(),
+            index=pd.Index(trades_df["date"], name="date"), name="equity", dtype=float
+        )
+        summary = BacktestAnalyzer(self.logger).summarize(trades_df)
+        if self.logger:
+            self.logger.info(
+                f"[WalkForward] Done in {time.perf_counter() - start:.1f}s: "
+                f"OOS {self.metric}={summary.get(self.metric)} over {len(trades_df)} trades"
+            )
+        return {
+            "folds": pd.DataFrame(fold_rows),
+            "in_sample": pd.DataFrame(in_sample),
+            "oos_trades": trades_df,
+            "equity_curve": equity_curve,
+            "summary": summary,
+        }
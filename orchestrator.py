@@ -6,67 +6,139 @@ EdgeX main workflow orchestration with live config reload, strategy management,
 import threading
 import time
 import os
+from collections import deque
 import yaml
 from edgeX.strategy_manager import StrategyManager
-from edgeX.utils.logger import get_logger
+from edgeX.utils.logger import get_logger, log_file_path
+from edgeX.utils.config_watcher import ConfigWatcher
 from edgeX.broker.base_broker import get_broker
+from edgeX.utils.clock import SystemClock
+from edgeX.utils.checkpoint import CHECKPOINT_PATH, EngineCheckpointer
 
 CONFIG_PATH = "config/config.yaml"
+RELOAD_TRIGGER = ".reload_trigger"
+# checkpoint_path default: take bot.checkpoint_path from the config
+FROM_CONFIG = "config"
 
 class EdgeXEngine:
-    def __init__(self, config_path=CONFIG_PATH):
+    def __init__(self, config_path=CONFIG_PATH, clock=None, kite=None, checkpoint_path=FROM_CONFIG):
         self.config_path = config_path
         self.config = self.load_config(config_path)
         self.logger = get_logger("EdgeXEngine")
-        self.broker = get_broker(self.config.get("broker", {}), logger=self.logger)
+        # Replays inject a VirtualClock and a FakeKite; live runs use wall time and KiteConnect
+        self.clock = clock or SystemClock()
+        self.kite = kite
+        self.broker = get_broker(self.config.get("broker", {}), logger=self.logger, kite=kite)
         self.strat_mgr = self.make_strategy_manager()
+        bot = self.config.get("bot", {})
+        if checkpoint_path == FROM_CONFIG:
+            checkpoint_path = bot.get("checkpoint_path", CHECKPOINT_PATH)
+        # None (replays) neither restores nor writes a checkpoint
+        self.checkpointer = EngineCheckpointer(
+            checkpoint_path,
+            interval=bot.get("checkpoint_interval", 60),
+            clock=self.clock,
+            logger=self.logger
+        )
         self.running = False
         self._monitor_thread = None
         self._reload_flag = False
+        self._wake = threading.Event()
+        # Wall-clock seconds per poll cycle (fetch -> resample -> signals -> risk -> orders)
+        self.cycle_latencies = deque(maxlen=100_000)
+        self.cycles = 0
+        self._reload_trigger = os.path.join(os.path.dirname(config_path), RELOAD_TRIGGER)
+        self._watcher = ConfigWatcher(
+            [config_path, self._reload_trigger],
+            self._on_config_event,
+            logger=self.logger
+        )
 
     def load_config(self, path):
         with open(path, "r") as f:
             return yaml.safe_load(f)
     
     def make_strategy_manager(self):
-        return StrategyManager(self.config, logger=self.logger)
+        return StrategyManager(self.config, logger=self.logger, kite=self.kite, clock=self.clock)
+
+    def request_reload(self):
+        self._reload_flag = True
+        self._wake.set()
+
+    def _on_config_event(self, path):
+        if path == os.path.abspath(self._reload_trigger):
+            if not os.path.exists(self._reload_trigger):
+                return
+            self.logger.info("[Engine] Detected live config reload trigger!")
+            try:
+                os.remove(self._reload_trigger)
+            except FileNotFoundError:
+                pass
+        else:
+            self.logger.info(f"[Engine] Config file changed: {path}")
+        self.request_reload()
 
     def reload_config_and_strategies(self):
         self.logger.info("[Engine] Hot-reloading config and strategies.")
-        self.config = self.load_config(self.config_path)
-        self.strat_mgr = self.make_strategy_manager()
-        self.strat_mgr.load_strategies()
+        try:
+            new_config = self.load_config(self.config_path)
+        except Exception as e:
+            self.logger.error(f"[Engine] Config reload failed, keeping current config: {e}", exc_info=True)
+            return
+        if not isinstance(new_config, dict):
+            self.logger.error("[Engine] Config reload skipped: file is empty or not a mapping.")
+            return
+        if new_config.get("broker", {}) != self.config.get("broker", {}):
+            self.broker = get_broker(new_config.get("broker", {}), logger=self.logger, kite=self.kite)
+        changes = self.strat_mgr.apply_config(new_config)
+        self.config = new_config
+        self.logger.info(f"[Engine] Hot reload done: {changes}")
 
-    def run(self):
+    def run(self, until=None):
+        """
+        Main loop. `until` (a datetime on the engine clock) ends the run, e.g. at the close of
+        a replayed session.
+        """
         self.logger.info("[Engine] Starting EdgeX...")
         self.running = True
         self.strat_mgr.load_strategies()
+        # Warm restart: restored candles mean refresh_bars() only fetches the gap
+        self.checkpointer.restore(self.strat_mgr)
         self._monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self._monitor_thread.start()
+        self._watcher.start()
         try:
             poll_interval = self.config.get("bot", {}).get("poll_interval", 60)
-            while self.running:
+            while self.running and (until is None or self.clock.now() < until):
+                started = time.perf_counter()
+                self.strat_mgr.refresh_bars()
                 for strat in self.strat_mgr.strategies:
                     try:
-                        market_data = strat.data_fetcher.fetch_historical(
-                            instrument_token=260105,
-                            from_date="2025-08-08",
-                            to_date="2025-08-09",
-                            interval="5minute"
-                        )
+                        market_data = self.strat_mgr.market_data(strat)
                         signals = strat.generate_signals(market_data)
+                        strat.last_bar = market_data.index[-1] if len(market_data) else strat.last_bar
                         signals = self.strat_mgr.risk_manager.check_signals(signals)
                         strat.execute_trades(signals)
                         strat.manage_positions()
                     except Exception as e:
                         self.logger.error(f"[Engine] Exception in strategy loop: {e}", exc_info=True)
-                time.sleep(poll_interval)
+                self.cycle_latencies.append(time.perf_counter() - started)
+                self.cycles += 1
+                self.checkpointer.maybe_save(self.strat_mgr)
+                # Sleep until the next poll, waking early when a reload is requested.
+                self.clock.wait(self._wake, poll_interval)
+                self._wake.clear()
                 if self._reload_flag:
-                    self.reload_config_and_strategies()
                     self._reload_flag = False
+                    self.reload_config_and_strategies()
+                    poll_interval = self.config.get("bot", {}).get("poll_interval", 60)
         except KeyboardInterrupt:
             self.logger.info("[Engine] Keyboard interrupt—shutting down.")
             self.running = False
+        finally:
+            self.running = False
+            self._watcher.stop()
+            self.checkpointer.save(self.strat_mgr)
 
     def monitor_loop(self):
         while self.running:
@@ -76,16 +148,12 @@ class EdgeXEngine:
                 "status": "running"
             }
             self.logger.debug(f"[Monitor] Health: {health}")
-            if os.path.exists("config/.reload_trigger"):
-                self.logger.info("[Monitor] Detected live config reload trigger!")
-                self._reload_flag = True
-                os.remove("config/.reload_trigger")
-            time.sleep(10)
+            self.clock.sleep(10)
 
     def update_params(self, new_config: dict):
         with open(self.config_path, "w") as f:
             yaml.safe_dump(new_config, f)
-        self._reload_flag = True
+        self.request_reload()
         self.logger.info("[Engine] Parameters updated for live reload.")
 
     def status(self):
@@ -93,7 +161,7 @@ class EdgeXEngine:
             "status": "running" if self.running else "stopped",
             "strategies": [s.name for s in self.strat_mgr.strategies],
             "broker": self.broker.__class__.__name__,
-            "last_log": self.logger.handlers[0].baseFilename if self.logger and self.logger.handlers else "N/A"
+            "last_log": log_file_path()
         }
 
 if __name__ == "__main__":
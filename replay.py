@@ -0,0 +1,113 @@
+"""
+replay.py
+Accelerated session replay of the full engine.
+Runs EdgeXEngine (orchestrator, strategies, risk, ZerodhaConnector) against a FakeKite serving
+recorded candles, on a VirtualClock that walks one trading day from the open to the close.
+Reports cycle latency, orders and the achieved speed-up over real time.
+
+Usage:
+    python replay.py --config config/config.yaml --bars 260105=data/intraday/NIFTY_intraday.csv \
+        --date 2025-08-08 [--speed 100] [--symbol "NSE:NIFTY 50=260105"]
+"""
+
+import argparse
+import datetime as dt
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from edgeX.broker.fake_kite import FakeKite
+from edgeX.orchestrator import CONFIG_PATH, EdgeXEngine
+from edgeX.utils.clock import IST, VirtualClock
+from edgeX.utils.logger import get_logger
+
+SESSION_OPEN = dt.time(9, 15)
+SESSION_CLOSE = dt.time(15, 30)
+
+class SessionReplay:
+    def __init__(
+        self,
+        config_path: str,
+        bars: Dict[int, pd.DataFrame],
+        session_date,
+        speed: Optional[float] = None,
+        symbols: Optional[Dict[str, int]] = None,
+        logger=None
+    ):
+        """
+        bars: instrument_token -> candles (including enough days before session_date for warm-up).
+        speed=None replays as fast as the engine allows; speed=100 paces it at 100x real time.
+        """
+        self.config_path = config_path
+        self.bars = bars
+        self.session_date = pd.Timestamp(session_date).date()
+        self.speed = speed
+        self.symbols = symbols
+        self.logger = logger
+
+    def run(self) -> Dict[str, Any]:
+        start = dt.datetime.combine(self.session_date, SESSION_OPEN, IST)
+        end = dt.datetime.combine(self.session_date, SESSION_CLOSE, IST)
+        # The engine loop runs in this thread, so its sleeps are what move virtual time
+        clock = VirtualClock(start, speed=self.speed, logger=self.logger)
+        kite = FakeKite(self.bars, clock, symbols=self.symbols, logger=self.logger)
+        # Never touch the live checkpoint: replayed candles must not be restored as real history
+        engine = EdgeXEngine(self.config_path, clock=clock, kite=kite, checkpoint_path=None)
+        began = time.perf_counter()
+        try:
+            engine.run(until=end)
+        finally:
+            clock.close()
+        wall = time.perf_counter() - began
+
+        latencies = np.array(engine.cycle_latencies) * 1000
+        simulated = (clock.now() - start).total_seconds()
+        report = {
+            "session": str(self.session_date),
+            "cycles": engine.cycles,
+            "orders": len(kite.order_book),
+            "cycle_p50_ms": round(float(np.percentile(latencies, 50)), 3) if latencies.size else None,
+            "cycle_p99_ms": round(float(np.percentile(latencies, 99)), 3) if latencies.size else None,
+            "cycle_max_ms": round(float(latencies.max()), 3) if latencies.size else None,
+            "broker_calls": dict(kite.calls),
+            "broker_seconds": round(kite.call_seconds, 3),
+            "wall_seconds": round(wall, 3),
+            "simulated_seconds": simulated,
+            "speedup": round(simulated / wall, 1) if wall else None,
+        }
+        if self.logger:
+            self.logger.info(f"[Replay] {report}")
+        return report
+
+def load_bars(path: str) -> pd.DataFrame:
+    df = pd.read_csv(path, parse_dates=["date"], index_col="date")
+    return df.sort_index()
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay one trading day through EdgeXEngine")
+    parser.add_argument("--config", default=CONFIG_PATH)
+    parser.add_argument("--bars", action="append", required=True, metavar="TOKEN=CSV",
+                        help="recorded candles per instrument token (date,open,high,low,close,volume)")
+    parser.add_argument("--symbol", action="append", default=[], metavar="QUOTE=TOKEN",
+                        help='quote symbol served by ltp(), e.g. "NSE:NIFTY 50=256265"')
+    parser.add_argument("--date", required=True, help="session to replay, YYYY-MM-DD")
+    parser.add_argument("--speed", type=float, default=None, help="pace at this multiple of real time")
+    args = parser.parse_args()
+
+    bars = {}
+    for item in args.bars:
+        token, _, path = item.partition("=")
+        bars[int(token)] = load_bars(path)
+    symbols = {}
+    for item in args.symbol:
+        quote, _, token = item.rpartition("=")
+        symbols[quote] = int(token)
+
+    report = SessionReplay(args.config, bars, args.date, args.speed, symbols, logger=get_logger("Replay")).run()
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
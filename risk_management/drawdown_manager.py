@@ -10,22 +10,28 @@ class DrawdownManager:
         self.pause_threshold = pause_threshold
         self.equity_high = start_equity
         self.trading_active = True
+        self.status = "active"
         self.logger = logger
 
     def update_equity(self, current_equity):
+        # Called on every mark-to-market tick, so only state transitions are logged.
         if current_equity > self.equity_high:
             self.equity_high = current_equity
         dd = 1 - (current_equity / self.equity_high)
         if dd >= self.max_drawdown:
-            self.trading_active = False
-            if self.logger:
-                self.logger.critical(f"Max drawdown {dd:.2%} reached. Trading halted.")
-            return "halt"
+            status = "halt"
         elif dd >= self.pause_threshold:
-            self.trading_active = False
-            if self.logger:
-                self.logger.warning(f"Pause threshold {dd:.2%} reached. Trading temporarily paused.")
-            return "pause"
+            status = "pause"
         else:
-            self.trading_active = True
-            return "active"
+            status = "active"
+        self.trading_active = status == "active"
+        if status != self.status:
+            self.status = status
+            if self.logger:
+                if status == "halt":
+                    self.logger.critical(f"Max drawdown {dd:.2%} reached. Trading halted.")
+                elif status == "pause":
+                    self.logger.warning(f"Pause threshold {dd:.2%} reached. Trading temporarily paused.")
+                else:
+                    self.logger.info(f"Drawdown {dd:.2%} back within limits. Trading active.")
+        return status
@@ -0,0 +1,182 @@
+"""
+mark_to_market.py
+Streaming mark-to-market engine.
+Holds open positions in NumPy arrays, revalues the legs of an underlying on every tick and feeds
+live equity into DrawdownManager so halt/pause decisions react within one tick.
+"""
+
+from typing import Callable, Dict, Optional
+import numpy as np
+
+from edgeX.utils.instruments import parse_instrument
+
+DEFAULT_UNDERLYING_ALIASES = {
+    "NSE:NIFTY 50": "NIFTY",
+    "NSE:NIFTY BANK": "BANKNIFTY",
+    "BSE:SENSEX": "SENSEX",
+}
+
+class MarkToMarketEngine:
+    """
+    Equity = cash + sum(qty * mark) over all legs.
+
+    - Quote ticks for a held instrument (option/future) set its mark exactly: O(1).
+    - Ticks on an underlying reprice every leg of that underlying in one vectorized pass with a
+      delta-gamma step from each leg's last quote: mark = quote + delta*dS + 0.5*gamma*dS^2.
+    """
+
+    def __init__(
+        self,
+        cash: float,
+        drawdown_manager=None,
+        underlying_aliases: Optional[Dict[str, str]] = None,
+        on_status_change: Optional[Callable[[str, float], None]] = None,
+        metrics=None,
+        capacity: int = 256,
+        logger=None
+    ):
+        self.cash = float(cash)
+        self.drawdown_manager = drawdown_manager
+        self.underlying_aliases = dict(DEFAULT_UNDERLYING_ALIASES, **(underlying_aliases or {}))
+        self.on_status_change = on_status_change
+        # Optional OnlinePerformanceMetrics kept current with every equity update
+        self.metrics = metrics
+        self.logger = logger
+
+        self.qty = np.zeros(capacity)
+        self.mark = np.zeros(capacity)
+        self.quote = np.zeros(capacity)       # last traded/quoted price of the leg
+        self.ref_spot = np.full(capacity, np.nan)  # underlying spot when `quote` was taken
+        self.delta = np.zeros(capacity)
+        self.gamma = np.zeros(capacity)
+        self.n = 0
+
+        self.symbol_row: Dict[str, int] = {}
+        self.row_symbol = []
+        self._rows_by_underlying: Dict[str, list] = {}
+        self._row_arrays: Dict[str, np.ndarray] = {}
+        self.spot: Dict[str, float] = {}
+        self.value_by_underlying: Dict[str, float] = {}
+        self.equity = self.cash
+        self.status = "active"
+        self.ticks = 0
+
+    def _underlying_of(self, symbol: str) -> str:
+        return self.underlying_aliases.get(symbol) or parse_instrument(symbol)[0]
+
+    def _ensure_capacity(self) -> None:
+        if self.n < len(self.qty):
+            return
+        new_cap = len(self.qty) * 2
+        for name in ("qty", "mark", "quote", "delta", "gamma"):
+            arr = getattr(self, name)
+            grown = np.zeros(new_cap)
+            grown[:self.n] = arr[:self.n]
+            setattr(self, name, grown)
+        grown = np.full(new_cap, np.nan)
+        grown[:self.n] = self.ref_spot[:self.n]
+        self.ref_spot = grown
+
+    def _row(self, symbol: str) -> int:
+        row = self.symbol_row.get(symbol)
+        if row is not None:
+            return row
+        self._ensure_capacity()
+        row = self.n
+        self.n += 1
+        self.symbol_row[symbol] = row
+        self.row_symbol.append(symbol)
+        underlying = self._underlying_of(symbol)
+        self._rows_by_underlying.setdefault(underlying, []).append(row)
+        self._row_arrays[underlying] = np.array(self._rows_by_underlying[underlying], dtype=np.int64)
+        _, _, _, option_type = parse_instrument(symbol)
+        self.delta[row] = {"CE": 0.5, "PE": -0.5}.get(option_type, 1.0)
+        return row
+
+    def on_fill(
+        self,
+        symbol: str,
+        qty: float,
+        price: float,
+        delta: Optional[float] = None,
+        gamma: Optional[float] = None
+    ) -> float:
+        """
+        Book a signed fill (qty > 0 buy, < 0 sell) and return the updated equity.
+        """
+        row = self._row(symbol)
+        underlying = self._underlying_of(symbol)
+        self.cash -= qty * price
+        old_value = self.qty[row] * self.mark[row]
+        self.qty[row] += qty
+        self.mark[row] = self.quote[row] = price
+        self.ref_spot[row] = self.spot.get(underlying, np.nan)
+        if delta is not None:
+            self.delta[row] = delta
+        if gamma is not None:
+            self.gamma[row] = gamma
+        self.value_by_underlying[underlying] = (
+            self.value_by_underlying.get(underlying, 0.0) - old_value + self.qty[row] * price
+        )
+        return self._publish()
+
+    def update_greeks(self, symbol: str, delta: float, gamma: float = 0.0) -> None:
+        row = self.symbol_row[symbol]
+        self.delta[row] = delta
+        self.gamma[row] = gamma
+
+    def on_tick(self, symbol: str, price: float) -> float:
+        """
+        Apply one market tick and return the updated equity.
+        """
+        self.ticks += 1
+        underlying = self.underlying_aliases.get(symbol)
+        if underlying is not None:
+            return self.on_underlying_tick(underlying, price)
+        row = self.symbol_row.get(symbol)
+        if row is None:
+            return self.equity
+        underlying = self._underlying_of(symbol)
+        old = self.mark[row]
+        self.mark[row] = self.quote[row] = price
+        self.ref_spot[row] = self.spot.get(underlying, np.nan)
+        self.value_by_underlying[underlying] += self.qty[row] * (price - old)
+        return self._publish()
+
+    def on_underlying_tick(self, underlying: str, spot: float) -> float:
+        self.spot[underlying] = spot
+        rows = self._row_arrays.get(underlying)
+        if rows is None or not rows.size:
+            return self.equity
+        ref = self.ref_spot[rows]
+        # Legs quoted before any spot was seen take this tick as their reference.
+        unset = np.isnan(ref)
+        if unset.any():
+            ref = np.where(unset, spot, ref)
+            self.ref_spot[rows] = ref
+        ds = spot - ref
+        marks = self.quote[rows] + self.delta[rows] * ds + 0.5 * self.gamma[rows] * ds * ds
+        np.maximum(marks, 0.0, out=marks)
+        self.mark[rows] = marks
+        self.value_by_underlying[underlying] = float(np.dot(self.qty[rows], marks))
+        return self._publish()
+
+    def _publish(self) -> float:
+        self.equity = float(self.cash + sum(self.value_by_underlying.values()))
+        if self.metrics is not None:
+            self.metrics.update_equity(self.equity)
+        if self.drawdown_manager is not None:
+            status = self.drawdown_manager.update_equity(self.equity)
+            if status != self.status:
+                self.status = status
+                if self.logger:
+                    self.logger.warning(f"[MTM] Drawdown status -> {status} at equity {self.equity:.2f}")
+                if self.on_status_change:
+                    self.on_status_change(status, self.equity)
+        return self.equity
+
+    def positions(self) -> Dict[str, Dict[str, float]]:
+        return {
+            symbol: {"qty": float(self.qty[row]), "mark": float(self.mark[row]), "delta": float(self.delta[row])}
+            for symbol, row in self.symbol_row.items() if self.qty[row]
+        }
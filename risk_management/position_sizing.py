@@ -5,6 +5,7 @@ Provides robust size calculation to ensure consistent risk management across all
 """
 
 from typing import Optional
+import numpy as np
 
 class PositionSizer:
     def __init__(
@@ -41,3 +42,64 @@ class PositionSizer:
         lots = max(1, int(dollar_value / (price * self.min_lot_size)))
         lots = min(lots, self.max_lots)
         return lots * self.min_lot_size
+
+    def size_batch(
+        self,
+        atr,
+        prices,
+        lot_sizes=None,
+        risk_budget: Optional[float] = None,
+        open_risk: float = 0.0,
+        returns=None,
+        directions=None
+    ) -> np.ndarray:
+        """
+        Allocate lots across a batch of candidate signals under one total risk budget.
+        atr: per-candidate ATR (or volatility in price units); risk per lot = atr * lot size.
+        risk_budget: fraction of capital for the whole batch (default risk_per_trade per candidate),
+            reduced by open_risk already carried by the book.
+        returns: optional (T x N) recent returns; their correlation (signed by directions, +1 long /
+            -1 short exposure) sets how much diversification the budget can use. Without it the
+            candidates are treated as perfectly correlated, i.e. their risks simply add up.
+        Every candidate gets an equal risk share; returns quantities (lots * lot size), 0 where nothing fits.
+        """
+        atr = np.asarray(atr, dtype=float)
+        prices = np.asarray(prices, dtype=float)
+        n = atr.size
+        lots_size = np.full(n, self.min_lot_size, dtype=float) if lot_sizes is None else np.asarray(lot_sizes, dtype=float)
+        qty = np.zeros(n, dtype=np.int64)
+
+        unit_risk = atr * lots_size
+        valid = np.isfinite(unit_risk) & (unit_risk > 0) & np.isfinite(prices) & (prices > 0)
+        m = int(valid.sum())
+        if not m:
+            return qty
+        fraction = self.risk_per_trade * m if risk_budget is None else risk_budget
+        available = self.capital * fraction - open_risk
+        if available <= 0:
+            return qty
+
+        # Portfolio risk of one risk unit in every candidate = sqrt(1' C 1); C = all-ones without returns.
+        spread = float(m * m)
+        if returns is not None:
+            rets = np.asarray(returns, dtype=float)[:, valid]
+            if rets.shape[0] >= 2:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    corr = np.corrcoef(rets, rowvar=False).reshape(m, m)
+                corr = np.nan_to_num(corr, nan=0.0)
+                np.fill_diagonal(corr, 1.0)
+                if directions is not None:
+                    d = np.asarray(directions, dtype=float)[valid]
+                    corr = corr * np.outer(d, d)
+                spread = float(corr.sum())
+        per_candidate = available / np.sqrt(max(spread, 1.0))
+
+        lots = np.floor(per_candidate / unit_risk[valid])
+        lots = np.clip(lots, 0, self.max_lots)
+        qty[valid] = (lots * lots_size[valid]).astype(np.int64)
+        if self.logger:
+            self.logger.debug(
+                f"[PositionSizer] Batch of {n}: budget={available:.2f}, per-candidate risk={per_candidate:.2f}, "
+                f"allocated {int((qty > 0).sum())} candidates"
+            )
+        return qty
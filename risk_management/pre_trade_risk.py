@@ -0,0 +1,201 @@
+"""
+pre_trade_risk.py
+Low-latency pre-trade risk engine.
+Keeps open exposure indexed by symbol, underlying, strategy and expiry so every order is checked
+against notional, lot, order-rate and concentration limits in O(1), and updates itself on fills.
+"""
+
+import time
+from collections import defaultdict, deque
+from typing import Any, Dict, Optional, Tuple
+
+from edgeX.utils.instruments import parse_instrument
+
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "last")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = now
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+class PreTradeRiskEngine:
+    """
+    limits (all optional, missing = unlimited):
+        max_order_notional, max_order_lots, max_orders_per_sec, order_burst,
+        max_symbol_notional, max_underlying_notional, max_strategy_notional, max_expiry_notional,
+        max_gross_notional, max_symbol_concentration, max_underlying_concentration,
+        concentration_min_gross, lot_sizes: {underlying: lot_size}
+
+    Exposure indexes hold filled notional plus notional reserved by accepted-but-unfilled orders
+    (check(..., reserve=True)), so a burst of orders cannot jointly overshoot a limit before
+    the fills arrive. on_fill / release settle the oldest reservation for that strategy+symbol.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Any]] = None, logger=None, clock=time.monotonic):
+        self.logger = logger
+        self.clock = clock
+        self.set_limits(limits or {})
+
+        # (strategy, symbol) -> [signed qty, avg price]
+        self.positions: Dict[Tuple[str, str], list] = {}
+        self.by_symbol = defaultdict(float)
+        self.by_underlying = defaultdict(float)
+        self.by_strategy = defaultdict(float)
+        self.by_expiry = defaultdict(float)
+        self.gross_notional = 0.0
+        self.reservations: Dict[Tuple[str, str], deque] = defaultdict(deque)
+        self.rejects = defaultdict(int)
+
+    def set_limits(self, limits: Dict[str, Any]) -> None:
+        """
+        (Re)load limits without touching exposure state, e.g. on a config hot reload.
+        """
+        inf = float("inf")
+        self.limits = limits
+        self.max_order_notional = limits.get("max_order_notional", inf)
+        self.max_order_lots = limits.get("max_order_lots", inf)
+        self.max_orders_per_sec = limits.get("max_orders_per_sec")
+        self.order_burst = limits.get("order_burst", self.max_orders_per_sec)
+        self.max_symbol_notional = limits.get("max_symbol_notional", inf)
+        self.max_underlying_notional = limits.get("max_underlying_notional", inf)
+        self.max_strategy_notional = limits.get("max_strategy_notional", inf)
+        self.max_expiry_notional = limits.get("max_expiry_notional", inf)
+        self.max_gross_notional = limits.get("max_gross_notional", inf)
+        self.max_symbol_concentration = limits.get("max_symbol_concentration", 1.0)
+        self.max_underlying_concentration = limits.get("max_underlying_concentration", 1.0)
+        self.concentration_min_gross = limits.get("concentration_min_gross", 0.0)
+        self.lot_sizes = limits.get("lot_sizes", {})
+        self._buckets = {}
+
+    @staticmethod
+    def _side(action: str) -> int:
+        return -1 if action.startswith("SELL") else 1
+
+    def _position_delta(self, strategy: str, symbol: str, qty: int, price: float) -> Tuple[float, float, float]:
+        """
+        Returns (new_qty, new_avg_price, notional_delta) for applying a signed fill of qty @ price.
+        """
+        pos = self.positions.get((strategy, symbol))
+        old_qty, old_avg = pos if pos else (0, 0.0)
+        new_qty = old_qty + qty
+        if new_qty == 0:
+            new_avg = 0.0
+        elif old_qty == 0 or (old_qty > 0) != (new_qty > 0):
+            new_avg = price
+        elif (old_qty > 0) == (qty > 0):
+            new_avg = (old_qty * old_avg + qty * price) / new_qty
+        else:
+            new_avg = old_avg
+        return new_qty, new_avg, abs(new_qty) * new_avg - abs(old_qty) * old_avg
+
+    def _apply(self, symbol: str, underlying: str, strategy: str, expiry: Optional[str], amount: float) -> None:
+        self.by_symbol[symbol] += amount
+        self.by_underlying[underlying] += amount
+        self.by_strategy[strategy] += amount
+        if expiry:
+            self.by_expiry[expiry] += amount
+        self.gross_notional += amount
+
+    def check(self, symbol: str, action: str, size: int, price: float, strategy: str = "",
+              now: Optional[float] = None, reserve: bool = False) -> Tuple[bool, str]:
+        """
+        O(1) pre-trade check of one order. Returns (accepted, reason).
+        """
+        underlying, expiry, _, _ = parse_instrument(symbol)
+        notional = size * price
+        if notional > self.max_order_notional:
+            return self._reject("order_notional")
+        lot_size = self.lot_sizes.get(underlying)
+        if lot_size:
+            if size % lot_size:
+                return self._reject("lot_multiple")
+            if size // lot_size > self.max_order_lots:
+                return self._reject("order_lots")
+
+        _, _, delta = self._position_delta(strategy, symbol, self._side(action) * size, price)
+        if delta > 0:
+            if self.by_symbol.get(symbol, 0.0) + delta > self.max_symbol_notional:
+                return self._reject("symbol_notional")
+            if self.by_underlying.get(underlying, 0.0) + delta > self.max_underlying_notional:
+                return self._reject("underlying_notional")
+            if self.by_strategy.get(strategy, 0.0) + delta > self.max_strategy_notional:
+                return self._reject("strategy_notional")
+            if expiry and self.by_expiry.get(expiry, 0.0) + delta > self.max_expiry_notional:
+                return self._reject("expiry_notional")
+            gross = self.gross_notional + delta
+            if gross > self.max_gross_notional:
+                return self._reject("gross_notional")
+            if gross >= self.concentration_min_gross:
+                if (self.by_symbol.get(symbol, 0.0) + delta) / gross > self.max_symbol_concentration:
+                    return self._reject("symbol_concentration")
+                if (self.by_underlying.get(underlying, 0.0) + delta) / gross > self.max_underlying_concentration:
+                    return self._reject("underlying_concentration")
+
+        # Order rate is checked last so rejected orders do not consume rate budget.
+        if self.max_orders_per_sec:
+            now = self.clock() if now is None else now
+            bucket = self._buckets.get(strategy)
+            if bucket is None:
+                bucket = self._buckets[strategy] = _TokenBucket(self.max_orders_per_sec, self.order_burst, now)
+            if not bucket.take(now):
+                return self._reject("order_rate")
+        if reserve:
+            reserved = max(delta, 0.0)
+            self.reservations[(strategy, symbol)].append(reserved)
+            if reserved:
+                self._apply(symbol, underlying, strategy, expiry, reserved)
+        return True, ""
+
+    def check_signal(self, signal, now: Optional[float] = None, reserve: bool = False) -> Tuple[bool, str]:
+        return self.check(signal["symbol"], signal["action"], signal["size"], signal["price"],
+                          signal.get("strategy", "") or "", now, reserve)
+
+    def release(self, symbol: str, strategy: str = "") -> None:
+        """
+        Drop the oldest reservation for strategy+symbol (order rejected, cancelled or filled).
+        """
+        queue = self.reservations.get((strategy, symbol))
+        if queue:
+            reserved = queue.popleft()
+            if not queue:
+                del self.reservations[(strategy, symbol)]
+            if reserved:
+                underlying, expiry, _, _ = parse_instrument(symbol)
+                self._apply(symbol, underlying, strategy, expiry, -reserved)
+
+    def on_fill(self, symbol: str, action: str, qty: int, price: float, strategy: str = "") -> None:
+        """
+        Apply an executed fill to the exposure indexes, settling its reservation if any.
+        """
+        self.release(symbol, strategy)
+        underlying, expiry, _, _ = parse_instrument(symbol)
+        new_qty, new_avg, delta = self._position_delta(strategy, symbol, self._side(action) * qty, price)
+        if new_qty:
+            self.positions[(strategy, symbol)] = [new_qty, new_avg]
+        else:
+            self.positions.pop((strategy, symbol), None)
+        self._apply(symbol, underlying, strategy, expiry, delta)
+
+    def _reject(self, reason: str) -> Tuple[bool, str]:
+        self.rejects[reason] += 1
+        return False, reason
+
+    def exposure_snapshot(self) -> Dict[str, Any]:
+        return {
+            "gross_notional": self.gross_notional,
+            "by_symbol": {k: v for k, v in self.by_symbol.items() if v},
+            "by_underlying": {k: v for k, v in self.by_underlying.items() if v},
+            "by_strategy": {k: v for k, v in self.by_strategy.items() if v},
+            "by_expiry": {k: v for k, v in self.by_expiry.items() if v},
+            "rejects": dict(self.rejects),
+        }
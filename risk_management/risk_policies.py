@@ -3,23 +3,103 @@ risk_policies.py
 Comprehensive strategy risk scanner and filter.
 """
 
+import time
+import numpy as np
+from edgeX.strategies.signals import SignalBatch
+
 class BasicRiskManager:
-    def __init__(self, risk_config, position_limits=None, logger=None):
+    def __init__(self, risk_config, position_limits=None, logger=None, pre_trade=None):
         self.risk_config = risk_config
         self.position_limits = position_limits or {"max_per_trade": 10, "max_total": 50}
         self.logger = logger
+        # Optional PreTradeRiskEngine for indexed notional/lot/rate/concentration limits
+        self.pre_trade = pre_trade
+        self.last_exposure = 0
+        self.latency_stats = {"batches": 0, "signals": 0, "total_us": 0.0, "max_us": 0.0, "last_us": 0.0}
+
+    def check_batch(self, batch, current_exposure=0):
+        """
+        Vectorized limit check over a whole SignalBatch.
+        Signals are accepted in order; each accepted signal adds to the exposure seen by
+        the ones after it, so a batch can never jointly exceed max_total.
+        """
+        start = time.perf_counter()
+        batch = SignalBatch.from_signals(batch)
+        sizes = batch.sizes.astype(np.int64)
+        max_total = self.position_limits["max_total"]
+
+        accepted = sizes <= self.position_limits["max_per_trade"]
+        per_trade_rejects = int(len(batch) - accepted.sum())
+
+        candidates = np.flatnonzero(accepted)
+        exposure = current_exposure
+        total_rejects = 0
+        pre_trade_rejects = {}
+        if self.pre_trade is not None:
+            # Sequential accept step: a signal pre-trade rejects takes no max_total room from the
+            # ones after it
+            for i in candidates.tolist():
+                size = int(sizes[i])
+                if exposure + size > max_total:
+                    accepted[i] = False
+                    total_rejects += 1
+                    continue
+                ok, reason = self.pre_trade.check_signal(batch.signals[i], reserve=True)
+                if not ok:
+                    accepted[i] = False
+                    pre_trade_rejects[reason] = pre_trade_rejects.get(reason, 0) + 1
+                    continue
+                exposure += size
+        else:
+            # Greedy running-exposure check: cumsum over the remaining candidates, drop the first
+            # one that breaches max_total and continue from there with the exposure accepted so far.
+            pos = 0
+            while pos < candidates.size:
+                running = exposure + np.cumsum(sizes[candidates[pos:]])
+                over = np.flatnonzero(running > max_total)
+                if not over.size:
+                    exposure = int(running[-1])
+                    break
+                k = int(over[0])
+                if k:
+                    exposure = int(running[k - 1])
+                accepted[candidates[pos + k]] = False
+                total_rejects += 1
+                pos += k + 1
+
+        result = batch.select(accepted)
+        self.last_exposure = exposure
+
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        stats = self.latency_stats
+        stats["batches"] += 1
+        stats["signals"] += len(batch)
+        stats["total_us"] += elapsed_us
+        stats["last_us"] = elapsed_us
+        stats["max_us"] = max(stats["max_us"], elapsed_us)
+
+        if self.logger:
+            if per_trade_rejects or total_rejects or pre_trade_rejects:
+                self.logger.warning(
+                    f"Risk check skipped {per_trade_rejects} signal(s) over max per trade, "
+                    f"{total_rejects} over max total, pre-trade rejects {pre_trade_rejects} "
+                    f"({len(result)}/{len(batch)} passed)."
+                )
+            self.logger.debug("Risk check: %d signals in %.1fus, exposure %s", len(batch), elapsed_us, exposure)
+        return result
 
     def check_signals(self, signals, current_exposure=0):
-        filtered = []
-        for sig in signals:
-            size = sig.get("size", 0)
-            if size > self.position_limits["max_per_trade"]:
-                if self.logger:
-                    self.logger.warning(f"Signal {sig} exceeds max per trade. Skipped.")
-                continue
-            if size + current_exposure > self.position_limits["max_total"]:
-                if self.logger:
-                    self.logger.error(f"Signal {sig}: total position exceeds max. Skipped.")
-                continue
-            filtered.append(sig)
-        return filtered
+        return list(self.check_batch(signals, current_exposure))
+
+    def on_fill(self, signal, fill_price=None, qty=None):
+        if self.pre_trade is not None:
+            self.pre_trade.on_fill(
+                signal["symbol"], signal["action"],
+                signal["size"] if qty is None else qty,
+                signal["price"] if fill_price is None else fill_price,
+                signal.get("strategy", "") or ""
+            )
+
+    def on_order_failed(self, signal):
+        if self.pre_trade is not None:
+            self.pre_trade.release(signal["symbol"], signal.get("strategy", "") or "")
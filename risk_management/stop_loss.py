@@ -3,6 +3,7 @@ stop_loss.py
 Implements fixed, trailing, and dynamic stop loss algorithms.
 """
 
+import heapq
 from typing import Optional
 
 class StopLossManager:
@@ -41,3 +42,125 @@ class StopLossManager:
         if self.logger:
             self.logger.debug(f"[StopLossManager] Computed stop: {stop}")
         return round(stop, 2)
+
+class StopLossEngine:
+    """
+    Tracks stops for many long positions and evaluates them per tick.
+    Per instrument, active stops sit in a max-heap keyed by stop price and trailing positions in a
+    min-heap keyed by their running high, so a tick only touches stops it actually crossed and
+    trailing stops whose high it raised. Superseded heap entries are dropped lazily via versions.
+    Supports the same fixed / trailing / dynamic modes as StopLossManager.
+    """
+
+    def __init__(
+        self,
+        mode: str = 'fixed',
+        fixed_pct: float = 2.5,
+        trail_pct: float = 2.0,
+        logger=None
+    ):
+        self.mode = mode
+        self.fixed_pct = fixed_pct
+        self.trail_pct = trail_pct
+        self.logger = logger
+        self._calc = StopLossManager(mode, fixed_pct, trail_pct)
+        # pos_id -> [instrument, mode, stop, highest, trail_pct, version]
+        self.positions = {}
+        self._stop_heaps = {}
+        self._trail_heaps = {}
+        self._dynamic = {}
+
+    def add(
+        self,
+        pos_id,
+        instrument: str,
+        entry_price: float,
+        mode: Optional[str] = None,
+        highest_price: Optional[float] = None,
+        indicator: Optional[float] = None,
+        trail_pct: Optional[float] = None
+    ) -> float:
+        mode = mode or self.mode
+        trail_pct = self.trail_pct if trail_pct is None else trail_pct
+        if pos_id in self.positions:
+            self.remove(pos_id)
+        self._calc.mode = mode
+        self._calc.trail_pct = trail_pct
+        highest = max(entry_price, highest_price or entry_price)
+        stop = self._calc.stop_loss_price(entry_price, highest_price=highest, indicator=indicator)
+        self.positions[pos_id] = [instrument, mode, stop, highest, trail_pct, 0]
+        heapq.heappush(self._stop_heaps.setdefault(instrument, []), (-stop, 0, pos_id))
+        if mode == 'trailing':
+            heapq.heappush(self._trail_heaps.setdefault(instrument, []), (highest, 0, pos_id))
+        elif mode == 'dynamic':
+            self._dynamic.setdefault(instrument, set()).add(pos_id)
+        return stop
+
+    def remove(self, pos_id) -> None:
+        pos = self.positions.pop(pos_id, None)
+        if pos and pos[1] == 'dynamic':
+            self._dynamic[pos[0]].discard(pos_id)
+
+    def stop_price(self, pos_id) -> Optional[float]:
+        pos = self.positions.get(pos_id)
+        return pos[2] if pos else None
+
+    def _set_stop(self, pos_id, pos, stop: float) -> None:
+        pos[2] = stop
+        pos[5] += 1
+        heapq.heappush(self._stop_heaps[pos[0]], (-stop, pos[5], pos_id))
+
+    def update_dynamic(self, instrument: str, indicator: float, pos_ids=None) -> None:
+        """
+        Move dynamic stops on `instrument` (or only `pos_ids`) to the new indicator level.
+        """
+        for pos_id in (pos_ids if pos_ids is not None else list(self._dynamic.get(instrument, ()))):
+            pos = self.positions.get(pos_id)
+            if pos and pos[1] == 'dynamic':
+                self._set_stop(pos_id, pos, round(indicator, 2))
+
+    def on_tick(self, instrument: str, price: float) -> list:
+        """
+        Returns [(pos_id, stop, price)] for every stop crossed by this tick; those positions are removed.
+        """
+        triggered = []
+        heap = self._stop_heaps.get(instrument)
+        if heap:
+            while heap and -heap[0][0] >= price:
+                neg_stop, version, pos_id = heapq.heappop(heap)
+                pos = self.positions.get(pos_id)
+                if pos is None or pos[5] != version:
+                    continue
+                triggered.append((pos_id, -neg_stop, price))
+                self.remove(pos_id)
+            self._maybe_compact(instrument)
+
+        trail = self._trail_heaps.get(instrument)
+        if trail:
+            raised = []
+            while trail and trail[0][0] < price:
+                _, version, pos_id = heapq.heappop(trail)
+                pos = self.positions.get(pos_id)
+                if pos is None or pos[1] != 'trailing' or pos[5] != version:
+                    continue
+                raised.append((pos_id, pos))
+            # All trailing stops below the new high move together in one batch.
+            for pos_id, pos in raised:
+                pos[3] = price
+                self._set_stop(pos_id, pos, round(price * (1 - pos[4] / 100), 2))
+                heapq.heappush(trail, (price, pos[5], pos_id))
+
+        if triggered and self.logger:
+            self.logger.info("[StopLossEngine] %d stop(s) hit on %s @ %s", len(triggered), instrument, price)
+        return triggered
+
+    def _maybe_compact(self, instrument: str) -> None:
+        heap = self._stop_heaps[instrument]
+        if len(heap) > 64 and len(heap) > 4 * len(self.positions):
+            live = [(-pos[2], pos[5], pid) for pid, pos in self.positions.items() if pos[0] == instrument]
+            heapq.heapify(live)
+            self._stop_heaps[instrument] = live
+            trail = [(pos[3], pos[5], pid) for pid, pos in self.positions.items()
+                     if pos[0] == instrument and pos[1] == 'trailing']
+            heapq.heapify(trail)
+            self._trail_heaps[instrument] = trail
@@ -23,6 +23,12 @@ class BaseStrategy(ABC):
         self.data_fetcher = data_fetcher
         self.risk_manager = risk_manager
         self.logger = logger
+        # Set by BacktestRunner to share indicator values across overlapping windows
+        self.indicator_cache = None
+        # Set by StrategyManager: the shared BarResampler serving every timeframe of bars()
+        self.resampler = None
+        # Start time of the newest candle passed to generate_signals() by the engine
+        self.last_bar = None
 
     @abstractmethod
     def initialize(self) -> None:
@@ -40,6 +46,65 @@ class BaseStrategy(ABC):
     def manage_positions(self) -> None:
         pass
 
+    @property
+    def instrument_token(self) -> int:
+        return self.params.get("instrument_token", 260105)
+
+    @property
+    def interval(self) -> str:
+        """
+        Candle interval passed to generate_signals().
+        """
+        return self.params.get("interval", "5minute")
+
+    def timeframes(self) -> List[str]:
+        """
+        Every interval this strategy reads: its own plus `timeframes` from params,
+        e.g. timeframes: ["15minute"] for a higher-timeframe trend filter.
+        """
+        return [self.interval] + [tf for tf in self.params.get("timeframes", []) if tf != self.interval]
+
+    def bars(self, interval: Optional[str] = None, include_partial: bool = True) -> Any:
+        """
+        Latest candles of one of timeframes() for this strategy's instrument.
+        """
+        return self.resampler.frame(self.instrument_token, interval or self.interval, include_partial)
+
+    def indicator(self, key: Any, compute: Any, market_data: Any, lookback: int = 1) -> Any:
+        """
+        compute(market_data), served from the attached IndicatorCache when there is one.
+        key must identify the indicator and its params, e.g. ("sma", "close", 20).
+        """
+        if self.indicator_cache is None:
+            return compute(market_data)
+        return self.indicator_cache.get(key, compute, market_data, lookback)
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        JSON-serializable rolling state for engine checkpoints. Strategies that carry state across
+        polls (running indicator values, pending setups) extend this and set_state().
+        """
+        return {"last_bar": self.last_bar.isoformat() if self.last_bar is not None else None}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        import pandas as pd
+        last_bar = state.get("last_bar")
+        self.last_bar = pd.Timestamp(last_bar) if last_bar else None
+
+    def record_fill(self, signal: Any, fill_price: Optional[float] = None) -> None:
+        """
+        Report an executed order back to the risk manager so exposure stays current.
+        """
+        if self.risk_manager is not None and hasattr(self.risk_manager, "on_fill"):
+            self.risk_manager.on_fill(signal, fill_price)
+
+    def record_order_failure(self, signal: Any) -> None:
+        """
+        Release the risk reservation of an order that was not placed.
+        """
+        if self.risk_manager is not None and hasattr(self.risk_manager, "on_order_failed"):
+            self.risk_manager.on_order_failed(signal)
+
     def report(self) -> Dict[str, Any]:
         return {
             "strategy": self.name,
@@ -2,6 +2,7 @@
 import pandas as pd
 from typing import List, Dict
 from edgeX.strategies.base_strategy import BaseStrategy
+from edgeX.strategies.signals import Signal
 
 class BollingerReversionStrategy(BaseStrategy):
     def initialize(self) -> None:
@@ -12,13 +13,21 @@ class BollingerReversionStrategy(BaseStrategy):
         if self.logger:
             self.logger.info(f"[{self.name}] Initialized with window {self.window} and std {self.num_std}")
 
-    def generate_signals(self, market_data: pd.DataFrame) -> List[Dict]:
+    def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
         signals = []
         if market_data is None or market_data.empty or len(market_data) < self.window:
             return signals
         try:
-            rolling_mean = market_data['close'].rolling(window=self.window).mean()
-            rolling_std = market_data['close'].rolling(window=self.window).std()
+            rolling_mean = self.indicator(
+                ("sma", "close", self.window),
+                lambda df: df['close'].rolling(window=self.window).mean(),
+                market_data, lookback=self.window
+            )
+            rolling_std = self.indicator(
+                ("rolling_std", "close", self.window),
+                lambda df: df['close'].rolling(window=self.window).std(),
+                market_data, lookback=self.window
+            )
             upper_band = rolling_mean + self.num_std * rolling_std
             lower_band = rolling_mean - self.num_std * rolling_std
 
@@ -29,25 +38,27 @@ class BollingerReversionStrategy(BaseStrategy):
             if last_close > upper_band.iloc[-1]:
                 # Price above upper band - buy put option expecting reversion
                 symbol = f"NIFTY{strike}PE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_PUT",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Price above upper Bollinger Band, mean reversion expected"
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    action="BUY_PUT",
+                    size=self.lot_size,
+                    price=price,
+                    reason="Price above upper Bollinger Band, mean reversion expected",
+                    strategy=self.name
+                ))
             elif last_close < lower_band.iloc[-1]:
                 # Price below lower band - buy call option expecting reversion
                 symbol = f"NIFTY{strike}CE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_CALL",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Price below lower Bollinger Band, mean reversion expected"
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    action="BUY_CALL",
+                    size=self.lot_size,
+                    price=price,
+                    reason="Price below lower Bollinger Band, mean reversion expected",
+                    strategy=self.name
+                ))
             if self.logger:
-                self.logger.info(f"[{self.name}] Signals generated: {signals}")
+                self.logger.info("[%s] Signals generated: %s", self.name, signals)
             return signals
         except Exception as e:
             if self.logger:
@@ -59,7 +70,7 @@ class BollingerReversionStrategy(BaseStrategy):
             return
         for sig in signals:
             try:
-                self.broker.place_order(
+                order = self.broker.place_order(
                     exchange='NSE',
                     tradingsymbol=sig["symbol"],
                     txn_type='BUY',
@@ -67,7 +78,12 @@ class BollingerReversionStrategy(BaseStrategy):
                     order_type='MARKET',
                     product='MIS'
                 )
+                if order:
+                    self.record_fill(sig)
+                else:
+                    self.record_order_failure(sig)
             except Exception as e:
+                self.record_order_failure(sig)
                 if self.logger:
                     self.logger.error(f"[{self.name}] Order execution failed: {e}", exc_info=True)
 
@@ -0,0 +1,91 @@
+"""
+indicator_cache.py
+Shared indicator cache for backtests over slices of one historical frame.
+Each indicator is computed once over the full frame; every window or bar-by-bar prefix that is a
+contiguous slice of that frame reads its values from the cached array instead of recomputing them.
+Only causal indicators with a finite lookback (rolling windows) may be cached: the first
+lookback-1 bars of a slice are masked to NaN so results match computing on the slice itself.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+def _raw(index: pd.Index) -> np.ndarray:
+    return index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy()
+
+class IndicatorCache:
+    def __init__(self, base: pd.DataFrame, max_views: int = 512):
+        self.base = base
+        self.index = base.index
+        self._usable = self.index.is_unique
+        # Raw index values -> position, so locating a slice never boxes Timestamps
+        self._keys = _raw(self.index)
+        self._position = {key: i for i, key in enumerate(self._keys.tolist())} if self._usable else {}
+        self.max_views = max_views
+        self._full = {}
+        # (key, slice start) -> Series over base[start:] with the warm-up bars masked
+        self._views: "OrderedDict[Tuple[Hashable, int], pd.Series]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def locate(self, market_data: pd.DataFrame) -> Optional[Tuple[int, int]]:
+        """
+        (start, stop) positions of market_data inside the base frame, or None when it is not a
+        contiguous slice of it.
+        """
+        if not self._usable or market_data is None or market_data.empty:
+            return None
+        keys = _raw(market_data.index)
+        if keys.dtype != self._keys.dtype:
+            return None
+        start = self._position.get(keys[0].item())
+        if start is None:
+            return None
+        stop = start + len(keys)
+        if stop > len(self._keys) or self._keys[stop - 1] != keys[-1]:
+            return None
+        return start, stop
+
+    def get(
+        self,
+        key: Hashable,
+        compute: Callable[[pd.DataFrame], Any],
+        market_data: pd.DataFrame,
+        lookback: int = 1
+    ) -> pd.Series:
+        loc = self.locate(market_data)
+        if loc is None:
+            self.misses += 1
+            return compute(market_data)
+        start, stop = loc
+        view_key = (key, start)
+        series = self._views.get(view_key)
+        if series is not None:
+            self.hits += 1
+            self._views.move_to_end(view_key)
+            return series.iloc[:stop - start]
+
+        full = self._full.get(key)
+        if full is None:
+            self.misses += 1
+            full = np.asarray(compute(self.base), dtype=np.float64)
+            self._full[key] = full
+        else:
+            self.hits += 1
+        values = full[start:].copy()
+        values[:max(lookback - 1, 0)] = np.nan
+        series = pd.Series(values, index=self.index[start:], copy=False)
+        self._views[view_key] = series
+        if len(self._views) > self.max_views:
+            self._views.popitem(last=False)
+        return series.iloc[:stop - start]
+
+    def clear(self) -> None:
+        self._full.clear()
+        self._views.clear()
+
+    def stats(self) -> dict:
+        return {"indicators": len(self._full), "views": len(self._views), "hits": self.hits, "misses": self.misses}
@@ -2,6 +2,7 @@
 import pandas as pd
 from typing import List, Dict
 from edgeX.strategies.base_strategy import BaseStrategy
+from edgeX.strategies.signals import Signal
 
 class MomentumBreakoutStrategy(BaseStrategy):
     def initialize(self) -> None:
@@ -12,39 +13,49 @@ class MomentumBreakoutStrategy(BaseStrategy):
         if self.logger:
             self.logger.info(f"[{self.name}] Initialized with short MA {self.short_ma_period} and long MA {self.long_ma_period}")
 
-    def generate_signals(self, market_data: pd.DataFrame) -> List[Dict]:
+    def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
         signals = []
         if market_data is None or market_data.empty or len(market_data) < self.long_ma_period:
             return signals
         try:
-            short_ma = market_data['close'].rolling(window=self.short_ma_period).mean()
-            long_ma = market_data['close'].rolling(window=self.long_ma_period).mean()
+            short_ma = self.indicator(
+                ("sma", "close", self.short_ma_period),
+                lambda df: df['close'].rolling(window=self.short_ma_period).mean(),
+                market_data, lookback=self.short_ma_period
+            )
+            long_ma = self.indicator(
+                ("sma", "close", self.long_ma_period),
+                lambda df: df['close'].rolling(window=self.long_ma_period).mean(),
+                market_data, lookback=self.long_ma_period
+            )
             if short_ma.iloc[-2] < long_ma.iloc[-2] and short_ma.iloc[-1] > long_ma.iloc[-1]:
                 # Bullish crossover: buy call
                 price = market_data['close'].iloc[-1]
                 strike = int(round(price / 50.0) * 50)
                 symbol = f"NIFTY{strike}CE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_CALL",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Momentum bullish crossover"
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    action="BUY_CALL",
+                    size=self.lot_size,
+                    price=price,
+                    reason="Momentum bullish crossover",
+                    strategy=self.name
+                ))
             elif short_ma.iloc[-2] > long_ma.iloc[-2] and short_ma.iloc[-1] < long_ma.iloc[-1]:
                 # Bearish crossover: buy put
                 price = market_data['close'].iloc[-1]
                 strike = int(round(price / 50.0) * 50)
                 symbol = f"NIFTY{strike}PE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_PUT",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Momentum bearish crossover"
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    action="BUY_PUT",
+                    size=self.lot_size,
+                    price=price,
+                    reason="Momentum bearish crossover",
+                    strategy=self.name
+                ))
             if self.logger:
-                self.logger.info(f"[{self.name}] Signals generated: {signals}")
+                self.logger.info("[%s] Signals generated: %s", self.name, signals)
             return signals
         except Exception as e:
             if self.logger:
@@ -56,7 +67,7 @@ class MomentumBreakoutStrategy(BaseStrategy):
             return
         for sig in signals:
             try:
-                self.broker.place_order(
+                order = self.broker.place_order(
                     exchange='NSE',
                     tradingsymbol=sig["symbol"],
                     txn_type='BUY',
@@ -64,7 +75,12 @@ class MomentumBreakoutStrategy(BaseStrategy):
                     order_type='MARKET',
                     product='MIS'
                 )
+                if order:
+                    self.record_fill(sig)
+                else:
+                    self.record_order_failure(sig)
             except Exception as e:
+                self.record_order_failure(sig)
                 if self.logger:
                     self.logger.error(f"[{self.name}] Order execution failed: {e}", exc_info=True)
 
@@ -0,0 +1,56 @@
+"""
+registry.py
+Name -> strategy class registry used to build strategies from the `strategies:` config list.
+Strategy modules are imported lazily, the first time an enabled strategy asks for them.
+"""
+
+import importlib
+from typing import Any, Dict, List, Union
+
+STRATEGY_REGISTRY: Dict[str, Union[str, type]] = {
+    "SupertrendADX": "edgeX.strategies.supertrend_adx:SupertrendADXStrategy",
+    "MomentumBreakout": "edgeX.strategies.momentum_breakout:MomentumBreakoutStrategy",
+    "BollingerReversion": "edgeX.strategies.bollinger_reversion:BollingerReversionStrategy",
+}
+
+def register_strategy(name: str, target: Union[str, type]) -> None:
+    """
+    Register a strategy under `name`, either as a class or as a lazy "module:ClassName" path.
+    """
+    STRATEGY_REGISTRY[name] = target
+
+def available_strategies() -> List[str]:
+    return sorted(STRATEGY_REGISTRY)
+
+def get_strategy_class(name: str) -> type:
+    """
+    Resolve a registered strategy name to its class, importing its module on first use.
+    """
+    if name not in STRATEGY_REGISTRY:
+        raise KeyError(f"Unknown strategy '{name}'. Registered: {available_strategies()}")
+    target = STRATEGY_REGISTRY[name]
+    if isinstance(target, str):
+        module_path, _, class_name = target.partition(":")
+        target = getattr(importlib.import_module(module_path), class_name)
+        STRATEGY_REGISTRY[name] = target
+    return target
+
+def parse_strategy_specs(entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Turn the `strategies:` config list into {instance_name: {"strategy": key, "params": {...}}}.
+    Each entry needs a unique `name`; `strategy` selects the registered class (defaults to `name`),
+    so one class can run as many instances with different params/instruments.
+    Entries with `enabled: false` are skipped and never imported.
+    """
+    specs = {}
+    for entry in entries or []:
+        if not entry.get("enabled", True):
+            continue
+        name = entry["name"]
+        if name in specs:
+            raise ValueError(f"Duplicate strategy instance name '{name}' in config.")
+        specs[name] = {
+            "strategy": entry.get("strategy", name),
+            "params": entry.get("params", {}) or {},
+        }
+    return specs
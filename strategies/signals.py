@@ -0,0 +1,109 @@
+"""
+signals.py
+Compact typed trade signals.
+    - Signal: __slots__ record emitted by strategies (keeps dict-style access for older consumers)
+    - SignalBatch: column-wise view of many signals in a NumPy structured array for vectorized checks
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Union
+import numpy as np
+
+ACTIONS = ("BUY_CALL", "BUY_PUT", "SELL_CALL", "SELL_PUT", "BUY", "SELL")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+SIGNAL_DTYPE = np.dtype([
+    ("size", np.int32),
+    ("price", np.float64),
+    ("action", np.int8),
+])
+
+class Signal:
+    __slots__ = ("symbol", "action", "size", "price", "reason", "strategy")
+
+    def __init__(self, symbol: str, action: str, size: int, price: float, reason: str = "", strategy: str = ""):
+        self.symbol = symbol
+        self.action = action
+        self.size = int(size)
+        self.price = float(price)
+        self.reason = reason
+        self.strategy = strategy
+
+    @classmethod
+    def from_dict(cls, sig: Dict[str, Any]) -> "Signal":
+        return cls(
+            sig["symbol"], sig["action"], sig.get("size", 0), sig.get("price", 0.0),
+            sig.get("reason", ""), sig.get("strategy", "")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    # Dict-style access so code written against the old signal dicts keeps working.
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def __repr__(self) -> str:
+        return f"Signal({self.action} {self.symbol} x{self.size} @ {self.price:.2f})"
+
+class SignalBatch:
+    """
+    Immutable batch of signals. Numeric fields live in `data` (SIGNAL_DTYPE) so limit checks
+    run as array operations; `signals` keeps the Signal objects in the same order.
+    """
+    __slots__ = ("signals", "data")
+
+    def __init__(self, signals: List[Signal], data: np.ndarray = None):
+        self.signals = signals
+        if data is None:
+            data = np.array(
+                [(s.size, s.price, ACTION_CODES.get(s.action, -1)) for s in signals],
+                dtype=SIGNAL_DTYPE
+            )
+        self.data = data
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[Union[Signal, Dict[str, Any]]]) -> "SignalBatch":
+        if isinstance(signals, SignalBatch):
+            return signals
+        return cls([s if isinstance(s, Signal) else Signal.from_dict(s) for s in signals or []])
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self.data["size"]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.data["price"]
+
+    @property
+    def actions(self) -> np.ndarray:
+        return self.data["action"]
+
+    @property
+    def notional(self) -> np.ndarray:
+        return self.data["size"] * self.data["price"]
+
+    def select(self, mask: np.ndarray) -> "SignalBatch":
+        idx = np.flatnonzero(mask)
+        return SignalBatch([self.signals[i] for i in idx], self.data[idx])
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    def __iter__(self) -> Iterator[Signal]:
+        return iter(self.signals)
+
+    def __getitem__(self, i: int) -> Signal:
+        return self.signals[i]
+
+    def __repr__(self) -> str:
+        return f"SignalBatch({len(self)} signals)"
@@ -6,6 +6,7 @@ Advanced implementation of Supertrend + ADX strategy for options.
 import pandas as pd
 from typing import Any, Dict, List, Optional
 from edgeX.strategies.base_strategy import BaseStrategy
+from edgeX.strategies.signals import Signal
 from edgeX.strategies.strategy_utils import calc_supertrend, calc_adx
 
 class SupertrendADXStrategy(BaseStrategy):
@@ -16,7 +17,7 @@ class SupertrendADXStrategy(BaseStrategy):
         if self.logger:
             self.logger.info(f"[{self.name}] Initialized for {self.underlying_symbol} ADX>{self.adx_threshold} lot:{self.lot_size}")
 
-    def generate_signals(self, market_data: pd.DataFrame) -> List[Dict[str, Any]]:
+    def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
         if market_data is None or market_data.empty:
             if self.logger:
                 self.logger.warning(f"[{self.name}] Market data empty.")
@@ -37,15 +38,16 @@ class SupertrendADXStrategy(BaseStrategy):
                 price = last['close']
                 strike = int(round(price / 50.0) * 50)
                 symbol = f"NIFTY{strike}CE" if option_action == "BUY_CALL" else f"NIFTY{strike}PE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": option_action,
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": reason
-                })
+                signals.append(Signal(
+                    symbol=symbol,
+                    action=option_action,
+                    size=self.lot_size,
+                    price=price,
+                    reason=reason,
+                    strategy=self.name
+                ))
             if self.logger:
-                self.logger.info(f"[{self.name}] Signals generated: {signals}")
+                self.logger.info("[%s] Signals generated: %s", self.name, signals)
             return signals
         except Exception as e:
             if self.logger:
@@ -59,8 +61,8 @@ class SupertrendADXStrategy(BaseStrategy):
             return
         for sig in signals:
             try:
-                self.logger.info(f"[{self.name}] Executing trade: {sig}")
-                self.broker.place_order(
+                self.logger.info("[%s] Executing trade: %s", self.name, sig)
+                order = self.broker.place_order(
                     exchange='NSE',
                     tradingsymbol=sig["symbol"],
                     txn_type='BUY',
@@ -68,7 +70,12 @@ class SupertrendADXStrategy(BaseStrategy):
                     order_type='MARKET',
                     product='MIS'
                 )
+                if order:
+                    self.record_fill(sig)
+                else:
+                    self.record_order_failure(sig)
             except Exception as e:
+                self.record_order_failure(sig)
                 if self.logger:
                     self.logger.error(f"[{self.name}] Order execution failed: {e}", exc_info=True)
 
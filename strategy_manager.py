@@ -8,115 +8,157 @@ Main orchestrator for:
 Supports single or multiple concurrent strategies.
 """
 
-import time
+import copy
+import datetime as dt
 import threading
 
-from edgeX.strategies.supertrend_adx import SupertrendADXStrategy
+from edgeX.strategies.registry import get_strategy_class, parse_strategy_specs
 from edgeX.broker.zerodha_connector import ZerodhaConnector
 from edgeX.risk_management.risk_policies import BasicRiskManager
+from edgeX.risk_management.pre_trade_risk import PreTradeRiskEngine
 from edgeX.data_ingestion.market_data import MarketDataFetcher
+from edgeX.data_ingestion.resampler import BarResampler
+from edgeX.utils.clock import SystemClock
 
 class StrategyManager:
-    def __init__(self, config, logger=None):
+    def __init__(self, config, logger=None, kite=None, clock=None):
         self.config = config
         self.logger = logger
-        self.broker = ZerodhaConnector(config.get("broker_config", "config/zerodha.yaml"))
-        self.data_fetcher = MarketDataFetcher(config.get("broker_config", "config/zerodha.yaml"))
-        self.risk_manager = BasicRiskManager(config.get("risk", {}), logger=self.logger)
+        # kite/clock are injected by session replays; live runs use KiteConnect and wall time
+        self.kite = kite
+        self.clock = clock or SystemClock()
+        self.broker = ZerodhaConnector(config.get("broker_config", "config/zerodha.yaml"), kite=kite)
+        self.data_fetcher = MarketDataFetcher(config.get("broker_config", "config/zerodha.yaml"), kite=kite)
+        self.pre_trade_risk = PreTradeRiskEngine(
+            config.get("risk", {}).get("pre_trade", {}), logger=self.logger, clock=self.clock.monotonic
+        )
+        self.risk_manager = self.make_risk_manager(config.get("risk", {}))
+        # Only the base interval is fetched; every strategy timeframe is resampled from it
+        bot = config.get("bot", {})
+        self.resampler = BarResampler(bot.get("base_interval", "minute"), capacity=bot.get("bar_capacity", 5000), logger=self.logger)
         self.strategies = []
+        self._specs = {}
         self.running = False
-# edgeX/strategies/bollinger_reversion.py
-import pandas as pd
-from typing import List, Dict
-from edgeX.strategies.base_strategy import BaseStrategy
-
-class BollingerReversionStrategy(BaseStrategy):
-    def initialize(self) -> None:
-        self.underlying_symbol = self.params.get("underlying_symbol", "NSE:NIFTY 50")
-        self.window = self.params.get("window", 20)
-        self.num_std = self.params.get("num_std", 2)
-        self.lot_size = self.params.get("lot_size", 50)
-        if self.logger:
-            self.logger.info(f"[{self.name}] Initialized with window {self.window} and std {self.num_std}")
-
-    def generate_signals(self, market_data: pd.DataFrame) -> List[Dict]:
-        signals = []
-        if market_data is None or market_data.empty or len(market_data) < self.window:
-            return signals
-        try:
-            rolling_mean = market_data['close'].rolling(window=self.window).mean()
-            rolling_std = market_data['close'].rolling(window=self.window).std()
-            upper_band = rolling_mean + self.num_std * rolling_std
-            lower_band = rolling_mean - self.num_std * rolling_std
-
-            last_close = market_data['close'].iloc[-1]
-            price = last_close
-            strike = int(round(price / 50.0) * 50)
-
-            if last_close > upper_band.iloc[-1]:
-                # Price above upper band - buy put option expecting reversion
-                symbol = f"NIFTY{strike}PE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_PUT",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Price above upper Bollinger Band, mean reversion expected"
-                })
-            elif last_close < lower_band.iloc[-1]:
-                # Price below lower band - buy call option expecting reversion
-                symbol = f"NIFTY{strike}CE"
-                signals.append({
-                    "symbol": symbol,
-                    "action": "BUY_CALL",
-                    "size": self.lot_size,
-                    "price": price,
-                    "reason": "Price below lower Bollinger Band, mean reversion expected"
-                })
-            if self.logger:
-                self.logger.info(f"[{self.name}] Signals generated: {signals}")
-            return signals
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"[{self.name}] Error generating signals: {e}", exc_info=True)
-            return []
-
-    def execute_trades(self, signals: List[Dict]) -> None:
-        if not self.broker or not signals:
-            return
-        for sig in signals:
-            try:
-                self.broker.place_order(
-                    exchange='NSE',
-                    tradingsymbol=sig["symbol"],
-                    txn_type='BUY',
-                    quantity=sig["size"],
-                    order_type='MARKET',
-                    product='MIS'
-                )
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"[{self.name}] Order execution failed: {e}", exc_info=True)
 
-    def manage_positions(self) -> None:
-        if self.logger:
-            self.logger.debug(f"[{self.name}] Position management not implemented yet.")
+    def make_risk_manager(self, risk_config):
+        return BasicRiskManager(risk_config, logger=self.logger, pre_trade=self.pre_trade_risk)
 
-    def load_strategies(self):
-        st_params = self.config.get("strategy_params", {})
-        # You can extend with multiple strategies; here only SupertrendADX
-        st_strategy = SupertrendADXStrategy(
-            name="SupertrendADX",
-            params=st_params,
+    def strategy_specs(self, config):
+        """
+        Returns {instance_name: {"strategy": registry_key, "params": {...}}} for every
+        enabled entry of the `strategies:` config list.
+        """
+        if "strategies" in config:
+            return parse_strategy_specs(config["strategies"])
+        # Legacy single-strategy configs
+        return {"SupertrendADX": {"strategy": "SupertrendADX", "params": config.get("strategy_params", {})}}
+
+    def build_strategy(self, name, spec):
+        strategy_class = get_strategy_class(spec["strategy"])
+        strategy = strategy_class(
+            name=name,
+            params=spec["params"],
             broker=self.broker,
             data_fetcher=self.data_fetcher,
             risk_manager=self.risk_manager,
             logger=self.logger
         )
-        st_strategy.initialize()
-        self.strategies.append(st_strategy)
+        strategy.resampler = self.resampler
+        self.resampler.subscribe(strategy.instrument_token, strategy.timeframes())
+        strategy.initialize()
+        return strategy
+
+    def load_strategies(self):
+        self._specs = copy.deepcopy(self.strategy_specs(self.config))
+        self.strategies = [self.build_strategy(name, spec) for name, spec in self._specs.items()]
+        if self.logger:
+            self.logger.info(f"Strategies loaded: {list(self._specs)}")
+
+    def apply_config(self, new_config):
+        """
+        Diff new_config against the running config and apply only what changed.
+        Connections, caches and unaffected strategies (with their state) are kept;
+        only strategies whose params changed are rebuilt.
+        Returns a dict describing the applied changes.
+        """
+        old_config = self.config
+        self.config = new_config
+        changes = {"added": [], "removed": [], "rebuilt": [], "kept": [], "rebound": []}
+
+        old_broker_cfg = old_config.get("broker_config", "config/zerodha.yaml")
+        new_broker_cfg = new_config.get("broker_config", "config/zerodha.yaml")
+        if new_broker_cfg != old_broker_cfg:
+            self.broker = ZerodhaConnector(new_broker_cfg, kite=self.kite)
+            self.data_fetcher = MarketDataFetcher(new_broker_cfg, kite=self.kite)
+            changes["rebound"].append("broker")
+        if new_config.get("risk", {}) != old_config.get("risk", {}):
+            # Exposure state survives the reload; only the limits change.
+            self.pre_trade_risk.set_limits(new_config.get("risk", {}).get("pre_trade", {}))
+            self.risk_manager = self.make_risk_manager(new_config.get("risk", {}))
+            changes["rebound"].append("risk_manager")
+
+        current = {s.name: s for s in self.strategies}
+        new_specs = copy.deepcopy(self.strategy_specs(new_config))
+        strategies = []
+        for name, spec in new_specs.items():
+            strat = current.get(name)
+            if strat is None:
+                strategies.append(self.build_strategy(name, spec))
+                changes["added"].append(name)
+            elif self._specs.get(name) != spec:
+                strategies.append(self.build_strategy(name, spec))
+                changes["rebuilt"].append(name)
+            else:
+                strat.broker = self.broker
+                strat.data_fetcher = self.data_fetcher
+                strat.risk_manager = self.risk_manager
+                strategies.append(strat)
+                changes["kept"].append(name)
+        changes["removed"] = [name for name in current if name not in new_specs]
+
+        self.strategies = strategies
+        self._specs = new_specs
         if self.logger:
-            self.logger.info("Strategies loaded.")
+            self.logger.info(f"Config diff applied: {changes}")
+        return changes
+
+    def strategy_spec(self, name):
+        """
+        The {"strategy": ..., "params": ...} entry a running strategy was built from.
+        """
+        return self._specs.get(name)
+
+    def history_window(self):
+        """
+        (from_date, to_date) for candle requests: the last `bot.history_days` days up to now.
+        """
+        now = self.clock.now()
+        days = self.config.get("bot", {}).get("history_days", 5)
+        return (now - dt.timedelta(days=days)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d %H:%M:%S")
+
+    def refresh_bars(self):
+        """
+        One base-interval fetch per instrument, fed to the resampler. The first fetch covers
+        history_window(); later ones start at the newest candle already held.
+        """
+        from_date, to_date = self.history_window()
+        now = self.clock.now()
+        for token in dict.fromkeys(s.instrument_token for s in self.strategies):
+            last = self.resampler.last_timestamp(token)
+            try:
+                df = self.data_fetcher.fetch_historical(
+                    instrument_token=token,
+                    from_date=last.strftime("%Y-%m-%d %H:%M:%S") if last is not None else from_date,
+                    to_date=to_date,
+                    interval=self.resampler.base_interval
+                )
+                self.resampler.update(token, df, now=now)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error refreshing bars for {token}: {e}", exc_info=True)
+
+    def market_data(self, strat):
+        return strat.bars(strat.interval, include_partial=True)
 
     def run_loop(self, poll_interval=300):
         self.running = True
@@ -124,15 +166,10 @@ class BollingerReversionStrategy(BaseStrategy):
         if self.logger:
             self.logger.info("Starting strategy manager loop.")
         while self.running:
+            self.refresh_bars()
             for strat in self.strategies:
                 try:
-                    # Fetch latest market data (can be from live or cache/historical for backtest)
-                    md = self.data_fetcher.fetch_historical(
-                        instrument_token=260105,  # Example for Nifty 50
-                        from_date="2025-08-07",
-                        to_date="2025-08-08",
-                        interval="5minute"
-                    )
+                    md = self.market_data(strat)
                     if md.empty:
                         continue
                     signals = strat.generate_signals(md)
@@ -144,7 +181,7 @@ class BollingerReversionStrategy(BaseStrategy):
                 except Exception as e:
                     if self.logger:
                         self.logger.error(f"Error in strategy execution: {e}", exc_info=True)
-            time.sleep(poll_interval)
+            self.clock.sleep(poll_interval)
 
     def stop(self):
         self.running = False
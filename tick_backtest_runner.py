@@ -0,0 +1,315 @@
+"""
+tick_backtest_runner.py
+Tick-replay backtesting engine.
+Streams recorded ticks from a TickStore in timestamp order across instruments, builds the
+underlying's candles on the fly for the strategy, and drives a StopLossEngine and a fill simulator
+at tick granularity. Ticks of instruments with no open position or working order are only
+aggregated (vectorized); the per-tick path runs just where something can happen.
+Signals on instruments without recorded ticks (e.g. the strategies' NIFTY{strike}CE/PE legs) are
+booked on synthetic premiums at bar closes when an OptionPremiumModel is given, and rejected
+otherwise; they are never filled on the underlying.
+"""
+
+import heapq
+import time
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from edgeX.analytics.backtest_analyzer import BacktestAnalyzer
+from edgeX.analytics.option_pricing import OptionBook
+from edgeX.backtest_runner import WARMUP_BARS
+from edgeX.risk_management.stop_loss import StopLossEngine
+
+class FillSimulator:
+    """
+    Market orders fill on the instrument's own ticks once `latency_ms` has passed, at the tick
+    price moved `slippage_bps` against the order. With max_participation set, each tick fills at
+    most that fraction of its volume, so large orders fill partially over several ticks.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        slippage_bps: float = 1.0,
+        max_participation: Optional[float] = None,
+        logger=None
+    ):
+        self.latency_ns = int(latency_ms * 1e6)
+        self.slippage = slippage_bps / 1e4
+        self.max_participation = max_participation
+        self.logger = logger
+        self._queues = defaultdict(deque)
+        self.orders = 0
+
+    def submit(self, key, side: int, qty: float, ts: int, tag: Any) -> Dict[str, Any]:
+        order = {"key": key, "side": side, "qty": qty, "remaining": qty, "notional": 0.0,
+                 "ready_ts": ts + self.latency_ns, "tag": tag}
+        self._queues[key].append(order)
+        self.orders += 1
+        return order
+
+    def has_pending(self, key) -> bool:
+        return bool(self._queues.get(key))
+
+    def on_tick(self, key, ts: int, price: float, volume: int) -> List[Dict[str, Any]]:
+        """
+        Returns the orders completed by this tick, with avg_price and filled_ts set.
+        """
+        queue = self._queues.get(key)
+        if not queue:
+            return []
+        done = []
+        available = float("inf")
+        if self.max_participation and volume > 0:
+            available = max(1, int(volume * self.max_participation))
+        while queue and queue[0]["ready_ts"] <= ts and available > 0:
+            order = queue[0]
+            qty = min(order["remaining"], available)
+            order["notional"] += qty * price * (1 + order["side"] * self.slippage)
+            order["remaining"] -= qty
+            available -= qty
+            if order["remaining"] <= 0:
+                queue.popleft()
+                order["avg_price"] = order["notional"] / order["qty"]
+                order["filled_ts"] = ts
+                done.append(order)
+        return done
+
+    def cancel_all(self) -> None:
+        self._queues.clear()
+
+class TickBacktestRunner:
+    def __init__(
+        self,
+        strategy_class,
+        tick_store,
+        underlying_symbol: str,
+        symbols: Optional[List[str]] = None,
+        bar_seconds: int = 300,
+        lookback_bars: int = 200,
+        initial_capital: float = 1_000_000.0,
+        risk_manager=None,
+        stop_loss: Optional[StopLossEngine] = None,
+        fill_simulator: Optional[FillSimulator] = None,
+        max_hold_seconds: Optional[float] = None,
+        option_model=None,
+        tz: str = "Asia/Kolkata",
+        sink=None,
+        logger=None
+    ):
+        self.strategy_class = strategy_class
+        self.store = tick_store
+        self.underlying_symbol = underlying_symbol
+        symbols = list(symbols) if symbols is not None else tick_store.symbols()
+        if underlying_symbol not in symbols:
+            symbols.insert(0, underlying_symbol)
+        self.symbols = symbols
+        self.bar_ns = int(bar_seconds * 1e9)
+        self.lookback_bars = lookback_bars
+        self.capital = initial_capital
+        self.risk_manager = risk_manager
+        self.stop_loss = stop_loss
+        self.fill_simulator = fill_simulator
+        self.hold_ns = int(max_hold_seconds * 1e9) if max_hold_seconds else None
+        # Optional OptionPremiumModel for signals on instruments the store has no ticks for
+        self.option_model = option_model
+        self.tz = tz
+        self.sink = sink
+        self.logger = logger
+        self.trades = []
+        self.equity_curve = [initial_capital]
+        self.stats: Dict[str, Any] = {}
+
+    def _book(self, ts: int, pnl: float) -> None:
+        date = pd.Timestamp(ts, tz="UTC").tz_convert(self.tz)
+        self.capital += pnl
+        if self.sink is not None:
+            self.sink.add_trade(date, pnl, pnl/self.capital, self.capital)
+            return
+        self.trades.append({"date": date, "pnl": pnl, "returns": pnl/self.capital})
+        self.equity_curve.append(self.capital)
+
+    def _bars_frame(self, bars) -> pd.DataFrame:
+        arr = np.array(bars, dtype=np.float64)
+        index = pd.to_datetime(arr[:, 0].astype(np.int64), unit="ns", utc=True).tz_convert(self.tz)
+        return pd.DataFrame(arr[:, 1:], index=index, columns=["open", "high", "low", "close", "volume"])
+
+    def run(self, params: Dict[str, Any], start=None, end=None) -> Dict[str, Any]:
+        strategy = self.strategy_class(
+            "TickBacktestStrategy",
+            params,
+            broker=None,
+            data_fetcher=None,
+            risk_manager=self.risk_manager,
+            logger=self.logger
+        )
+        strategy.initialize()
+        if self.sink is not None and self.sink.initial_capital is None:
+            self.sink.initial_capital = self.capital
+
+        symbols = self.symbols
+        sid_of = {s: i for i, s in enumerate(symbols)}
+        und = sid_of[self.underlying_symbol]
+        stops = self.stop_loss if self.stop_loss is not None else StopLossEngine()
+        fills = self.fill_simulator if self.fill_simulator is not None else FillSimulator()
+        positions: Dict[int, list] = {}      # pos_id -> [sid, signed qty, entry price, exiting]
+        open_count = defaultdict(int)
+        hold_heap = []
+        active = set()
+        bars = deque(maxlen=self.lookback_bars)
+        cur = None                           # [bar_id, open, high, low, close, volume]
+        last_price = {}
+        next_pos_id = 0
+        n_ticks = n_bars = 0
+        n_option_legs = n_rejected = 0
+        book = None
+        if self.option_model is not None:
+            self.option_model.start(self.bar_ns / 60e9, tz=self.tz)
+            book = OptionBook(self.option_model)
+        began = time.perf_counter()
+
+        def submit_exit(pos_id: int, ts: int) -> None:
+            pos = positions[pos_id]
+            if pos[3]:
+                return
+            pos[3] = True
+            stops.remove(pos_id)
+            fills.submit(pos[0], -1 if pos[1] > 0 else 1, abs(pos[1]), ts, ("exit", pos_id))
+
+        def on_fill(order: Dict[str, Any]) -> None:
+            nonlocal next_pos_id
+            kind, ref = order["tag"]
+            sid = order["key"]
+            ts = order["filled_ts"]
+            if kind == "entry":
+                pos_id = next_pos_id
+                next_pos_id += 1
+                positions[pos_id] = [sid, order["side"] * order["qty"], order["avg_price"], False]
+                open_count[sid] += 1
+                if order["side"] > 0:
+                    stops.add(pos_id, symbols[sid], order["avg_price"])
+                if self.hold_ns:
+                    heapq.heappush(hold_heap, (ts + self.hold_ns, pos_id))
+            else:
+                sid, qty, entry, _ = positions.pop(ref)
+                open_count[sid] -= 1
+                self._book(ts, qty * (order["avg_price"] - entry))
+
+        def on_bar_close(ts: int) -> None:
+            nonlocal n_bars, n_option_legs, n_rejected
+            bar_id, o, h, l, c, v = cur
+            bar_ts = bar_id * self.bar_ns
+            bars.append((bar_ts, o, h, l, c, v))
+            n_bars += 1
+            bar = None
+            if book is not None:
+                bar = self.option_model.append(bar_ts, c)
+                for entry_ts, pnl in book.settle(bar):
+                    self._book(entry_ts, pnl)
+            if len(bars) < min(WARMUP_BARS, self.lookback_bars):
+                return
+            signals = strategy.generate_signals(self._bars_frame(bars))
+            if self.risk_manager:
+                signals = self.risk_manager.check_signals(signals)
+            for sig in signals:
+                sid = sid_of.get(sig["symbol"])
+                if sid is None:
+                    if book is not None and book.open(sig["symbol"], sig["action"], sig["size"], bar, bar_ts):
+                        n_option_legs += 1
+                    else:
+                        n_rejected += 1
+                    continue
+                side = -1 if "SELL" in sig["action"] else 1
+                fills.submit(sid, side, sig["size"], ts, ("entry", sig))
+                active.add(sid)
+
+        for sids, block in self.store.iter_blocks(symbols, start, end):
+            ts_arr, px_arr, vol_arr = block["ts"], block["price"], block["volume"]
+            n_ticks += len(block)
+            und_pos = np.flatnonzero(sids == und)
+            bar_ids = ts_arr[und_pos] // self.bar_ns
+            prev = np.empty_like(bar_ids)
+            if bar_ids.size:
+                prev[0] = cur[0] if cur is not None else -1
+                prev[1:] = bar_ids[:-1]
+            # Block positions where an underlying tick opens a new candle
+            new_bar_pos = und_pos[bar_ids != prev]
+            cuts = [0] + new_bar_pos.tolist() + [len(block)]
+            for a, b in zip(cuts[:-1], cuts[1:]):
+                if a == b:
+                    continue
+                if cur is not None and sids[a] == und and ts_arr[a] // self.bar_ns != cur[0]:
+                    on_bar_close(int(ts_arr[a]))
+                    cur = None
+
+                if active:
+                    seg_sids = sids[a:b]
+                    idx = np.flatnonzero(np.isin(seg_sids, list(active))) + a
+                    for sid, ts, price, volume in zip(sids[idx].tolist(), ts_arr[idx].tolist(),
+                                                      px_arr[idx].tolist(), vol_arr[idx].tolist()):
+                        if fills.has_pending(sid):
+                            for order in fills.on_tick(sid, ts, price, volume):
+                                on_fill(order)
+                        if open_count[sid]:
+                            for pos_id, _, _ in stops.on_tick(symbols[sid], price):
+                                submit_exit(pos_id, ts)
+                        while hold_heap and hold_heap[0][0] <= ts:
+                            _, pos_id = heapq.heappop(hold_heap)
+                            if pos_id in positions:
+                                submit_exit(pos_id, ts)
+                    active = {sid for sid in active if fills.has_pending(sid) or open_count[sid]}
+
+                # Fold this segment's underlying ticks into the current candle
+                lo, hi = np.searchsorted(und_pos, [a, b])
+                if lo < hi:
+                    seg = und_pos[lo:hi]
+                    prices = px_arr[seg]
+                    volume = float(vol_arr[seg].sum())
+                    if cur is None:
+                        cur = [int(ts_arr[seg[0]] // self.bar_ns), float(prices[0]), float(prices.max()),
+                               float(prices.min()), float(prices[-1]), volume]
+                    else:
+                        cur[2] = max(cur[2], float(prices.max()))
+                        cur[3] = min(cur[3], float(prices.min()))
+                        cur[4] = float(prices[-1])
+                        cur[5] += volume
+
+            for sid in np.unique(sids).tolist():
+                last = np.flatnonzero(sids == sid)[-1]
+                last_price[sid] = (int(ts_arr[last]), float(px_arr[last]))
+
+        # Close what is still open at each instrument's last price
+        fills.cancel_all()
+        for pos_id in list(positions):
+            sid, qty, entry, _ = positions.pop(pos_id)
+            ts, price = last_price[sid]
+            exit_price = price * (1 - (1 if qty > 0 else -1) * fills.slippage)
+            stops.remove(pos_id)
+            self._book(ts, qty * (exit_price - entry))
+        if book is not None and self.option_model.n_bars:
+            for entry_ts, pnl in book.settle(self.option_model.n_bars - 1, force=True):
+                self._book(entry_ts, pnl)
+
+        elapsed = time.perf_counter() - began
+        self.stats = {"ticks": n_ticks, "bars": n_bars, "orders": fills.orders, "option_legs": n_option_legs,
+                      "rejected": n_rejected, "elapsed_s": round(elapsed, 3),
+                      "ticks_per_sec": round(n_ticks / elapsed) if elapsed else 0}
+        if self.logger:
+            self.logger.info(f"[TickBacktest] {self.stats}")
+            if n_rejected:
+                self.logger.warning(
+                    f"[TickBacktest] Rejected {n_rejected} signals on instruments with no ticks in the store "
+                    f"(pass an option_model to book CE/PE legs on synthetic premiums)"
+                )
+
+        if self.sink is not None:
+            self.sink.close()
+            summary = self.sink.summarize()
+            summary["result_dir"] = self.sink.out_dir
+            return summary
+        summary = BacktestAnalyzer(self.logger).summarize(pd.DataFrame(self.trades))
+        summary["equity_curve"] = self.equity_curve
+        return summary
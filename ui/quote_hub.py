@@ -0,0 +1,183 @@
+"""
+quote_hub.py
+Broadcast hub for live quotes to UI websocket clients.
+The hub takes quotes from one source (a shared LTP poll, or publish()/publish_threadsafe() from a
+feed) and fans them out to every connected client subscribed to the symbol. Each client keeps
+only the latest unsent quote per symbol, so a slow client gets conflated updates, its memory is
+bounded by its subscriptions, and it never delays the others; a client whose send stalls past
+send_timeout is dropped. flush_interval caps each client at one batch per interval, so a burst of
+ticks costs one send per client rather than one per tick.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+ALL = "*"
+
+class QuoteClient:
+    def __init__(self, client_id: int):
+        self.id = client_id
+        self.symbols: Set[str] = set()
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.closed = False
+        self.sent = 0
+        self.conflated = 0
+        self._event = asyncio.Event()
+
+    def offer(self, symbol: str, quote: Dict[str, Any]) -> None:
+        if symbol in self.pending:
+            self.conflated += 1
+        self.pending[symbol] = quote
+        self._event.set()
+
+    async def next_batch(self) -> List[Dict[str, Any]]:
+        """
+        Wait for at least one update, then take everything pending (latest quote per symbol).
+        """
+        while not self.pending and not self.closed:
+            self._event.clear()
+            await self._event.wait()
+        batch, self.pending = self.pending, {}
+        return list(batch.values())
+
+    def close(self) -> None:
+        self.closed = True
+        self._event.set()
+
+class QuoteHub:
+    def __init__(self, send_timeout: float = 5.0, flush_interval: float = 0.05, logger=None):
+        self.send_timeout = send_timeout
+        self.flush_interval = flush_interval
+        self.logger = logger
+        self.clients: Dict[int, QuoteClient] = {}
+        self._by_symbol: Dict[str, Set[QuoteClient]] = defaultdict(set)
+        self._next_id = 0
+        self._loop = None
+        self.last: Dict[str, Dict[str, Any]] = {}
+        self.published = 0
+
+    # ---- clients ---------------------------------------------------------------------
+
+    def connect(self, symbols: Optional[Iterable[str]] = None) -> QuoteClient:
+        """
+        Register a client for `symbols` (None: every symbol). Must run on the hub's event loop.
+        The latest known quote of each subscribed symbol is queued straight away.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._next_id += 1
+        client = QuoteClient(self._next_id)
+        self.clients[client.id] = client
+        self.subscribe(client, symbols if symbols is not None else [ALL])
+        return client
+
+    def subscribe(self, client: QuoteClient, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            client.symbols.add(symbol)
+            self._by_symbol[symbol].add(client)
+            for s, quote in (self.last.items() if symbol == ALL else [(symbol, self.last.get(symbol))]):
+                if quote is not None:
+                    client.offer(s, quote)
+
+    def unsubscribe(self, client: QuoteClient, symbols: Iterable[str]) -> None:
+        for symbol in symbols:
+            client.symbols.discard(symbol)
+            client.pending.pop(symbol, None)
+            subscribers = self._by_symbol.get(symbol)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self._by_symbol[symbol]
+
+    def disconnect(self, client: QuoteClient) -> None:
+        if self.clients.pop(client.id, None) is None:
+            return
+        self.unsubscribe(client, list(client.symbols))
+        client.close()
+
+    def symbols(self) -> Set[str]:
+        """
+        Every concretely subscribed symbol, i.e. what the source needs to fetch.
+        """
+        return {s for s in self._by_symbol if s != ALL}
+
+    # ---- quotes ----------------------------------------------------------------------
+
+    def publish(self, symbol: str, price: float, timestamp: Optional[float] = None, **fields) -> None:
+        """
+        Fan one quote out; O(subscribers of the symbol). Call on the hub's loop.
+        """
+        quote = {"symbol": symbol, "price": price, "timestamp": timestamp if timestamp is not None else time.time(), **fields}
+        self.last[symbol] = quote
+        self.published += 1
+        for client in self._by_symbol.get(symbol, ()):
+            client.offer(symbol, quote)
+        for client in self._by_symbol.get(ALL, ()):
+            client.offer(symbol, quote)
+
+    def publish_ltp(self, ltp: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Publish a Kite ltp()/quote() response: {symbol: {"last_price": ..., ...}}.
+        """
+        now = time.time()
+        for symbol, data in ltp.items():
+            self.publish(symbol, data.get("last_price"), now, instrument_token=data.get("instrument_token"))
+
+    def publish_threadsafe(self, symbol: str, price: float, timestamp: Optional[float] = None, **fields) -> None:
+        """
+        publish() from another thread (e.g. a ticker callback).
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(lambda: self.publish(symbol, price, timestamp, **fields))
+
+    # ---- delivery --------------------------------------------------------------------
+
+    async def serve(self, client: QuoteClient, send: Callable[[Dict[str, Any]], Awaitable]) -> None:
+        """
+        Deliver conflated batches to one client until it disconnects or stalls.
+        send receives {"quotes": [quote, ...]}.
+        """
+        try:
+            while not client.closed:
+                batch = await client.next_batch()
+                if not batch:
+                    continue
+                started = time.monotonic()
+                await asyncio.wait_for(send({"quotes": batch}), self.send_timeout)
+                client.sent += len(batch)
+                # Let updates pile up (and conflate) until the next flush
+                remaining = self.flush_interval - (time.monotonic() - started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+        except asyncio.TimeoutError:
+            if self.logger:
+                self.logger.warning(f"[QuoteHub] Client {client.id} stalled for {self.send_timeout}s; disconnecting.")
+        finally:
+            self.disconnect(client)
+
+    async def poll(self, fetch_ltp: Callable[[List[str]], Dict[str, Dict[str, Any]]], interval: float = 1.0) -> None:
+        """
+        Shared source: one fetch_ltp() call per interval for the union of client symbols, run in
+        a worker thread so a slow broker call never blocks the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            symbols = sorted(self.symbols())
+            if symbols:
+                try:
+                    self.publish_ltp(await loop.run_in_executor(None, fetch_ltp, symbols))
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"[QuoteHub] LTP poll failed: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "clients": len(self.clients),
+            "symbols": len(self.symbols()),
+            "published": self.published,
+            "sent": sum(c.sent for c in self.clients.values()),
+            "conflated": sum(c.conflated for c in self.clients.values()),
+            "max_pending": max((len(c.pending) for c in self.clients.values()), default=0),
+        }
@@ -3,14 +3,39 @@ server.py
 Interactive FastAPI server for UI control and monitoring.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, WebSocket
+import asyncio
+import contextlib
+import os
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from typing import List
-from edgeX.utils.logger import get_logger
+from typing import List, Optional
+from edgeX.utils.logger import get_logger, log_file_path
+from edgeX.utils.log_tail import LogTailer, tail_lines
+from edgeX.ui.quote_hub import QuoteHub
 
 app = FastAPI(title="EdgeX Trading Bot UI")
 logger = get_logger("EdgeXUI")
 security = HTTPBasic()
+# One follower of the log file shared by every /ws/logs client
+log_tailer = LogTailer(log_file_path(), logger=logger)
+# One LTP source fanned out to every /ws/live_quotes client
+quote_hub = QuoteHub(logger=logger)
+DEFAULT_QUOTE_SYMBOLS = ["NSE:NIFTY 50", "BSE:SENSEX"]
+_quote_poller = None
+
+def ensure_quote_poller(interval: float = 1.0):
+    """
+    Start the shared LTP poll on first use; the fetcher (and kiteconnect) load only then.
+    """
+    global _quote_poller
+    if _quote_poller is None or _quote_poller.done():
+        try:
+            from edgeX.data_ingestion.market_data import MarketDataFetcher
+            fetcher = MarketDataFetcher()
+        except Exception as e:
+            logger.error(f"[UI] Quote source unavailable: {e}", exc_info=True)
+            return
+        _quote_poller = asyncio.get_running_loop().create_task(quote_hub.poll(fetcher.fetch_ltp, interval))
 
 USERS = {"admin": "supersecret"}  # Extend with secure auth in production.
 
@@ -45,11 +70,14 @@ def get_latest_orders(auth: bool = Depends(authenticate)):
     return []
 
 @app.get("/logs", response_model=List[str])
-def get_logs(lines: int = 100, auth: bool = Depends(authenticate)):
+def get_logs(lines: int = 100, level: Optional[str] = None, logger_name: Optional[str] = None, auth: bool = Depends(authenticate)):
+    """
+    Last `lines` records, optionally at or above `level` and from `logger_name` (or its children).
+    """
     try:
-        with open("logs/edgex.log") as f:
-            log_data = f.readlines()[-lines:]
-        return log_data
+        return tail_lines(log_file_path(), lines, level=level, logger=logger_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[UI] Log fetch error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -66,49 +94,118 @@ def upload_config(file: UploadFile = File(...), auth: bool = Depends(authenticat
         logger.error(f"[UI] Config upload failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.websocket("/ws/logs")
+async def ws_logs(websocket: WebSocket, level: Optional[str] = None, logger_name: Optional[str] = None):
+    await websocket.accept()
+    try:
+        queue = log_tailer.subscribe(level=level, logger=logger_name)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+
+    async def wait_disconnect():
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    # A filtered stream can stay quiet for hours, so a close must not wait for the next line
+    watcher = asyncio.create_task(wait_disconnect())
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            await websocket.send_text(getter.result())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        log_tailer.unsubscribe(queue)
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+            await watcher
+
+def _symbol_list(value) -> List[str]:
+    """
+    Symbols from a client message; anything but a list of strings is ignored.
+    """
+    return [s for s in value if isinstance(s, str)] if isinstance(value, list) else []
+
 @app.websocket("/ws/live_quotes")
-async def ws_live_quotes(websocket: WebSocket):
+async def ws_live_quotes(websocket: WebSocket, symbols: Optional[str] = None):
+    """
+    Conflated live quotes. `symbols` is a comma-separated list (default: NIFTY 50 and SENSEX);
+    clients change it by sending {"subscribe": [...]} or {"unsubscribe": [...]}.
+    """
     await websocket.accept()
-    import asyncio
-    while True:
-        # Placeholder for live quote pushing, e.g. fetch from market data module
-        ltp = {"symbol": "NIFTY", "price": 23450.10, "timestamp": "2025-08-09T11:25:34"}
-        await websocket.send_json(ltp)
-        await asyncio.sleep(1)
-        import os
+    ensure_quote_poller()
+    client = quote_hub.connect(symbols.split(",") if symbols else DEFAULT_QUOTE_SYMBOLS)
+
+    async def receive_subscriptions():
+        try:
+            while True:
+                try:
+                    message = await websocket.receive_json()
+                except ValueError:
+                    continue  # not JSON
+                if not isinstance(message, dict):
+                    continue
+                quote_hub.subscribe(client, _symbol_list(message.get("subscribe")))
+                quote_hub.unsubscribe(client, _symbol_list(message.get("unsubscribe")))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            # Browser went away: end serve() even if nothing is being sent
+            quote_hub.disconnect(client)
+
+    receiver = asyncio.create_task(receive_subscriptions())
+    try:
+        await quote_hub.serve(client, websocket.send_json)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+            await receiver
+        quote_hub.disconnect(client)
+
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi import Query
 from edgeX.analytics.report_pipeline import ReportPipeline
-import pandas as pd
 
 reporter = ReportPipeline(logger=logger)
 
+def load_trade_log():
+    # pandas is imported on first analytics request, not at server start-up.
+    import pandas as pd
+    return pd.read_csv(os.path.join(reporter.base_dir, "trade_log.csv"))
+
 @app.get("/analytics/sharpe_by_month.png")
 def serve_sharpe_by_month():
     path = os.path.join(reporter.base_dir, "sharpe_by_month.png")
     # Assuming latest trades loaded from file
-    trades = pd.read_csv(os.path.join(reporter.base_dir, "trade_log.csv"))
+    trades = load_trade_log()
     reporter.plot_sharpe_by_month(trades)
     return FileResponse(path)
 
 @app.get("/analytics/win_loss_ratio.png")
 def serve_win_loss_ratio():
     path = os.path.join(reporter.base_dir, "win_loss_ratio.png")
-    trades = pd.read_csv(os.path.join(reporter.base_dir, "trade_log.csv"))
+    trades = load_trade_log()
     reporter.plot_win_loss_ratio_by_symbol(trades)
     return FileResponse(path)
 
 @app.get("/download/trades.xlsx")
 def download_trades_excel():
     path = os.path.join(reporter.base_dir, "trade_log.xlsx")
-    trades = pd.read_csv(os.path.join(reporter.base_dir, "trade_log.csv"))
+    trades = load_trade_log()
     reporter.export_trade_log_excel(trades)
     return FileResponse(path, media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", filename="trade_log.xlsx")
 
 @app.get("/download/trades.json")
 def download_trades_json():
     path = os.path.join(reporter.base_dir, "trade_log.json")
-    trades = pd.read_csv(os.path.join(reporter.base_dir, "trade_log.csv"))
+    trades = load_trade_log()
     reporter.export_trade_log_json(trades)
     return FileResponse(path, media_type="application/json", filename="trade_log.json")
 
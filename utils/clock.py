@@ -0,0 +1,106 @@
+"""
+clock.py
+Injectable time sources for the engine.
+SystemClock is the live default. VirtualClock drives replays: time only moves when the driving
+thread sleeps, either instantly (as fast as possible) or scaled by a speed factor, and other
+threads sleeping on it wake when virtual time reaches their deadline.
+"""
+
+import datetime as dt
+import threading
+import time
+from typing import Optional
+
+IST = dt.timezone(dt.timedelta(hours=5, minutes=30), "IST")
+
+class SystemClock:
+    def now(self) -> dt.datetime:
+        return dt.datetime.now(IST)
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        event.wait(timeout) measured on this clock.
+        """
+        return event.wait(timeout)
+
+class VirtualClock:
+    def __init__(self, start: dt.datetime, speed: Optional[float] = None, logger=None):
+        """
+        speed=None advances instantly on sleep; speed=100 runs 100x faster than wall time.
+        The thread that creates the clock drives it (see drive()).
+        """
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=IST)
+        self._epoch = start.timestamp()
+        self._elapsed = 0.0
+        self.speed = speed
+        self.logger = logger
+        self._cond = threading.Condition()
+        self._driver = threading.get_ident()
+        self._closed = False
+        self._wall_start = None
+
+    def drive(self) -> None:
+        """
+        Make the calling thread the one whose sleeps advance virtual time.
+        """
+        self._driver = threading.get_ident()
+
+    def now(self) -> dt.datetime:
+        return dt.datetime.fromtimestamp(self.time(), IST)
+
+    def time(self) -> float:
+        return self._epoch + self._elapsed
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def advance(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if self.speed:
+            # Pace against the wall-clock start so time spent in the engine is not added on top
+            if self._wall_start is None:
+                self._wall_start = time.monotonic() - self._elapsed / self.speed
+            delay = self._wall_start + (self._elapsed + seconds) / self.speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        with self._cond:
+            self._elapsed += seconds
+            self._cond.notify_all()
+
+    def sleep(self, seconds: float) -> None:
+        if threading.get_ident() == self._driver:
+            self.advance(seconds)
+            return
+        deadline = self._elapsed + seconds
+        with self._cond:
+            while self._elapsed < deadline and not self._closed:
+                self._cond.wait()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Returns early (True) only if the event is already set; otherwise the full timeout
+        elapses in virtual time, so replays stay deterministic.
+        """
+        if event.is_set():
+            return True
+        self.sleep(timeout)
+        return event.is_set()
+
+    def close(self) -> None:
+        """
+        Release every thread still sleeping on the clock.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,90 @@
+"""
+config_watcher.py
+Filesystem-notification based watcher for live config reloads.
+Uses watchdog (inotify/FSEvents/ReadDirectoryChanges) when installed and falls back
+to a lightweight mtime poller otherwise.
+"""
+
+import os
+import threading
+from typing import Callable, Iterable, Optional
+
+class ConfigWatcher:
+    def __init__(
+        self,
+        paths: Iterable[str],
+        callback: Callable[[str], None],
+        poll_interval: float = 0.25,
+        logger=None
+    ):
+        self.paths = {os.path.abspath(p) for p in paths}
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.logger = logger
+        self._observer = None
+        self._poll_thread = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            Observer = None
+
+        if Observer is not None:
+            watcher = self
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    if event.is_directory:
+                        return
+                    for path in (event.src_path, getattr(event, "dest_path", None)):
+                        if path and os.path.abspath(path) in watcher.paths:
+                            watcher._notify(os.path.abspath(path))
+
+            self._observer = Observer()
+            handler = _Handler()
+            for directory in {os.path.dirname(p) for p in self.paths}:
+                os.makedirs(directory, exist_ok=True)
+                self._observer.schedule(handler, directory, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+            if self.logger:
+                self.logger.info(f"[ConfigWatcher] Watching {sorted(self.paths)} via filesystem notifications.")
+        else:
+            self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self._poll_thread.start()
+            if self.logger:
+                self.logger.info(f"[ConfigWatcher] watchdog not installed; polling {sorted(self.paths)} every {self.poll_interval}s.")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+            self._observer = None
+
+    def _notify(self, path: str) -> None:
+        try:
+            self.callback(path)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"[ConfigWatcher] Callback failed for {path}: {e}", exc_info=True)
+
+    def _stat(self, path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _poll_loop(self) -> None:
+        last = {p: self._stat(p) for p in self.paths}
+        while not self._stop.wait(self.poll_interval):
+            for path in self.paths:
+                current = self._stat(path)
+                if current != last[path]:
+                    last[path] = current
+                    if current is not None:
+                        self._notify(path)
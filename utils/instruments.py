@@ -0,0 +1,27 @@
+"""
+instruments.py
+Trading symbol parsing shared by risk, pricing and mark-to-market code.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# NIFTY24500CE, NIFTY2581424500CE (weekly: YY M DD), NIFTY25AUG24500CE (monthly)
+_OPTION_RE = re.compile(r"^([A-Z&-]+?)(\d{2}[A-Z]{3}|\d{2}[1-9OND]\d{2})?(\d+(?:\.\d+)?)(CE|PE)$")
+_FUTURE_RE = re.compile(r"^([A-Z&-]+?)(\d{2}[A-Z]{3})FUT$")
+
+@lru_cache(maxsize=65536)
+def parse_instrument(symbol: str) -> Tuple[str, Optional[str], Optional[float], Optional[str]]:
+    """
+    Split a trading symbol into (underlying, expiry_code, strike, option_type).
+    Non-derivative symbols map to (symbol, None, None, None).
+    """
+    tradingsymbol = symbol.split(":", 1)[-1].replace(" ", "").upper()
+    m = _OPTION_RE.match(tradingsymbol)
+    if m:
+        return m.group(1), m.group(2), float(m.group(3)), m.group(4)
+    m = _FUTURE_RE.match(tradingsymbol)
+    if m:
+        return m.group(1), m.group(2), None, "FUT"
+    return tradingsymbol, None, None, None
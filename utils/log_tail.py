@@ -0,0 +1,187 @@
+"""
+log_tail.py
+Reading the engine log without rereading it.
+tail_lines() seeks backwards from the end of the file block by block until it has N matching
+lines, so its cost depends on N (and the filter's selectivity), not on the file size.
+LogTailer follows the file once for any number of listeners (e.g. dashboard websockets), handles
+rotation, and gives each listener a bounded queue so a slow one only loses its own oldest lines.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+BLOCK_SIZE = 64 * 1024
+# Plain-text records written before the JSON-lines format: "<asctime> [LEVEL] name: message"
+_TEXT_RE = re.compile(r"^\S+ \S+ \[(\w+)\] ([^:]+): ")
+
+def parse_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    {"level", "logger", ...} of a JSON-lines record (or of the older text format), else None.
+    """
+    if line.startswith("{"):
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+    m = _TEXT_RE.match(line)
+    if m:
+        return {"level": m.group(1), "logger": m.group(2), "msg": line[m.end():]}
+    return None
+
+class LineFilter:
+    """
+    Minimum level and/or logger name prefix ("edgeX.data_ingestion" matches its children).
+    """
+
+    def __init__(self, level: Optional[str] = None, logger: Optional[str] = None):
+        self.min_level = logging.getLevelName(level.upper()) if level else None
+        if self.min_level is not None and not isinstance(self.min_level, int):
+            raise ValueError(f"Unknown log level '{level}'")
+        self.logger = logger
+
+    def __bool__(self) -> bool:
+        return self.min_level is not None or bool(self.logger)
+
+    def match(self, line: str, record: Optional[Dict[str, Any]] = None) -> bool:
+        if not self:
+            return True
+        record = record if record is not None else parse_line(line)
+        if record is None:
+            return False
+        if self.min_level is not None:
+            level = logging.getLevelName(str(record.get("level", "")))
+            if not isinstance(level, int) or level < self.min_level:
+                return False
+        if self.logger:
+            name = str(record.get("logger", ""))
+            if name != self.logger and not name.startswith(self.logger + "."):
+                return False
+        return True
+
+def tail_lines(
+    path: str,
+    n: int = 100,
+    level: Optional[str] = None,
+    logger: Optional[str] = None,
+    block_size: int = BLOCK_SIZE
+) -> List[str]:
+    """
+    Last n lines of `path` matching the filter, oldest first.
+    """
+    line_filter = LineFilter(level, logger)
+    if n <= 0:
+        return []
+    found: List[str] = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0 and len(found) < n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + tail
+            lines = chunk.split(b"\n")
+            # The first piece may be cut mid-line; keep it for the next (earlier) block
+            tail = lines[0] if pos > 0 else b""
+            for raw in reversed(lines[1:] if pos > 0 else lines):
+                if not raw:
+                    continue
+                line = raw.decode("utf-8", errors="replace")
+                if line_filter.match(line):
+                    found.append(line)
+                    if len(found) == n:
+                        break
+    found.reverse()
+    return found
+
+class LogTailer:
+    """
+    Shared follower of one log file for asyncio consumers:
+        sub = tailer.subscribe(level="WARNING")
+        line = await sub.get()
+        ...
+        tailer.unsubscribe(sub)
+    The polling task runs only while someone is subscribed.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.25, queue_size: int = 1000, logger=None):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.logger = logger
+        self._subscribers: Dict[asyncio.Queue, LineFilter] = {}
+        self._task = None
+        self._inode = None
+        self._offset = 0
+        self._partial = b""
+        self.dropped = 0
+
+    def subscribe(self, level: Optional[str] = None, logger: Optional[str] = None) -> asyncio.Queue:
+        queue = asyncio.Queue(self.queue_size)
+        self._subscribers[queue] = LineFilter(level, logger)
+        if self._task is None or self._task.done():
+            self._seek_end()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.pop(queue, None)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _seek_end(self) -> None:
+        try:
+            st = os.stat(self.path)
+            self._inode, self._offset = st.st_ino, st.st_size
+        except FileNotFoundError:
+            self._inode, self._offset = None, 0
+        self._partial = b""
+
+    def _read_new(self) -> List[str]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # Rotated or truncated: the current file is new, read it from the start
+            self._inode, self._offset, self._partial = st.st_ino, 0, b""
+        if st.st_size == self._offset:
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(st.st_size - self._offset)
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        return [line.decode("utf-8", errors="replace") for line in lines if line]
+
+    def publish(self, lines: List[str]) -> None:
+        subscribers = list(self._subscribers.items())
+        # Parse each line once, and only if some listener filters
+        records = [parse_line(line) for line in lines] if any(f for _, f in subscribers) else [None] * len(lines)
+        for queue, line_filter in subscribers:
+            for line, record in zip(lines, records):
+                if not line_filter.match(line, record):
+                    continue
+                if queue.full():
+                    # Slow consumer: drop its oldest line rather than stall the others
+                    queue.get_nowait()
+                    self.dropped += 1
+                queue.put_nowait(line)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                lines = self._read_new()
+            except OSError as e:
+                lines = []
+                if self.logger:
+                    self.logger.warning(f"[LogTailer] Reading {self.path} failed: {e}")
+            if lines:
+                self.publish(lines)
+            await asyncio.sleep(self.poll_interval)
@@ -1,30 +1,178 @@
+"""
+logger.py
+Asynchronous structured logging for EdgeX.
+get_logger() attaches a single non-blocking queue handler to each logger; one background listener
+thread formats records and writes them to the console and to a size-rotated JSON-lines file.
+Records cross the queue unformatted, so message %-interpolation and reprs of the arguments run on
+the writer thread. A per-message rate limit drops floods of the same DEBUG/INFO message and
+reports how many were suppressed.
+"""
+
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 
-def get_logger(name: str):
+LOG_DIR = "logs"
+LOG_FILE = "edgex.log"
+MAX_BYTES = 50 * 1024 * 1024
+BACKUP_COUNT = 5
+QUEUE_SIZE = 100_000
+RATE_PER_SEC = 20.0
+RATE_BURST = 50
+RATE_MAX_KEYS = 10_000
+
+_settings = {
+    "log_dir": LOG_DIR,
+    "max_bytes": MAX_BYTES,
+    "backup_count": BACKUP_COUNT,
+    "console_level": logging.INFO,
+    "rate_per_sec": RATE_PER_SEC,
+    "burst": RATE_BURST,
+}
+_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+class JsonFormatter(logging.Formatter):
     """
-    Returns a configured logger instance.
+    One JSON object per line: ts, level, logger, msg, thread, plus exc and suppressed when present.
     """
-    log_dir = "logs"
-    os.makedirs(log_dir, exist_ok=True)
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        return json.dumps(entry, default=str)
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per call site (logger, file, line) for records below WARNING, so f-string
+    messages share a bucket too. Dropped records are counted and the count rides along on the
+    next record let through. Buckets that have refilled are evicted once more than max_keys exist.
+    """
 
-    # Console handler
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
+    def __init__(self, rate_per_sec: float = RATE_PER_SEC, burst: int = RATE_BURST, max_keys: int = RATE_MAX_KEYS):
+        super().__init__()
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets = {}
 
-    # File handler
-    fh = logging.FileHandler(os.path.join(log_dir, "edgex.log"))
-    fh.setLevel(logging.DEBUG)
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self.rate or record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        now = record.created
+        bucket = self._buckets.get(key)
+        if bucket is None and len(self._buckets) >= self.max_keys:
+            self._evict(now)
+        tokens, last, dropped = bucket or (self.burst, now, 0)
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now, dropped + 1)
+            return False
+        record.suppressed = dropped
+        self._buckets[key] = (tokens - 1, now, 0)
+        return True
 
-    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
-    ch.setFormatter(formatter)
-    fh.setFormatter(formatter)
+    def _evict(self, now: float) -> None:
+        # A full bucket with nothing suppressed is the same as no bucket
+        idle = (self.burst - 1) / self.rate
+        self._buckets = {k: b for k, b in self._buckets.items() if b[2] or now - b[1] < idle}
+        if len(self._buckets) >= self.max_keys:
+            # Still full of active sites: keep the most recently used half
+            recent = sorted(self._buckets.items(), key=lambda kb: kb[1][1])[len(self._buckets) // 2:]
+            self._buckets = dict(recent)
 
-    if not logger.handlers:
-        logger.addHandler(ch)
-        logger.addHandler(fh)
+class _AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records as they are, leaving formatting to the listener thread, and never blocks:
+    when the queue is full the record is dropped and counted.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
+def configure_logging(**settings) -> None:
+    """
+    Override log_dir, max_bytes, backup_count, console_level, rate_per_sec or burst.
+    Must run before the first get_logger() call to take effect.
+    """
+    unknown = set(settings) - set(_settings)
+    if unknown:
+        raise ValueError(f"Unknown logging settings: {sorted(unknown)}")
+    _settings.update(settings)
+
+def log_file_path() -> str:
+    return os.path.join(_settings["log_dir"], LOG_FILE)
+
+def _start() -> logging.Handler:
+    global _queue_handler, _listener
+    with _lock:
+        if _queue_handler is None:
+            os.makedirs(_settings["log_dir"], exist_ok=True)
+            console = logging.StreamHandler()
+            console.setLevel(_settings["console_level"])
+            console.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
+            file = logging.handlers.RotatingFileHandler(
+                log_file_path(), maxBytes=_settings["max_bytes"], backupCount=_settings["backup_count"]
+            )
+            file.setLevel(logging.DEBUG)
+            file.setFormatter(JsonFormatter())
+
+            log_queue = queue.Queue(QUEUE_SIZE)
+            handler = _AsyncQueueHandler(log_queue)
+            handler.addFilter(RateLimitFilter(_settings["rate_per_sec"], _settings["burst"]))
+            _listener = logging.handlers.QueueListener(log_queue, console, file, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+            _queue_handler = handler
+    return _queue_handler
+
+def shutdown_logging() -> None:
+    """
+    Flush everything queued and stop the writer thread (also runs at exit).
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+def get_logger(name: str):
+    """
+    Returns a configured logger instance.
+    Prefer lazy arguments on hot paths, logger.info("Signals: %s", signals): the string is then
+    only built on the writer thread (pass values that will not be mutated afterwards).
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    if not logger.handlers:
+        logger.addHandler(_start())
     return logger